@@ -14,17 +14,19 @@ from __future__ import annotations
 import pathlib
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from email.utils import formatdate
 
 import structlog
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from slowapi.errors import RateLimitExceeded
-from starlette.responses import FileResponse, JSONResponse
+from starlette.responses import FileResponse, HTMLResponse, JSONResponse
 
 from sna.api.error_handlers import register_error_handlers
 from sna.api.rate_limit import limiter
 from sna.api.routes import agents, audit, batch, devices, eas, escalation, evaluate, executions, health, inventory, metrics, policy, reports, timeline
+from sna.api.security_headers import SecurityHeadersMiddleware
 from sna.observability.correlation import CorrelationMiddleware
 from sna.config import Settings
 from sna.db.models import Base
@@ -43,6 +45,25 @@ from sna.validation.rules import ValidationEngine
 logger = structlog.get_logger()
 
 
+def _read_if_changed(
+    path: pathlib.Path, cache: dict[pathlib.Path, tuple[int, bytes]],
+) -> tuple[int, bytes] | None:
+    """Return (mtime_ns, bytes), re-reading only when the mtime changes.
+
+    None if the file is missing, unreadable or not a regular file, including
+    when it disappears between the stat and the read.
+    """
+    try:
+        mtime = path.stat().st_mtime_ns
+        cached = cache.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, path.read_bytes())
+            cache[path] = cached
+    except OSError:
+        return None
+    return cached
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan — startup and shutdown logic.
@@ -228,17 +249,20 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     async def limit_request_body(request: Request, call_next: object) -> Response:
         content_length = request.headers.get("content-length")
         if content_length:
-            try:
-                if int(content_length) > max_body:
-                    return JSONResponse(
-                        status_code=413,
-                        content={"detail": "Request body too large"},
-                    )
-            except ValueError:
+            # Plain ASCII digits only: int() would also take "+1", " 1",
+            # "1_000" and non-ASCII digits, and raising costs more than checking
+            if not (content_length.isascii() and content_length.isdigit()):
                 return JSONResponse(
                     status_code=400,
                     content={"detail": "Invalid Content-Length header"},
                 )
+            # Anything longer than an int64 is too large, and int() refuses
+            # strings past sys.get_int_max_str_digits() anyway
+            if len(content_length) > 19 or int(content_length) > max_body:
+                return JSONResponse(
+                    status_code=413,
+                    content={"detail": "Request body too large"},
+                )
         response = await call_next(request)  # type: ignore[operator]
         return response
 
@@ -262,38 +286,28 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     register_error_handlers(app)
 
     # --- Security headers ---
-    @app.middleware("http")
-    async def add_security_headers(request: Request, call_next: object) -> Response:
-        response = await call_next(request)  # type: ignore[operator]
-
-        # Unconditional security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Referrer-Policy"] = "no-referrer"
-        response.headers["Strict-Transport-Security"] = "max-age=63072000; includeSubDomains"
-
-        # CSP: dashboard gets 'self' policy, API routes get restrictive policy
-        if request.url.path.startswith("/dashboard") or request.url.path == "/":
-            response.headers["Content-Security-Policy"] = (
-                "default-src 'self'; script-src 'self'; style-src 'self' 'unsafe-inline'"
-            )
-        else:
-            response.headers["Content-Security-Policy"] = "default-src 'none'"
-
-        return response
+    app.add_middleware(SecurityHeadersMiddleware)
 
     # --- Dashboard static files ---
     if settings.dashboard_enabled:
         dashboard_path = pathlib.Path(settings.dashboard_static_path).resolve()
         if dashboard_path.is_dir():
+            index_path = dashboard_path / "index.html"
+            index_cache: dict[pathlib.Path, tuple[int, bytes]] = {}
+
             @app.get("/dashboard/{rest_of_path:path}")
             async def serve_dashboard(rest_of_path: str) -> Response:
                 """Serve dashboard static files with path traversal protection."""
-                # Serve index.html for SPA routes (no extension)
+                # Serve index.html for SPA routes (no extension). Every client
+                # route hits this, so keep it in memory until the file changes.
                 if not rest_of_path or "." not in rest_of_path.split("/")[-1]:
-                    index = dashboard_path / "index.html"
-                    if index.is_file():
-                        return FileResponse(str(index))
+                    index = _read_if_changed(index_path, index_cache)
+                    if index is not None:
+                        mtime_ns, content = index
+                        return HTMLResponse(
+                            content,
+                            headers={"Last-Modified": formatdate(mtime_ns / 1e9, usegmt=True)},
+                        )
                     return JSONResponse({"detail": "Dashboard not built"}, status_code=404)
 
                 # Resolve and validate path
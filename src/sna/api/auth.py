@@ -4,7 +4,8 @@ Two-tier authentication:
 1. Global keys: SNA_API_KEY (standard) and SNA_ADMIN_API_KEY (elevated)
    - Compared with secrets.compare_digest() (timing-safe)
 2. Per-agent keys: bcrypt-hashed keys in the Agent table
-   - Verified with bcrypt.checkpw() (constant-time)
+   - Verified with bcrypt.checkpw() (constant-time); successful
+     verifications are memoized per (key digest, hash)
 
 Global key requests have no agent identity.
 Agent key requests attach agent identity to request.state.agent.
@@ -12,7 +13,9 @@ Agent key requests attach agent identity to request.state.agent.
 
 from __future__ import annotations
 
+import hashlib
 import secrets
+from collections import OrderedDict
 
 import bcrypt
 import structlog
@@ -27,6 +30,27 @@ logger = structlog.get_logger()
 
 bearer_scheme = HTTPBearer(auto_error=False)
 
+# (sha256(key), bcrypt hash) pairs already verified by bcrypt.checkpw().
+# The result is a pure function of the pair, so it never goes stale:
+# revocation replaces the hash and status is re-read from the DB on
+# every request. Plaintext keys are never stored.
+_MAX_VERIFIED_AGENT_KEYS = 1024
+_verified_agent_keys: OrderedDict[tuple[bytes, str], None] = OrderedDict()
+
+
+def _agent_key_matches(token: str, token_digest: bytes, key_hash: str) -> bool:
+    """bcrypt-verify token against key_hash, memoizing successful matches."""
+    entry = (token_digest, key_hash)
+    if entry in _verified_agent_keys:
+        _verified_agent_keys.move_to_end(entry)
+        return True
+    if not bcrypt.checkpw(token.encode(), key_hash.encode()):
+        return False
+    _verified_agent_keys[entry] = None
+    if len(_verified_agent_keys) > _MAX_VERIFIED_AGENT_KEYS:
+        _verified_agent_keys.popitem(last=False)
+    return True
+
 
 async def _try_agent_auth(
     request: Request, token: str
@@ -63,11 +87,12 @@ async def _try_agent_auth(
             )
             agents = list(result.scalars().all())
 
+    token_digest = hashlib.sha256(token.encode()).digest()
     for agent in agents:
         if agent.api_key_hash == "REVOKED":
             continue
         try:
-            if bcrypt.checkpw(token.encode(), agent.api_key_hash.encode()):
+            if _agent_key_matches(token, token_digest, agent.api_key_hash):
                 if agent.status == AgentStatus.SUSPENDED.value:
                     raise HTTPException(
                         status_code=status.HTTP_403_FORBIDDEN,
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Request
-from sqlalchemy import func, select
+import base64
+import binascii
+from datetime import UTC, datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from sna.api.auth import require_api_key
@@ -14,30 +18,70 @@ from sna.db.models import AuditLog
 router = APIRouter()
 
 
+def _encode_cursor(record: AuditLog) -> str:
+    raw = f"{record.timestamp.isoformat()}|{record.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode an opaque audit cursor into (timestamp, id). Raises ValueError."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError) as exc:
+        raise ValueError("malformed cursor") from exc
+    timestamp, _, record_id = raw.rpartition("|")
+    after_id = int(record_id)
+    # Must fit a signed 64-bit primary key; the driver raises on anything larger
+    if not 1 <= after_id < 2**63:
+        raise ValueError("cursor id out of range")
+    after_timestamp = datetime.fromisoformat(timestamp)
+    # Timestamps are written in UTC (SQLite hands them back naive). Compare
+    # the same instant whatever offset the client sent.
+    if after_timestamp.tzinfo is None:
+        after_timestamp = after_timestamp.replace(tzinfo=UTC)
+    else:
+        after_timestamp = after_timestamp.astimezone(UTC)
+    return after_timestamp, after_id
+
+
 @router.get("/audit", response_model=PaginatedResponse[AuditEntryResponse])
 async def list_audit_log(
     request: Request,
     page: int = 1,
     page_size: int = 50,
+    cursor: str | None = None,
     _api_key: str = Depends(require_api_key),
     session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
 ) -> PaginatedResponse[AuditEntryResponse]:
-    """Retrieve the paginated audit log. Most recent entries first."""
+    """Retrieve the paginated audit log. Most recent entries first.
+
+    Pass the previous response's next_cursor as ``cursor`` to page with a
+    keyset seek instead of OFFSET; ``page`` is then ignored.
+    """
     params = PaginationParams(page=page, page_size=page_size)
 
+    query = select(AuditLog).order_by(AuditLog.timestamp.desc(), AuditLog.id.desc())
+    if cursor is not None:
+        try:
+            after_timestamp, after_id = _decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor",
+            ) from None
+        query = query.where(or_(
+            AuditLog.timestamp < after_timestamp,
+            and_(AuditLog.timestamp == after_timestamp, AuditLog.id < after_id),
+        ))
+    else:
+        query = query.offset((params.page - 1) * params.page_size)
+
     async with session_factory() as session:
         count_result = await session.execute(
             select(func.count(AuditLog.id))
         )
         total = count_result.scalar() or 0
 
-        offset = (params.page - 1) * params.page_size
-        result = await session.execute(
-            select(AuditLog)
-            .order_by(AuditLog.timestamp.desc())
-            .offset(offset)
-            .limit(params.page_size)
-        )
+        result = await session.execute(query.limit(params.page_size))
         records = result.scalars().all()
 
     items = [
@@ -64,4 +108,5 @@ async def list_audit_log(
         total=total,
         page=params.page,
         page_size=params.page_size,
+        next_cursor=_encode_cursor(records[-1]) if len(records) == params.page_size else None,
     )
@@ -7,18 +7,20 @@ and ORM models (db/models.py). They define what the API accepts and returns.
 from __future__ import annotations
 
 import math
+import re
 from datetime import datetime
 from typing import Generic, TypeVar
 from uuid import UUID
 
-import re
-
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from sna.policy.models import RiskTier, Verdict
 
 T = TypeVar("T")
 
+# Matched with fullmatch(): "$" would also accept a trailing newline
+_DEVICE_TARGET_RE = re.compile(r"[a-zA-Z0-9._-]{1,255}", re.ASCII)
+
 
 # --- Pagination ---
 
@@ -38,9 +40,17 @@ class PaginatedResponse(BaseModel, Generic[T]):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None  # keyset cursor for endpoints that support it
 
     @classmethod
-    def create(cls, items: list[T], total: int, page: int, page_size: int) -> PaginatedResponse[T]:
+    def create(
+        cls,
+        items: list[T],
+        total: int,
+        page: int,
+        page_size: int,
+        next_cursor: str | None = None,
+    ) -> PaginatedResponse[T]:
         """Build a paginated response from items and counts."""
         return cls(
             items=items,
@@ -48,6 +58,7 @@ class PaginatedResponse(BaseModel, Generic[T]):
             page=page,
             page_size=page_size,
             total_pages=max(1, math.ceil(total / page_size)),
+            next_cursor=next_cursor,
         )
 
 
@@ -69,9 +80,8 @@ class EvaluateRequest(BaseModel):
     @classmethod
     def validate_device_targets(cls, v: list[str]) -> list[str]:
         """Each device target must contain only safe characters."""
-        pattern = re.compile(r"^[a-zA-Z0-9._-]{1,255}$")
         for target in v:
-            if not pattern.match(target):
+            if not _DEVICE_TARGET_RE.fullmatch(target):
                 raise ValueError(
                     f"Invalid device target '{target}': must match [a-zA-Z0-9._-]{{1,255}}"
                 )
@@ -0,0 +1,29 @@
+"""phase7_audit_log_keyset_index
+
+Replaces the single-column audit_log timestamp index with (timestamp, id)
+to back newest-first keyset pagination on GET /audit.
+
+Revision ID: c7d9e1f3a5b7
+Revises: b6c8d0e2f4g6
+Create Date: 2026-10-17 10:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d9e1f3a5b7'
+down_revision: str | None = 'b6c8d0e2f4g6'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_audit_log_timestamp_id', 'audit_log', ['timestamp', 'id'], unique=False)
+    op.drop_index('ix_audit_log_timestamp', table_name='audit_log')
+
+
+def downgrade() -> None:
+    op.create_index('ix_audit_log_timestamp', 'audit_log', ['timestamp'], unique=False)
+    op.drop_index('ix_audit_log_timestamp_id', table_name='audit_log')
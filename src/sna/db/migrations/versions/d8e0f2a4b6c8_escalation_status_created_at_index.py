@@ -0,0 +1,33 @@
+"""phase7_escalation_status_created_at_index
+
+Replaces the single-column escalation_record status index with
+(status, created_at) so the pending queue, filtered by status and ordered
+newest-first, is read straight from the index without a sort.
+
+Revision ID: d8e0f2a4b6c8
+Revises: c7d9e1f3a5b7
+Create Date: 2026-10-17 12:00:00.000000
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e0f2a4b6c8'
+down_revision: str | None = 'c7d9e1f3a5b7'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_escalation_status_created_at', 'escalation_record',
+        ['status', 'created_at'], unique=False,
+    )
+    op.drop_index('ix_escalation_status', table_name='escalation_record')
+
+
+def downgrade() -> None:
+    op.create_index('ix_escalation_status', 'escalation_record', ['status'], unique=False)
+    op.drop_index('ix_escalation_status_created_at', table_name='escalation_record')
@@ -1,6 +1,7 @@
 """ORM models — Agent, AuditLog, EscalationRecord, EASHistory, ExecutionLog.
 
-All API-facing identifiers use UUID4 to prevent enumeration.
+All API-facing identifiers are UUIDv7 — time-ordered for index locality,
+with enough random bits to prevent enumeration.
 AuditLog is append-only — no update or delete operations.
 All timestamps are UTC.
 """
@@ -9,11 +10,12 @@ from __future__ import annotations
 
 import enum
 from datetime import UTC, datetime
-from uuid import uuid4
 
 from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
+from sna.utils.ids import new_external_id
+
 
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
@@ -45,7 +47,7 @@ class Agent(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     external_id: Mapped[str] = mapped_column(
-        String(36), unique=True, nullable=False, default=lambda: str(uuid4())
+        String(36), unique=True, nullable=False, default=new_external_id
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
     description: Mapped[str] = mapped_column(Text, nullable=False, default="")
@@ -83,7 +85,7 @@ class AuditLog(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     external_id: Mapped[str] = mapped_column(
-        String(36), unique=True, nullable=False, default=lambda: str(uuid4())
+        String(36), unique=True, nullable=False, default=new_external_id
     )
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
@@ -120,7 +122,8 @@ class AuditLog(Base):
     )
 
     __table_args__ = (
-        Index("ix_audit_log_timestamp", "timestamp"),
+        # (timestamp, id) serves newest-first ordering and keyset pagination
+        Index("ix_audit_log_timestamp_id", "timestamp", "id"),
         Index("ix_audit_log_verdict", "verdict"),
         Index("ix_audit_log_tool_name", "tool_name"),
     )
@@ -143,7 +146,7 @@ class EscalationRecord(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     external_id: Mapped[str] = mapped_column(
-        String(36), unique=True, nullable=False, default=lambda: str(uuid4())
+        String(36), unique=True, nullable=False, default=new_external_id
     )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
@@ -180,7 +183,8 @@ class EscalationRecord(Base):
     )
 
     __table_args__ = (
-        Index("ix_escalation_status", "status"),
+        # Serves status filters and the pending queue's newest-first ordering
+        Index("ix_escalation_status_created_at", "status", "created_at"),
         Index("ix_escalation_created_at", "created_at"),
     )
 
@@ -202,7 +206,7 @@ class EASHistory(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     external_id: Mapped[str] = mapped_column(
-        String(36), unique=True, nullable=False, default=lambda: str(uuid4())
+        String(36), unique=True, nullable=False, default=new_external_id
     )
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
@@ -241,7 +245,7 @@ class AgentPolicyOverride(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     external_id: Mapped[str] = mapped_column(
-        String(36), unique=True, nullable=False, default=lambda: str(uuid4())
+        String(36), unique=True, nullable=False, default=new_external_id
     )
     agent_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("agent.id"), nullable=False
@@ -279,7 +283,7 @@ class PolicyVersion(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     external_id: Mapped[str] = mapped_column(
-        String(36), unique=True, nullable=False, default=lambda: str(uuid4())
+        String(36), unique=True, nullable=False, default=new_external_id
     )
     version_string: Mapped[str] = mapped_column(String(255), nullable=False)
     policy_yaml: Mapped[str] = mapped_column(Text, nullable=False)
@@ -309,7 +313,7 @@ class ExecutionLog(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     external_id: Mapped[str] = mapped_column(
-        String(36), unique=True, nullable=False, default=lambda: str(uuid4())
+        String(36), unique=True, nullable=False, default=new_external_id
     )
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
@@ -364,7 +368,7 @@ class ValidationLog(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     external_id: Mapped[str] = mapped_column(
-        String(36), unique=True, nullable=False, default=lambda: str(uuid4())
+        String(36), unique=True, nullable=False, default=new_external_id
     )
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
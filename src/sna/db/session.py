@@ -8,6 +8,8 @@ Provides:
 
 from __future__ import annotations
 
+import functools
+import json
 from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import (
@@ -17,6 +19,10 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+# JSON columns (audit parameters, device targets, ...) are written on every
+# decision; drop the default ", " / ": " padding from the stored text
+_json_serializer = functools.partial(json.dumps, separators=(",", ":"))
+
 
 def create_async_engine_from_url(
     database_url: str,
@@ -36,7 +42,7 @@ def create_async_engine_from_url(
     Returns:
         A configured AsyncEngine instance.
     """
-    kwargs: dict[str, object] = {"echo": echo}
+    kwargs: dict[str, object] = {"echo": echo, "json_serializer": _json_serializer}
 
     # Dialect-based pool configuration (not string matching)
     from sqlalchemy import make_url
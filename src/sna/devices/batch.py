@@ -147,18 +147,21 @@ class BatchExecutor:
                 return_exceptions=True,
             )
 
-            for item, result in zip(executable, stage_results):
+            for item, result in zip(executable, stage_results, strict=True):
                 if isinstance(result, Exception):
-                    device_result = DeviceBatchResult(
+                    result = DeviceBatchResult(
                         device=item.device_target,
                         error=str(result),
                     )
-                    all_results[item.device_target] = device_result
+                all_results[item.device_target] = result
+
+            # Validate the stage's writes before later stages depend on them
+            await self._validate_stage(executable, all_results)
+
+            for item in executable:
+                result = all_results[item.device_target]
+                if result.error or (result.execution_result and not result.execution_result.success):
                     failed_devices.add(item.device_target)
-                else:
-                    all_results[item.device_target] = result
-                    if result.error or (result.execution_result and not result.execution_result.success):
-                        failed_devices.add(item.device_target)
 
         # Handle cascade rollback
         if rollback_on_failure and failed_devices:
@@ -193,7 +196,7 @@ class BatchExecutor:
         evaluation_result: EvaluationResult,
         batch_id: str,
     ) -> DeviceBatchResult:
-        """Execute a single batch item."""
+        """Execute a single batch item. Validation runs per stage afterwards."""
         try:
             exec_result = await self._executor.execute(
                 tool_name=item.tool_name,
@@ -203,28 +206,10 @@ class BatchExecutor:
                 platform=item.platform,
             )
 
-            validation_results: list[ValidationResult] = []
-            if (
-                self._validation_engine
-                and exec_result.success
-                and item.tool_name in WRITE_TOOLS
-            ):
-                validation_results = await self._validation_engine.run_validations(
-                    item.tool_name,
-                    item.device_target,
-                    before_state={"running_config": exec_result.rollback_data or ""},
-                    after_state={"running_config": exec_result.output},
-                )
-
-            error = exec_result.error
-            if self._validation_engine and self._validation_engine.has_failures(validation_results):
-                error = error or "Validation failed"
-
             return DeviceBatchResult(
                 device=item.device_target,
                 execution_result=exec_result,
-                validation_results=validation_results,
-                error=error,
+                error=exec_result.error,
             )
 
         except Exception as exc:
@@ -239,6 +224,48 @@ class BatchExecutor:
                 error=str(exc),
             )
 
+    async def _validate_stage(
+        self,
+        items: list[BatchItem],
+        results: dict[str, DeviceBatchResult],
+    ) -> None:
+        """Validate a stage's successful writes, one engine batch per tool."""
+        if self._validation_engine is None:
+            return
+        engine = self._validation_engine
+
+        targets_by_tool: dict[str, list[tuple[str, dict | None, dict | None]]] = {}
+        for item in items:
+            exec_result = results[item.device_target].execution_result
+            if exec_result is None or not exec_result.success or item.tool_name not in WRITE_TOOLS:
+                continue
+            targets_by_tool.setdefault(item.tool_name, []).append((
+                item.device_target,
+                {"running_config": exec_result.rollback_data or ""},
+                {"running_config": exec_result.output},
+            ))
+
+        async def validate_tool(
+            tool_name: str, targets: list[tuple[str, dict | None, dict | None]],
+        ) -> None:
+            try:
+                per_device = await engine.run_validations_batch(tool_name, targets)
+            except Exception as exc:
+                await logger.aerror("batch_validation_failed", tool=tool_name, error=str(exc))
+                for device, _, _ in targets:
+                    results[device].error = results[device].error or str(exc)
+                return
+
+            for device, validation_results in per_device.items():
+                result = results[device]
+                result.validation_results = validation_results
+                if engine.has_failures(validation_results):
+                    result.error = result.error or "Validation failed"
+
+        await asyncio.gather(*(
+            validate_tool(tool_name, targets) for tool_name, targets in targets_by_tool.items()
+        ))
+
     async def _cascade_rollback(
         self,
         items: list[BatchItem],
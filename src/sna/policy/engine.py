@@ -10,8 +10,6 @@ to BLOCK. The engine never permits an action it cannot log.
 
 from __future__ import annotations
 
-from uuid import uuid4
-
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -36,6 +34,7 @@ from sna.policy.taxonomy import (
     is_hard_blocked,
 )
 from sna.integrations.netbox import NetBoxClient
+from sna.utils.ids import new_external_id
 
 logger = structlog.get_logger()
 
@@ -313,11 +312,12 @@ class PolicyEngine:
                         agent_id=request.agent_id,
                     )
                     session.add(audit_entry)
-                    await session.flush()
 
-                    # Create escalation record if verdict is ESCALATE
+                    # Create escalation record if verdict is ESCALATE. Both rows
+                    # are inserted at commit, still inside the try, so a failed
+                    # write blocks the action; no intermediate flush is needed.
                     if verdict == Verdict.ESCALATE:
-                        escalation_ext_id = str(uuid4())
+                        escalation_ext_id = new_external_id()
                         escalation = EscalationRecord(
                             external_id=escalation_ext_id,
                             tool_name=request.tool_name,
@@ -328,11 +328,10 @@ class PolicyEngine:
                             device_targets=request.device_targets if request.device_targets else None,
                             device_count=device_count,
                             requires_senior_approval=requires_senior_approval,
-                            audit_log_id=audit_entry.id,
+                            audit_log=audit_entry,
                         )
                         session.add(escalation)
-                        await session.flush()
-                        escalation_id = escalation.external_id
+                        escalation_id = escalation_ext_id
 
             await logger.ainfo(
                 "policy_decision",
@@ -240,7 +240,9 @@ class EvaluationRequest(BaseModel):
 
 
 class EvaluationResult(BaseModel):
-    """Output from the Policy Engine evaluate() method."""
+    """Output from the Policy Engine evaluate() method. Immutable once built."""
+
+    model_config = ConfigDict(frozen=True)
 
     verdict: Verdict
     risk_tier: RiskTier
@@ -0,0 +1,243 @@
+"""Byte-level scanner for 'show ip route' output — optional Numba acceleration.
+
+Large routing tables (10k+ lines) make parse_routing_table regex-bound.
+When Numba is installed, this module compiles a single-pass state machine
+over the raw bytes that returns the offsets of each route's fields.
+parsers.parse_routing_table slices the original text at those offsets.
+
+All functions are safe no-ops when Numba is not installed — callers check
+scanner_enabled() and fall back to the regex parser.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Try to import Numba; set flag for availability
+_numba_available = False
+try:
+    import numba
+    import numpy as np
+
+    _numba_available = True
+except ImportError:
+    pass
+
+# Below this size the regex parser wins — array conversion and JIT
+# dispatch cost more than they save on short outputs.
+SCANNER_MIN_CHARS = 8_192
+
+# Column layout of the span array returned by scan_routes().
+# HOP_START is -1 for directly connected routes, IFACE_START is -1 when
+# the route has no interface.
+PROTO_START = 0
+PROTO_END = 1
+PREFIX_START = 2
+PREFIX_END = 3
+HOP_START = 4
+HOP_END = 5
+IFACE_START = 6
+IFACE_END = 7
+_SPAN_COLUMNS = 8
+
+_DIRECTLY_CONNECTED = b"is directly connected,"
+
+
+def _is_space(c: int) -> bool:
+    # \s as in the regex: space, \t, \n, \v, \f, \r
+    return c == 32 or 9 <= c <= 13
+
+
+def _is_digit(c: int) -> bool:
+    return 48 <= c <= 57
+
+
+def _is_code(c: int) -> bool:
+    # Protocol code characters: C S O B D R L * > i
+    return (
+        c == 67 or c == 83 or c == 79 or c == 66 or c == 68
+        or c == 82 or c == 76 or c == 42 or c == 62 or c == 105
+    )
+
+
+def _scan_digits(buf: Any, i: int, end: int) -> int:
+    while i < end and _is_digit(buf[i]):
+        i += 1
+    return i
+
+
+def _scan_dotted_quad(buf: Any, i: int, end: int) -> int:
+    """Return the end offset of a dotted quad starting at i, or -1."""
+    for octet in range(4):
+        j = _scan_digits(buf, i, end)
+        if j == i:
+            return -1
+        i = j
+        if octet < 3:
+            if i >= end or buf[i] != 46:  # "."
+                return -1
+            i += 1
+    return i
+
+
+def _scan_spaces(buf: Any, i: int, end: int) -> int:
+    while i < end and _is_space(buf[i]):
+        i += 1
+    return i
+
+
+def _scan_word(buf: Any, i: int, end: int) -> int:
+    while i < end and not _is_space(buf[i]):
+        i += 1
+    return i
+
+
+def _scan_line(buf: Any, start: int, end: int, marker: Any, out: Any, row: int) -> int:
+    """Scan a route starting at line offset start into out[row].
+
+    Whitespace runs may cross newlines, as they do in the regex parser,
+    so IOS routes wrapped onto a continuation line still match. Returns
+    the end offset of the match, or -1 if no route starts at this line.
+    """
+    # Protocol code(s): code characters and whitespace, ending in whitespace
+    i = start
+    while i < end and (_is_code(buf[i]) or _is_space(buf[i])):
+        i += 1
+    if i - start < 2 or not _is_space(buf[i - 1]):
+        return -1
+    out[row, PROTO_START] = start
+    out[row, PROTO_END] = i
+
+    # Prefix with optional /mask
+    prefix_end = _scan_dotted_quad(buf, i, end)
+    if prefix_end < 0:
+        return -1
+    if prefix_end < end and buf[prefix_end] == 47:  # "/"
+        mask_end = _scan_digits(buf, prefix_end + 1, end)
+        if mask_end > prefix_end + 1:
+            prefix_end = mask_end
+    out[row, PREFIX_START] = i
+    out[row, PREFIX_END] = prefix_end
+
+    i = _scan_spaces(buf, prefix_end, end)
+    if i == prefix_end:
+        return -1
+
+    # "is directly connected, <iface>"
+    n = marker.shape[0]
+    if end - i >= n:
+        matched = True
+        for k in range(n):
+            if buf[i + k] != marker[k]:
+                matched = False
+                break
+        if matched:
+            i += n
+            iface_start = _scan_spaces(buf, i, end)
+            iface_end = _scan_word(buf, iface_start, end)
+            if iface_start == i or iface_end == iface_start:
+                return -1
+            out[row, HOP_START] = -1
+            out[row, HOP_END] = -1
+            out[row, IFACE_START] = iface_start
+            out[row, IFACE_END] = iface_end
+            return iface_end
+
+    # Optional "[AD/metric] " before "via"
+    if i < end and buf[i] == 91:  # "["
+        j = _scan_digits(buf, i + 1, end)
+        if j == i + 1 or j >= end or buf[j] != 47:  # "/"
+            return -1
+        k = _scan_digits(buf, j + 1, end)
+        if k == j + 1 or k >= end or buf[k] != 93:  # "]"
+            return -1
+        i = _scan_spaces(buf, k + 1, end)
+        if i == k + 1:
+            return -1
+
+    # "via <next-hop>"
+    if end - i < 3 or buf[i] != 118 or buf[i + 1] != 105 or buf[i + 2] != 97:
+        return -1
+    hop_start = _scan_spaces(buf, i + 3, end)
+    if hop_start == i + 3:
+        return -1
+    hop_end = _scan_dotted_quad(buf, hop_start, end)
+    if hop_end < 0:
+        return -1
+    out[row, HOP_START] = hop_start
+    out[row, HOP_END] = hop_end
+
+    # Optional interface: first token after the next comma on this line
+    out[row, IFACE_START] = -1
+    out[row, IFACE_END] = -1
+    i = hop_end
+    while i < end and buf[i] != 44 and buf[i] != 10:  # "," / "\n"
+        i += 1
+    if i < end and buf[i] == 44:
+        iface_start = _scan_spaces(buf, i + 1, end)
+        iface_end = _scan_word(buf, iface_start, end)
+        if iface_end > iface_start:
+            out[row, IFACE_START] = iface_start
+            out[row, IFACE_END] = iface_end
+            return iface_end
+    return hop_end
+
+
+def _scan_routes(buf: Any, marker: Any) -> Any:
+    n = buf.shape[0]
+    lines = 1
+    for i in range(n):
+        if buf[i] == 10:
+            lines += 1
+
+    # Try a match at every line start, like ^ under re.MULTILINE. After a
+    # match, resume at the first line start past its end.
+    out = np.empty((lines, _SPAN_COLUMNS), dtype=np.int64)
+    count = 0
+    start = 0
+    while start <= n:
+        end = _scan_line(buf, start, n, marker, out, count)
+        if end >= 0:
+            count += 1
+        else:
+            end = start
+        while end < n and buf[end] != 10:
+            end += 1
+        start = end + 1
+    return out[:count]
+
+
+if _numba_available:
+    _is_space = numba.njit(cache=True)(_is_space)
+    _is_digit = numba.njit(cache=True)(_is_digit)
+    _is_code = numba.njit(cache=True)(_is_code)
+    _scan_digits = numba.njit(cache=True)(_scan_digits)
+    _scan_dotted_quad = numba.njit(cache=True)(_scan_dotted_quad)
+    _scan_spaces = numba.njit(cache=True)(_scan_spaces)
+    _scan_word = numba.njit(cache=True)(_scan_word)
+    _scan_line = numba.njit(cache=True)(_scan_line)
+    _scan_routes = numba.njit(cache=True)(_scan_routes)
+
+
+def scanner_enabled(text: str | bytes) -> bool:
+    """Return True if the Numba scanner should be used for this input."""
+    return _numba_available and len(text) >= SCANNER_MIN_CHARS
+
+
+def scan_routes(text: str | bytes) -> Any:
+    """Scan routing table text and return an (n, 8) array of field offsets.
+
+    Bytes are scanned in place. For str input, non-ASCII characters are
+    replaced one-for-one before scanning, so the returned offsets index
+    directly into the original string.
+
+    Args:
+        text: Routing table output, already truncated by the caller.
+
+    Returns:
+        numpy int64 array; one row per route, columns as PROTO_START..IFACE_END.
+    """
+    data = text if isinstance(text, bytes) else text.encode("ascii", errors="replace")
+    buf = np.frombuffer(data, dtype=np.uint8)
+    marker = np.frombuffer(_DIRECTLY_CONNECTED, dtype=np.uint8)
+    return _scan_routes(buf, marker)
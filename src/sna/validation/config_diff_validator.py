@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 from sna.validation.config_diff import compute_semantic_diff, summarize_diff
-from sna.validation.validator import ValidationResult, ValidationStatus, Validator
+from sna.validation.validator import (
+    ValidationResult,
+    ValidationStatus,
+    Validator,
+    skip_result,
+)
 
 
 class SemanticDiffValidator(Validator):
@@ -13,6 +18,8 @@ class SemanticDiffValidator(Validator):
     expected sections, FAIL if no changes detected for a write operation.
     """
 
+    CACHEABLE = True
+
     async def validate(
         self,
         tool_name: str,
@@ -21,21 +28,15 @@ class SemanticDiffValidator(Validator):
         after_state: dict | None,
     ) -> ValidationResult:
         if before_state is None or after_state is None:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="semantic_diff",
-                message="Before/after state not available — skipping semantic diff",
+            return skip_result(
+                "semantic_diff", "Before/after state not available — skipping semantic diff",
             )
 
         before_config = before_state.get("running_config", "")
         after_config = after_state.get("running_config", "")
 
         if not before_config or not after_config:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="semantic_diff",
-                message="Running config not available in state",
-            )
+            return skip_result("semantic_diff", "Running config not available in state")
 
         diff_entries = compute_semantic_diff(before_config, after_config)
 
@@ -2,16 +2,86 @@
 
 Parses show command output into structured data for validators.
 All parsers truncate input to 64KB before processing (security: prevents regex DoS).
+Parsers accept str or raw bytes from the SSH channel; bytes are matched with
+byte patterns and only the captured fields are decoded.
 """
 
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
+from typing import Any
+
+from sna.validation import _route_scanner
 
 # Maximum input size for parsing (security: prevents regex DoS)
 _MAX_INPUT_BYTES = 65_536
 
+# Pattern sources use uniquely named groups so they can be compiled on their
+# own or joined into a single alternation for combined show output.
+
+# IOS-XE/IOS format: neighbor lines after the header
+# Example: 10.0.0.2   4   65001   0   0   0   0   0 00:05:30  5
+# Last field is PfxRcd (int) if Established, or state string if not
+_BGP_NEIGHBOR_PATTERN = (
+    r"^(?P<bgp_neighbor>\d+\.\d+\.\d+\.\d+)\s+"  # neighbor IP
+    r"\d+\s+"  # version
+    r"(?P<bgp_remote_as>\d+)\s+"  # remote AS
+    r"(?:\d+\s+){5}"  # MsgRcvd, MsgSent, TblVer, InQ, OutQ
+    r"\S+\s+"  # Up/Down time
+    r"(?P<bgp_state>\S+)\s*$"  # State/PfxRcd
+)
+
+# IOS-XE format:
+# Neighbor ID   Pri  State      Dead Time  Address       Interface
+# 10.0.0.2      1    FULL/DR    00:00:32   10.0.0.2      GigabitEthernet0/1
+_OSPF_NEIGHBOR_PATTERN = (
+    r"^(?P<ospf_neighbor_id>\d+\.\d+\.\d+\.\d+)\s+"  # Neighbor ID
+    r"\d+\s+"  # Priority
+    r"(?P<ospf_state>\S+)\s+"  # State (e.g., FULL/DR, 2WAY/DROTHER)
+    r"\S+\s+"  # Dead Time
+    r"(?P<ospf_address>\d+\.\d+\.\d+\.\d+)\s+"  # Address
+    r"(?P<ospf_interface>\S+)"  # Interface
+)
+
+# IOS-XE format:
+# C    10.0.0.0/24 is directly connected, GigabitEthernet0/1
+# S    192.168.1.0/24 [1/0] via 10.0.0.1
+# O    172.16.0.0/16 [110/20] via 10.0.0.2, 00:05:30, GigabitEthernet0/1
+# B    10.1.0.0/16 [20/0] via 10.0.0.3, 00:10:00
+_ROUTE_PATTERN = (
+    r"^(?P<route_protocol>[CSOBDRL*>i\s]+?)\s+"  # protocol code(s)
+    r"(?P<route_prefix>\d+\.\d+\.\d+\.\d+(?:/\d+)?)\s+"  # prefix
+    r"(?:"
+    r"is directly connected,\s+(?P<route_direct_iface>\S+)"  # directly connected
+    r"|"
+    r"(?:\[\d+/\d+\]\s+)?via\s+(?P<route_next_hop>\d+\.\d+\.\d+\.\d+)"  # via next-hop
+    r"(?:.*?,\s*(?P<route_via_iface>\S+))?"  # optional interface
+    r")"
+)
+
+# Single alternation for outputs that concatenate all three show commands.
+# BGP and OSPF rows start with a dotted quad, routes with a protocol code,
+# so the branches never compete for the same line.
+_COMBINED_PATTERN = (
+    rf"(?P<bgp>{_BGP_NEIGHBOR_PATTERN})"
+    rf"|(?P<ospf>{_OSPF_NEIGHBOR_PATTERN})"
+    rf"|(?P<route>{_ROUTE_PATTERN})"
+)
+
+_BGP_NEIGHBOR_RE = re.compile(_BGP_NEIGHBOR_PATTERN, re.MULTILINE)
+_OSPF_NEIGHBOR_RE = re.compile(_OSPF_NEIGHBOR_PATTERN, re.MULTILINE)
+_ROUTE_RE = re.compile(_ROUTE_PATTERN, re.MULTILINE)
+_COMBINED_RE = re.compile(_COMBINED_PATTERN, re.MULTILINE)
+
+# Byte variants — the patterns are pure ASCII, so matching raw device
+# output skips decoding the whole buffer.
+_BGP_NEIGHBOR_BYTES_RE = re.compile(_BGP_NEIGHBOR_PATTERN.encode("ascii"), re.MULTILINE)
+_OSPF_NEIGHBOR_BYTES_RE = re.compile(_OSPF_NEIGHBOR_PATTERN.encode("ascii"), re.MULTILINE)
+_ROUTE_BYTES_RE = re.compile(_ROUTE_PATTERN.encode("ascii"), re.MULTILINE)
+_COMBINED_BYTES_RE = re.compile(_COMBINED_PATTERN.encode("ascii"), re.MULTILINE)
+
 
 @dataclass(frozen=True)
 class BGPNeighborEntry:
@@ -43,155 +113,191 @@ class RouteEntry:
     interface: str = ""
 
 
-def parse_bgp_summary(output: str) -> list[BGPNeighborEntry]:
+def _finditer(
+    pattern: re.Pattern[str],
+    bytes_pattern: re.Pattern[bytes],
+    text: str | bytes,
+) -> Iterator[re.Match[Any]]:
+    if isinstance(text, bytes):
+        return bytes_pattern.finditer(text)
+    return pattern.finditer(text)
+
+
+def _group(match: re.Match[Any], name: str) -> str:
+    """Return a named group as str, decoding byte matches. Unmatched groups return ""."""
+    value = match.group(name)
+    if value is None:
+        return ""
+    if isinstance(value, bytes):
+        return value.decode("ascii", errors="replace")
+    return value
+
+
+def _bgp_entry(match: re.Match[Any]) -> BGPNeighborEntry:
+    state_or_pfx = _group(match, "bgp_state")
+    try:
+        pfx_count = int(state_or_pfx)
+        state = "Established"
+        prefixes = pfx_count
+    except ValueError:
+        state = state_or_pfx
+        prefixes = 0
+
+    return BGPNeighborEntry(
+        neighbor=_group(match, "bgp_neighbor"),
+        remote_as=_group(match, "bgp_remote_as"),
+        state=state,
+        prefixes_received=prefixes,
+    )
+
+
+def _ospf_entry(match: re.Match[Any]) -> OSPFNeighborEntry:
+    # Extract base state (before /)
+    state = _group(match, "ospf_state").split("/")[0]
+
+    return OSPFNeighborEntry(
+        neighbor_id=_group(match, "ospf_neighbor_id"),
+        state=state,
+        address=_group(match, "ospf_address"),
+        interface=_group(match, "ospf_interface"),
+    )
+
+
+def _protocol(code: str) -> str:
+    # Protocol from code column: drop whitespace and best/candidate markers
+    return code.strip().rstrip("*> ") or "?"
+
+
+def _route_entry(match: re.Match[Any]) -> RouteEntry:
+    proto = _protocol(_group(match, "route_protocol"))
+    direct_iface = _group(match, "route_direct_iface")
+
+    if direct_iface:
+        return RouteEntry(
+            prefix=_group(match, "route_prefix"),
+            next_hop="directly connected",
+            protocol=proto,
+            interface=direct_iface,
+        )
+    return RouteEntry(
+        prefix=_group(match, "route_prefix"),
+        next_hop=_group(match, "route_next_hop"),
+        protocol=proto,
+        interface=_group(match, "route_via_iface"),
+    )
+
+
+def _routes_from_spans(text: str | bytes, spans: Any) -> tuple[RouteEntry, ...]:
+    """Build RouteEntry objects from the offsets returned by the route scanner."""
+    if isinstance(text, bytes):
+        def field(start: int, end: int) -> str:
+            return text[start:end].decode("ascii", errors="replace")
+    else:
+        def field(start: int, end: int) -> str:
+            return text[start:end]
+
+    entries: list[RouteEntry] = []
+    for row in spans.tolist():
+        proto = _protocol(field(row[_route_scanner.PROTO_START], row[_route_scanner.PROTO_END]))
+        prefix = field(row[_route_scanner.PREFIX_START], row[_route_scanner.PREFIX_END])
+        iface_start = row[_route_scanner.IFACE_START]
+        interface = field(iface_start, row[_route_scanner.IFACE_END]) if iface_start >= 0 else ""
+        hop_start = row[_route_scanner.HOP_START]
+        if hop_start < 0:
+            next_hop = "directly connected"
+        else:
+            next_hop = field(hop_start, row[_route_scanner.HOP_END])
+
+        entries.append(RouteEntry(
+            prefix=prefix,
+            next_hop=next_hop,
+            protocol=proto,
+            interface=interface,
+        ))
+    return tuple(entries)
+
+
+def parse_bgp_summary(output: str | bytes) -> tuple[BGPNeighborEntry, ...]:
     """Parse 'show bgp summary' or 'show ip bgp summary' output.
 
     Handles IOS-XE and NX-OS formats. Extracts neighbor IP, remote AS,
     state/prefix count from the neighbor table.
 
     Args:
-        output: Raw show command output (truncated to 64KB).
+        output: Raw show command output, str or bytes (truncated to 64KB).
 
     Returns:
-        List of BGPNeighborEntry objects.
+        Tuple of BGPNeighborEntry objects.
     """
     text = output[:_MAX_INPUT_BYTES]
-    entries: list[BGPNeighborEntry] = []
-
-    # IOS-XE/IOS format: neighbor lines after the header
-    # Example: 10.0.0.2   4   65001   0   0   0   0   0 00:05:30  5
-    # Last field is PfxRcd (int) if Established, or state string if not
-    neighbor_pattern = re.compile(
-        r"^(\d+\.\d+\.\d+\.\d+)\s+"  # neighbor IP
-        r"\d+\s+"  # version
-        r"(\d+)\s+"  # remote AS
-        r"(?:\d+\s+){5}"  # MsgRcvd, MsgSent, TblVer, InQ, OutQ
-        r"\S+\s+"  # Up/Down time
-        r"(\S+)\s*$",  # State/PfxRcd
-        re.MULTILINE,
+    return tuple(
+        _bgp_entry(match) for match in _finditer(_BGP_NEIGHBOR_RE, _BGP_NEIGHBOR_BYTES_RE, text)
     )
 
-    for match in neighbor_pattern.finditer(text):
-        neighbor = match.group(1)
-        remote_as = match.group(2)
-        state_or_pfx = match.group(3)
-
-        try:
-            pfx_count = int(state_or_pfx)
-            state = "Established"
-            prefixes = pfx_count
-        except ValueError:
-            state = state_or_pfx
-            prefixes = 0
-
-        entries.append(BGPNeighborEntry(
-            neighbor=neighbor,
-            remote_as=remote_as,
-            state=state,
-            prefixes_received=prefixes,
-        ))
-
-    return entries
-
 
-def parse_ospf_neighbors(output: str) -> list[OSPFNeighborEntry]:
+def parse_ospf_neighbors(output: str | bytes) -> tuple[OSPFNeighborEntry, ...]:
     """Parse 'show ip ospf neighbor' output.
 
     Handles IOS-XE format.
 
     Args:
-        output: Raw show command output (truncated to 64KB).
+        output: Raw show command output, str or bytes (truncated to 64KB).
 
     Returns:
-        List of OSPFNeighborEntry objects.
+        Tuple of OSPFNeighborEntry objects.
     """
     text = output[:_MAX_INPUT_BYTES]
-    entries: list[OSPFNeighborEntry] = []
-
-    # IOS-XE format:
-    # Neighbor ID   Pri  State      Dead Time  Address       Interface
-    # 10.0.0.2      1    FULL/DR    00:00:32   10.0.0.2      GigabitEthernet0/1
-    neighbor_pattern = re.compile(
-        r"^(\d+\.\d+\.\d+\.\d+)\s+"  # Neighbor ID
-        r"\d+\s+"  # Priority
-        r"(\S+)\s+"  # State (e.g., FULL/DR, 2WAY/DROTHER)
-        r"\S+\s+"  # Dead Time
-        r"(\d+\.\d+\.\d+\.\d+)\s+"  # Address
-        r"(\S+)",  # Interface
-        re.MULTILINE,
+    return tuple(
+        _ospf_entry(match) for match in _finditer(_OSPF_NEIGHBOR_RE, _OSPF_NEIGHBOR_BYTES_RE, text)
     )
 
-    for match in neighbor_pattern.finditer(text):
-        state_full = match.group(2)
-        # Extract base state (before /)
-        state = state_full.split("/")[0]
 
-        entries.append(OSPFNeighborEntry(
-            neighbor_id=match.group(1),
-            state=state,
-            address=match.group(3),
-            interface=match.group(4),
-        ))
-
-    return entries
-
-
-def parse_routing_table(output: str) -> list[RouteEntry]:
+def parse_routing_table(output: str | bytes) -> tuple[RouteEntry, ...]:
     """Parse 'show ip route' output.
 
     Handles IOS-XE format. Extracts prefix, next-hop, protocol code.
+    Large outputs go through the Numba byte scanner when it is installed.
 
     Args:
-        output: Raw show command output (truncated to 64KB).
+        output: Raw show command output, str or bytes (truncated to 64KB).
 
     Returns:
-        List of RouteEntry objects.
+        Tuple of RouteEntry objects.
     """
     text = output[:_MAX_INPUT_BYTES]
-    entries: list[RouteEntry] = []
+    if _route_scanner.scanner_enabled(text):
+        return _routes_from_spans(text, _route_scanner.scan_routes(text))
+    return tuple(_route_entry(match) for match in _finditer(_ROUTE_RE, _ROUTE_BYTES_RE, text))
 
-    # IOS-XE format:
-    # C    10.0.0.0/24 is directly connected, GigabitEthernet0/1
-    # S    192.168.1.0/24 [1/0] via 10.0.0.1
-    # O    172.16.0.0/16 [110/20] via 10.0.0.2, 00:05:30, GigabitEthernet0/1
-    # B    10.1.0.0/16 [20/0] via 10.0.0.3, 00:10:00
-    route_pattern = re.compile(
-        r"^([CSOBDRL*>i\s]+?)\s+"  # protocol code(s)
-        r"(\d+\.\d+\.\d+\.\d+(?:/\d+)?)\s+"  # prefix
-        r"(?:"
-        r"is directly connected,\s+(\S+)"  # directly connected
-        r"|"
-        r"(?:\[\d+/\d+\]\s+)?via\s+(\d+\.\d+\.\d+\.\d+)"  # via next-hop
-        r"(?:.*?,\s*(\S+))?"  # optional interface
-        r")",
-        re.MULTILINE,
-    )
 
-    for match in route_pattern.finditer(text):
-        protocol_code = match.group(1).strip()
-        prefix = match.group(2)
-        direct_iface = match.group(3)
-        next_hop = match.group(4) or ""
-        via_iface = match.group(5) or ""
-
-        # Determine protocol from code
-        proto = protocol_code.strip().rstrip("*> ")
-        if not proto:
-            proto = "?"
-
-        if direct_iface:
-            entries.append(RouteEntry(
-                prefix=prefix,
-                next_hop="directly connected",
-                protocol=proto,
-                interface=direct_iface,
-            ))
+def parse_combined(
+    output: str | bytes,
+) -> tuple[
+    tuple[BGPNeighborEntry, ...], tuple[OSPFNeighborEntry, ...], tuple[RouteEntry, ...]
+]:
+    """Parse concatenated BGP summary, OSPF neighbor, and route output in one pass.
+
+    Some collectors return all show commands as a single blob. Scanning it
+    once with a combined alternation avoids three separate sweeps.
+
+    Args:
+        output: Raw combined show command output, str or bytes (truncated to 64KB).
+
+    Returns:
+        Tuple of (BGP neighbors, OSPF neighbors, routes).
+    """
+    text = output[:_MAX_INPUT_BYTES]
+    bgp: list[BGPNeighborEntry] = []
+    ospf: list[OSPFNeighborEntry] = []
+    routes: list[RouteEntry] = []
+
+    for match in _finditer(_COMBINED_RE, _COMBINED_BYTES_RE, text):
+        kind = match.lastgroup
+        if kind == "bgp":
+            bgp.append(_bgp_entry(match))
+        elif kind == "ospf":
+            ospf.append(_ospf_entry(match))
         else:
-            entries.append(RouteEntry(
-                prefix=prefix,
-                next_hop=next_hop,
-                protocol=proto,
-                interface=via_iface,
-            ))
-
-    return entries
+            routes.append(_route_entry(match))
+
+    return tuple(bgp), tuple(ospf), tuple(routes)
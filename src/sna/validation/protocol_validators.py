@@ -6,8 +6,98 @@ are healthy after configuration changes.
 
 from __future__ import annotations
 
-from sna.validation.parsers import parse_bgp_summary, parse_ospf_neighbors, parse_routing_table
-from sna.validation.validator import ValidationResult, ValidationStatus, Validator
+from collections.abc import Callable
+from typing import Any
+
+from sna.validation.parsers import (
+    parse_bgp_summary,
+    parse_combined,
+    parse_ospf_neighbors,
+    parse_routing_table,
+)
+from sna.validation.validator import (
+    ValidationResult,
+    ValidationStatus,
+    Validator,
+    run_memo,
+    skip_result,
+)
+
+# State key used by collectors that return all show commands as one blob
+COMBINED_OUTPUT_KEY = "show_output"
+
+_PARSERS = {
+    "bgp_summary": (parse_bgp_summary, 0),
+    "ospf_neighbors": (parse_ospf_neighbors, 1),
+    "routing_table": (parse_routing_table, 2),
+}
+
+
+def _as_text(output: object) -> str | bytes:
+    # Raw bytes from the SSH channel are parsed without decoding
+    if isinstance(output, (str, bytes)):
+        return output
+    return str(output)
+
+
+def _parse_once(parser: Callable[[str | bytes], Any], output: object) -> Any:
+    """Run parser on output, reusing the result within one validation run.
+
+    Validators for a tool share the same state dicts, so without this each
+    one would re-parse the same (possibly combined) show output.
+    """
+    memo = run_memo()
+    if memo is None:
+        return parser(_as_text(output))
+    # Keyed by identity; the stored reference keeps the id from being reused
+    key = (parser, id(output))
+    hit = memo.get(key)
+    if hit is not None and hit[0] is output:
+        return hit[1]
+    parsed = parser(_as_text(output))
+    memo[key] = (output, parsed)
+    return parsed
+
+
+def _parse_state(state: dict, key: str) -> tuple[Any, ...] | None:
+    """Parse one show output from a state dict.
+
+    Uses the dedicated key when present, otherwise falls back to the
+    combined show output blob. Returns None if neither is available.
+    """
+    parser, index = _PARSERS[key]
+    output = state.get(key)
+    if output is not None:
+        return _parse_once(parser, output)
+
+    combined = state.get(COMBINED_OUTPUT_KEY)
+    if combined is not None:
+        return _parse_once(parse_combined, combined)[index]
+    return None
+
+
+def _get_parsed(
+    state: dict | None,
+    key: str,
+    testcase_name: str,
+    empty_message: str | None = None,
+) -> tuple[tuple[Any, ...], ValidationResult | None]:
+    """Gate a validator on parsed after-state output.
+
+    Returns (entries, None) on the happy path, or ((), SKIP result) when
+    the state or key is missing — or when entries are empty and
+    empty_message is given.
+    """
+    if state is None:
+        return (), skip_result(testcase_name, "After state not available")
+
+    parsed = _parse_state(state, key)
+    if parsed is None:
+        return (), skip_result(testcase_name, f"No {key} in after state")
+
+    if not parsed and empty_message is not None:
+        return (), skip_result(testcase_name, empty_message)
+    return parsed, None
 
 
 class BGPNeighborUpValidator(Validator):
@@ -18,6 +108,8 @@ class BGPNeighborUpValidator(Validator):
     SKIP if no bgp_summary in state.
     """
 
+    CACHEABLE = True
+
     async def validate(
         self,
         tool_name: str,
@@ -25,28 +117,11 @@ class BGPNeighborUpValidator(Validator):
         before_state: dict | None,
         after_state: dict | None,
     ) -> ValidationResult:
-        if after_state is None:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="bgp_neighbor_up",
-                message="After state not available",
-            )
-
-        bgp_output = after_state.get("bgp_summary")
-        if bgp_output is None:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="bgp_neighbor_up",
-                message="No bgp_summary in after state",
-            )
-
-        neighbors = parse_bgp_summary(str(bgp_output))
-        if not neighbors:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="bgp_neighbor_up",
-                message="No BGP neighbors found in output",
-            )
+        neighbors, skip = _get_parsed(
+            after_state, "bgp_summary", "bgp_neighbor_up", "No BGP neighbors found in output",
+        )
+        if skip is not None:
+            return skip
 
         non_established = [n for n in neighbors if n.state != "Established"]
         if non_established:
@@ -77,6 +152,8 @@ class OSPFNeighborValidator(Validator):
     SKIP if no ospf_neighbors in state.
     """
 
+    CACHEABLE = True
+
     async def validate(
         self,
         tool_name: str,
@@ -84,28 +161,11 @@ class OSPFNeighborValidator(Validator):
         before_state: dict | None,
         after_state: dict | None,
     ) -> ValidationResult:
-        if after_state is None:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="ospf_neighbor_full",
-                message="After state not available",
-            )
-
-        ospf_output = after_state.get("ospf_neighbors")
-        if ospf_output is None:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="ospf_neighbor_full",
-                message="No ospf_neighbors in after state",
-            )
-
-        neighbors = parse_ospf_neighbors(str(ospf_output))
-        if not neighbors:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="ospf_neighbor_full",
-                message="No OSPF neighbors found in output",
-            )
+        neighbors, skip = _get_parsed(
+            after_state, "ospf_neighbors", "ospf_neighbor_full", "No OSPF neighbors found in output",
+        )
+        if skip is not None:
+            return skip
 
         non_full = [n for n in neighbors if n.state != "FULL"]
         if non_full:
@@ -137,6 +197,8 @@ class PrefixCountValidator(Validator):
     SKIP if no bgp_summary in state.
     """
 
+    CACHEABLE = True
+
     async def validate(
         self,
         tool_name: str,
@@ -144,22 +206,10 @@ class PrefixCountValidator(Validator):
         before_state: dict | None,
         after_state: dict | None,
     ) -> ValidationResult:
-        if after_state is None:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="prefix_count",
-                message="After state not available",
-            )
+        after_neighbors, skip = _get_parsed(after_state, "bgp_summary", "prefix_count")
+        if skip is not None:
+            return skip
 
-        after_output = after_state.get("bgp_summary")
-        if after_output is None:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="prefix_count",
-                message="No bgp_summary in after state",
-            )
-
-        after_neighbors = parse_bgp_summary(str(after_output))
         after_total = sum(n.prefixes_received for n in after_neighbors)
 
         if after_total == 0:
@@ -171,8 +221,8 @@ class PrefixCountValidator(Validator):
             )
 
         # Compare with before state if available
-        if before_state and before_state.get("bgp_summary"):
-            before_neighbors = parse_bgp_summary(str(before_state["bgp_summary"]))
+        before_neighbors = _parse_state(before_state, "bgp_summary") if before_state else None
+        if before_neighbors:
             before_total = sum(n.prefixes_received for n in before_neighbors)
 
             if before_total > 0 and after_total < before_total * 0.5:
@@ -205,6 +255,8 @@ class RouteConvergenceValidator(Validator):
     FAIL if any prefixes are missing.
     """
 
+    CACHEABLE = True
+
     async def validate(
         self,
         tool_name: str,
@@ -213,24 +265,13 @@ class RouteConvergenceValidator(Validator):
         after_state: dict | None,
     ) -> ValidationResult:
         if before_state is None or after_state is None:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="route_convergence",
-                message="Before/after state not available",
-            )
-
-        before_output = before_state.get("routing_table")
-        after_output = after_state.get("routing_table")
+            return skip_result("route_convergence", "Before/after state not available")
 
-        if before_output is None or after_output is None:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="route_convergence",
-                message="No routing_table in state",
-            )
+        before_routes = _parse_state(before_state, "routing_table")
+        after_routes = _parse_state(after_state, "routing_table")
 
-        before_routes = parse_routing_table(str(before_output))
-        after_routes = parse_routing_table(str(after_output))
+        if before_routes is None or after_routes is None:
+            return skip_result("route_convergence", "No routing_table in state")
 
         before_prefixes = {r.prefix for r in before_routes}
         after_prefixes = {r.prefix for r in after_routes}
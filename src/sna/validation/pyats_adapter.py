@@ -7,6 +7,7 @@ native SNA validation.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from sna.validation.validator import ValidationResult, ValidationStatus, Validator
@@ -122,17 +123,41 @@ async def run_pyats_validation(
     Returns:
         List of ValidationResult from each test case.
 
+    Raises:
+        PyATSNotAvailable: If pyATS is not installed.
+    """
+    return (await run_pyats_batch([(testcases, before_state, after_state)]))[0]
+
+
+async def run_pyats_batch(
+    jobs: Sequence[tuple[list[SNATestcase], dict | None, dict | None]],
+) -> list[list[ValidationResult]]:
+    """Run several devices' pyATS test cases after one availability check.
+
+    pyATS availability is checked once for the whole batch. Each device's
+    test cases then run sequentially, with the usual per-testcase
+    setup/test/cleanup, exactly as run_pyats_validation does for one device.
+
+    Args:
+        jobs: (testcases, before_state, after_state) per device.
+
+    Returns:
+        One list of ValidationResult per job, in job order.
+
     Raises:
         PyATSNotAvailable: If pyATS is not installed.
     """
     if not _check_pyats_available():
         raise PyATSNotAvailable("pyATS is not installed — falling back to native validation")
 
-    results: list[ValidationResult] = []
-    for tc in testcases:
-        tc.setup(before_state)
-        result = await tc.test(after_state)
-        results.append(result)
-        tc.cleanup()
-
-    return results
+    batch_results: list[list[ValidationResult]] = []
+    for testcases, before_state, after_state in jobs:
+        results: list[ValidationResult] = []
+        for tc in testcases:
+            tc.setup(before_state)
+            result = await tc.test(after_state)
+            results.append(result)
+            tc.cleanup()
+        batch_results.append(results)
+
+    return batch_results
@@ -6,7 +6,17 @@ Testcases are loaded from a fixed registry — no dynamic Python imports.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import asyncio
+import fnmatch
+import hashlib
+import json
+import re
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
 
 import structlog
 
@@ -17,27 +27,65 @@ from sna.validation.protocol_validators import (
     PrefixCountValidator,
     RouteConvergenceValidator,
 )
-from sna.validation.validator import ValidationResult, ValidationStatus, Validator
+from sna.validation.pyats_adapter import (
+    PyATSNotAvailable,
+    create_pyats_job,
+    run_pyats_batch,
+)
+from sna.validation.validator import (
+    ValidationResult,
+    ValidationStatus,
+    Validator,
+    shared_timestamp,
+    skip_result,
+)
 
 logger = structlog.get_logger()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationRule:
     """A validation rule mapping a tool (or tier) to a testcase name."""
 
-    tool_pattern: str  # exact tool name, or "tier_*" pattern
+    tool_pattern: str  # exact tool name, or glob pattern such as "tier_*"
     testcase_name: str
     description: str = ""
     required: bool = True  # If True, failure triggers rollback
 
+    def __post_init__(self) -> None:
+        # Interned so testcase lookups against results compare by identity
+        object.__setattr__(self, "testcase_name", sys.intern(self.testcase_name))
+
 
 # --- Built-in testcases (pre-registered) ---
 
+# Running-config header lines that change on every save/show, regardless of
+# whether the configuration itself changed.
+_VOLATILE_CONFIG_LINES = re.compile(
+    r"^(?:Building configuration\.*"
+    r"|Current configuration\s*:.*"
+    r"|! Last configuration change at .*"
+    r"|! NVRAM config last updated at .*"
+    r"|! No configuration change since last restart.*)\r?\n?",
+    re.MULTILINE,
+)
+
+
+# Whole-word "up" — avoids matching "supplicant", "setup", etc.
+_INTERFACE_UP = re.compile(r"\bup\b", re.IGNORECASE)
+
+
+def _config_digest(config: str) -> bytes:
+    """BLAKE2b digest of a running config, ignoring volatile header lines."""
+    normalized = _VOLATILE_CONFIG_LINES.sub("", config)
+    return hashlib.blake2b(normalized.encode(), digest_size=16).digest()
+
 
 class ConfigChangedValidator(Validator):
     """Validates that the running config actually changed after a write operation."""
 
+    CACHEABLE = True
+
     async def validate(
         self,
         tool_name: str,
@@ -46,16 +94,24 @@ class ConfigChangedValidator(Validator):
         after_state: dict | None,
     ) -> ValidationResult:
         if before_state is None or after_state is None:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="config_changed",
-                message="Before/after state not available — skipping",
+            return skip_result("config_changed", "Before/after state not available — skipping")
+
+        # Collectors may stash a running_config_hash alongside the text;
+        # compare those when both sides have one.
+        before_hash = before_state.get("running_config_hash")
+        after_hash = after_state.get("running_config_hash")
+        if before_hash is not None and after_hash is not None:
+            unchanged = before_hash == after_hash
+        else:
+            # Identical text needs no hashing; otherwise compare normalized
+            # digests so header-only differences (timestamps) don't count.
+            before_config = str(before_state.get("running_config", ""))
+            after_config = str(after_state.get("running_config", ""))
+            unchanged = before_config == after_config or (
+                _config_digest(before_config) == _config_digest(after_config)
             )
 
-        before_config = before_state.get("running_config", "")
-        after_config = after_state.get("running_config", "")
-
-        if before_config == after_config:
+        if unchanged:
             return ValidationResult(
                 status=ValidationStatus.FAIL,
                 testcase_name="config_changed",
@@ -72,6 +128,8 @@ class ConfigChangedValidator(Validator):
 class InterfaceUpValidator(Validator):
     """Validates that an interface is up after configuration."""
 
+    CACHEABLE = True
+
     async def validate(
         self,
         tool_name: str,
@@ -80,14 +138,25 @@ class InterfaceUpValidator(Validator):
         after_state: dict | None,
     ) -> ValidationResult:
         if after_state is None:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="interface_up",
-                message="After state not available",
-            )
+            return skip_result("interface_up", "After state not available")
 
         interface_status = after_state.get("interface_status", "")
-        if "up" in str(interface_status).lower():
+        if isinstance(interface_status, dict):
+            oper_status = interface_status.get("oper_status")
+            # Exact match is the common case; other spellings and dict
+            # shapes fall back to the same word search as plain text
+            if oper_status == "up":
+                is_up = True
+            elif isinstance(oper_status, str):
+                is_up = _INTERFACE_UP.search(oper_status) is not None
+            else:
+                is_up = _INTERFACE_UP.search(str(interface_status)) is not None
+        elif isinstance(interface_status, str):
+            is_up = _INTERFACE_UP.search(interface_status) is not None
+        else:
+            is_up = _INTERFACE_UP.search(str(interface_status)) is not None
+
+        if is_up:
             return ValidationResult(
                 status=ValidationStatus.PASS,
                 testcase_name="interface_up",
@@ -105,6 +174,8 @@ class InterfaceUpValidator(Validator):
 class ReachabilityValidator(Validator):
     """Validates basic reachability (ping) after a change."""
 
+    CACHEABLE = True
+
     async def validate(
         self,
         tool_name: str,
@@ -113,11 +184,7 @@ class ReachabilityValidator(Validator):
         after_state: dict | None,
     ) -> ValidationResult:
         if after_state is None:
-            return ValidationResult(
-                status=ValidationStatus.SKIP,
-                testcase_name="reachability",
-                message="After state not available",
-            )
+            return skip_result("reachability", "After state not available")
 
         reachable = after_state.get("reachable", None)
         if reachable is True:
@@ -133,11 +200,7 @@ class ReachabilityValidator(Validator):
                 message=f"Device {device_target} is NOT reachable",
             )
 
-        return ValidationResult(
-            status=ValidationStatus.SKIP,
-            testcase_name="reachability",
-            message="Reachability data not available",
-        )
+        return skip_result("reachability", "Reachability data not available")
 
 
 # --- Testcase registry ---
@@ -156,7 +219,7 @@ TESTCASE_REGISTRY: dict[str, Validator] = {
 
 # --- Default validation rules ---
 
-DEFAULT_RULES: list[ValidationRule] = [
+DEFAULT_RULES: tuple[ValidationRule, ...] = (
     ValidationRule(
         tool_pattern="set_interface_description",
         testcase_name="config_changed",
@@ -202,28 +265,173 @@ DEFAULT_RULES: list[ValidationRule] = [
         testcase_name="ospf_neighbor_full",
         description="Verify OSPF neighbor reaches FULL state",
     ),
-]
+)
+
+
+# Cap on tool names memoized from wildcard matches
+_MAX_INDEXED_TOOLS = 1024
+
+
+# Result caching is off by default — digesting before/after state costs
+# a serialization per call. Callers that repeat identical validations
+# (retry loops) opt in with a short TTL.
+DEFAULT_CACHE_TTL_SECONDS = 0.0
+
+# Cap on cached (tool, device, state) entries
+_MAX_CACHED_RESULTS = 1024
+
+
+def _state_digest(before_state: dict | None, after_state: dict | None) -> bytes | None:
+    """Stable digest of before/after state, or None if the state can't be serialized."""
+    try:
+        encoded = json.dumps(
+            [before_state, after_state], sort_keys=True, default=repr,
+        ).encode()
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _is_wildcard(tool_pattern: str) -> bool:
+    return any(c in tool_pattern for c in "*?[")
+
+
+def _dedupe_rules(rules: Sequence[ValidationRule]) -> tuple[ValidationRule, ...]:
+    """Collapse rules with the same (tool_pattern, testcase_name).
+
+    The first rule is kept; it becomes required if any duplicate is, so
+    collapsing never weakens rollback behavior.
+    """
+    unique: dict[tuple[str, str], ValidationRule] = {}
+    for rule in rules:
+        key = (rule.tool_pattern, rule.testcase_name)
+        existing = unique.get(key)
+        if existing is None:
+            unique[key] = rule
+            continue
+        logger.debug(
+            "validation_rule_duplicate_collapsed",
+            tool=rule.tool_pattern,
+            testcase=rule.testcase_name,
+        )
+        if rule.required and not existing.required:
+            unique[key] = replace(existing, required=True)
+    return tuple(unique.values())
+
+
+def _match_rules(
+    rules: tuple[ValidationRule, ...], tool_name: str,
+) -> tuple[ValidationRule, ...]:
+    return tuple(
+        r for r in rules
+        if r.tool_pattern == tool_name
+        or (_is_wildcard(r.tool_pattern) and fnmatch.fnmatchcase(tool_name, r.tool_pattern))
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _RuleIndex:
+    """Rules organized for lookup. Immutable, so one index can back many engines."""
+
+    rules: tuple[ValidationRule, ...]
+    by_tool: Mapping[str, tuple[ValidationRule, ...]]
+    required_testcases: frozenset[str]
+    wildcard_re: re.Pattern[str] | None
+    wildcard_rules: tuple[tuple[re.Pattern[str], ValidationRule], ...]
+
+
+def _index_rules(rules: Sequence[ValidationRule]) -> _RuleIndex:
+    unique = _dedupe_rules(rules)
+
+    # Wildcard tool patterns (e.g. "tier_*") are compiled once each, and
+    # also joined into one alternation used only as a single-pass reject
+    # for unmatched tools. The alternation can't say which rules matched
+    # (several patterns may match one tool), so hits are resolved against
+    # the per-pattern regexes.
+    wildcard_patterns = {
+        r.tool_pattern: re.compile(fnmatch.translate(r.tool_pattern))
+        for r in unique if _is_wildcard(r.tool_pattern)
+    }
+    wildcard_re = re.compile(
+        "|".join(f"(?:{fnmatch.translate(p)})" for p in wildcard_patterns)
+    ) if wildcard_patterns else None
+
+    # Exact tool names resolve with a single dict lookup
+    by_tool = {
+        r.tool_pattern: _match_rules(unique, r.tool_pattern)
+        for r in unique if not _is_wildcard(r.tool_pattern)
+    }
+    return _RuleIndex(
+        rules=unique,
+        by_tool=MappingProxyType(by_tool),
+        required_testcases=frozenset(r.testcase_name for r in unique if r.required),
+        wildcard_re=wildcard_re,
+        wildcard_rules=tuple(
+            (wildcard_patterns[r.tool_pattern], r) for r in unique if _is_wildcard(r.tool_pattern)
+        ),
+    )
+
+
+# Built once at import; every engine using the default rules shares it
+_DEFAULT_INDEX = _index_rules(DEFAULT_RULES)
 
 
 class ValidationEngine:
     """Runs validation rules against post-change state.
 
+    Validators for a tool run concurrently; results keep rule order.
+
     Args:
         rules: List of validation rules. Defaults to DEFAULT_RULES.
         pyats_enabled: If True and pyATS available, run through pyATS adapter.
+        max_concurrency: Maximum validators in flight at once (None = unbounded).
+            Bounds load on a single device when many rules apply.
+        registry: Testcase registry to resolve rules against. Defaults to
+            TESTCASE_REGISTRY.
+        cache_ttl: Seconds to reuse results for an identical (tool, device,
+            before/after state) call. Only applies when every validator for
+            the tool is marked CACHEABLE. 0 (the default) disables the cache.
     """
 
     def __init__(
         self,
-        rules: list[ValidationRule] | None = None,
+        rules: Sequence[ValidationRule] | None = None,
         pyats_enabled: bool = False,
+        max_concurrency: int | None = None,
+        registry: Mapping[str, Validator] | None = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL_SECONDS,
     ) -> None:
-        self._rules = rules or DEFAULT_RULES
+        self._index = _index_rules(rules) if rules else _DEFAULT_INDEX
+        self._registry = TESTCASE_REGISTRY if registry is None else registry
         self._pyats_enabled = pyats_enabled
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._cache_ttl = cache_ttl
+        self._cache: OrderedDict[tuple[str, str, bytes], tuple[float, list[ValidationResult]]] = (
+            OrderedDict()
+        )
 
-    def get_rules_for_tool(self, tool_name: str) -> list[ValidationRule]:
-        """Return all validation rules that apply to a tool."""
-        return [r for r in self._rules if r.tool_pattern == tool_name]
+        # Tool names resolved through wildcard patterns, memoized per engine
+        self._wildcard_matches: dict[str, tuple[ValidationRule, ...]] = {}
+
+    def get_rules_for_tool(self, tool_name: str) -> tuple[ValidationRule, ...]:
+        """Return all validation rules that apply to a tool, in rule order."""
+        rules = self._index.by_tool.get(tool_name)
+        if rules is not None:
+            return rules
+        rules = self._wildcard_matches.get(tool_name)
+        if rules is not None:
+            return rules
+        wildcard_re = self._index.wildcard_re
+        if wildcard_re is None or wildcard_re.match(tool_name) is None:
+            return ()
+
+        # Not an exact tool name, so only wildcard rules can apply
+        rules = tuple(
+            rule for pattern, rule in self._index.wildcard_rules if pattern.match(tool_name)
+        )
+        if len(self._wildcard_matches) < _MAX_INDEXED_TOOLS:
+            self._wildcard_matches[tool_name] = rules
+        return rules
 
     async def run_validations(
         self,
@@ -235,7 +443,7 @@ class ValidationEngine:
         """Run all applicable validations for a tool execution.
 
         If pyats_enabled and pyATS is available, runs through the pyATS adapter.
-        Otherwise runs validators natively.
+        Otherwise runs validators natively and concurrently.
 
         Args:
             tool_name: The tool that was executed.
@@ -244,97 +452,294 @@ class ValidationEngine:
             after_state: Post-change state.
 
         Returns:
-            List of ValidationResults. Empty if no rules apply.
+            List of ValidationResults in rule order. Empty if no rules apply.
         """
         rules = self.get_rules_for_tool(tool_name)
         if not rules:
             return []
 
-        # Collect validators for matching rules
-        validators_for_pyats: list[Validator] = []
-        results: list[ValidationResult] = []
+        cache_key = self._cache_key(rules, tool_name, device_target, before_state, after_state)
+        if cache_key is not None:
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return list(cached)
 
+        with shared_timestamp():
+            results = await self._run_rules(
+                rules, tool_name, device_target, before_state, after_state,
+            )
+
+        if cache_key is not None and all(r.status != ValidationStatus.ERROR for r in results):
+            self._cache_put(cache_key, results)
+        return results
+
+    def _cache_key(
+        self,
+        rules: tuple[ValidationRule, ...],
+        tool_name: str,
+        device_target: str,
+        before_state: dict | None,
+        after_state: dict | None,
+    ) -> tuple[str, str, bytes] | None:
+        """Return the result-cache key, or None if this call must not be cached."""
+        if self._cache_ttl <= 0:
+            return None
         for rule in rules:
-            validator = TESTCASE_REGISTRY.get(rule.testcase_name)
-            if validator is None:
-                await logger.awarning(
-                    "validation_testcase_not_found",
-                    testcase=rule.testcase_name,
-                    tool=tool_name,
-                )
-                results.append(ValidationResult(
-                    status=ValidationStatus.ERROR,
-                    testcase_name=rule.testcase_name,
-                    message=f"Testcase '{rule.testcase_name}' not found in registry",
-                ))
-                continue
+            validator = self._registry.get(rule.testcase_name)
+            if validator is None or not validator.CACHEABLE:
+                return None
+        digest = _state_digest(before_state, after_state)
+        if digest is None:
+            return None
+        return (tool_name, device_target, digest)
+
+    def _cache_get(self, key: tuple[str, str, bytes]) -> list[ValidationResult] | None:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, results = entry
+        if time.monotonic() - stored_at > self._cache_ttl:
+            del self._cache[key]
+            return None
+        return results
+
+    def _cache_put(self, key: tuple[str, str, bytes], results: list[ValidationResult]) -> None:
+        # Lookup and store never await, so no lock is needed on one event loop
+        self._cache[key] = (time.monotonic(), list(results))
+        self._cache.move_to_end(key)
+        while len(self._cache) > _MAX_CACHED_RESULTS:
+            self._cache.popitem(last=False)
+
+    async def run_validations_batch(
+        self,
+        tool_name: str,
+        targets: Sequence[tuple[str, dict | None, dict | None]],
+    ) -> dict[str, list[ValidationResult]]:
+        """Run all applicable validations for one tool across many devices.
+
+        Native validators for every target run concurrently under the shared
+        max_concurrency limit. With pyATS enabled, rules are resolved and
+        pyATS availability is checked once for the batch; each device's test
+        cases then run in turn.
+
+        Args:
+            tool_name: The tool that was executed.
+            targets: (device_target, before_state, after_state) per device.
+                Device targets must be unique.
+
+        Returns:
+            Mapping of device_target to its ValidationResults in rule order.
+
+        Raises:
+            ValueError: If a device target appears more than once.
+        """
+        devices = [device for device, _, _ in targets]
+        if len(set(devices)) != len(devices):
+            raise ValueError("Duplicate device targets in validation batch")
 
+        rules = self.get_rules_for_tool(tool_name)
+        if not rules:
+            return {device: [] for device in devices}
+
+        with shared_timestamp():
             if self._pyats_enabled:
-                validators_for_pyats.append(validator)
+                per_target = await self._run_rules_pyats(rules, tool_name, targets)
             else:
-                try:
-                    result = await validator.validate(tool_name, device_target, before_state, after_state)
-                    results.append(result)
-                except Exception as exc:
-                    await logger.aerror(
-                        "validation_error",
-                        testcase=rule.testcase_name,
-                        tool=tool_name,
-                        error=str(exc),
-                    )
-                    results.append(ValidationResult(
-                        status=ValidationStatus.ERROR,
-                        testcase_name=rule.testcase_name,
-                        message=f"Validation error: {exc}",
-                    ))
-
-        # Run through pyATS adapter if enabled
-        if self._pyats_enabled and validators_for_pyats:
-            try:
-                from sna.validation.pyats_adapter import (
-                    PyATSNotAvailable,
-                    create_pyats_job,
-                    run_pyats_validation,
-                )
+                per_target = await asyncio.gather(*(
+                    self._run_rules(rules, tool_name, device, before_state, after_state)
+                    for device, before_state, after_state in targets
+                ))
+        return dict(zip(devices, per_target, strict=True))
 
-                testcases = create_pyats_job(tool_name, device_target, validators_for_pyats)
-                pyats_results = await run_pyats_validation(testcases, before_state, after_state)
-                results.extend(pyats_results)
-            except PyATSNotAvailable:
-                await logger.awarning("pyats_not_available_fallback_native")
-                # Fallback to native validation
-                for validator in validators_for_pyats:
-                    try:
-                        result = await validator.validate(tool_name, device_target, before_state, after_state)
-                        results.append(result)
-                    except Exception as exc:
-                        results.append(ValidationResult(
-                            status=ValidationStatus.ERROR,
-                            testcase_name=type(validator).__name__,
-                            message=f"Validation error: {exc}",
-                        ))
-            except Exception as exc:
-                await logger.aerror("pyats_validation_error", error=str(exc))
-                # Fallback to native
-                for validator in validators_for_pyats:
-                    try:
-                        result = await validator.validate(tool_name, device_target, before_state, after_state)
-                        results.append(result)
-                    except Exception as val_exc:
-                        results.append(ValidationResult(
-                            status=ValidationStatus.ERROR,
-                            testcase_name=type(validator).__name__,
-                            message=f"Validation error: {val_exc}",
-                        ))
+    async def _run_rules(
+        self,
+        rules: tuple[ValidationRule, ...],
+        tool_name: str,
+        device_target: str,
+        before_state: dict | None,
+        after_state: dict | None,
+    ) -> list[ValidationResult]:
+        if not self._pyats_enabled:
+            return await self._run_rules_native(
+                rules, tool_name, device_target, before_state, after_state,
+            )
 
-        return results
+        per_target = await self._run_rules_pyats(
+            rules, tool_name, [(device_target, before_state, after_state)],
+        )
+        return per_target[0]
+
+    async def _run_rules_native(
+        self,
+        rules: tuple[ValidationRule, ...],
+        tool_name: str,
+        device_target: str,
+        before_state: dict | None,
+        after_state: dict | None,
+    ) -> list[ValidationResult]:
+        """Run rules concurrently, stopping early once a required rule fails.
+
+        The outcome is already a rollback at that point, so validators still
+        running are cancelled and reported as SKIP instead of awaited.
+        """
+        tasks = [
+            asyncio.create_task(
+                self._run_rule(rule, tool_name, device_target, before_state, after_state),
+            )
+            for rule in rules
+        ]
+        required = {task for task, rule in zip(tasks, rules, strict=True) if rule.required}
+        pending: set[asyncio.Task[ValidationResult]] = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(
+                    task in required and task.result().status == ValidationStatus.FAIL
+                    for task in done
+                ):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if pending:
+            await logger.ainfo(
+                "validation_fail_fast",
+                tool=tool_name,
+                device=device_target,
+                cancelled=len(pending),
+            )
+        return [
+            skip_result(rule.testcase_name, "Cancelled after a required validation failed")
+            if task in pending else task.result()
+            for task, rule in zip(tasks, rules, strict=True)
+        ]
+
+    async def _run_rules_pyats(
+        self,
+        rules: tuple[ValidationRule, ...],
+        tool_name: str,
+        targets: Sequence[tuple[str, dict | None, dict | None]],
+    ) -> list[list[ValidationResult]]:
+        """Resolve rules once and run them for every target through pyATS."""
+        validators_for_pyats: list[tuple[str, Validator]] = []
+        missing: list[ValidationResult] = []
+
+        for rule in rules:
+            validator = self._registry.get(rule.testcase_name)
+            if validator is None:
+                missing.append(await self._testcase_not_found(rule, tool_name))
+                continue
+            validators_for_pyats.append((rule.testcase_name, validator))
+
+        if not validators_for_pyats:
+            return [list(missing) for _ in targets]
+
+        per_target = await self._run_pyats(tool_name, targets, validators_for_pyats)
+        return [missing + results for results in per_target]
+
+    async def _run_rule(
+        self,
+        rule: ValidationRule,
+        tool_name: str,
+        device_target: str,
+        before_state: dict | None,
+        after_state: dict | None,
+    ) -> ValidationResult:
+        """Look up and run the validator for one rule. Never raises."""
+        validator = self._registry.get(rule.testcase_name)
+        if validator is None:
+            return await self._testcase_not_found(rule, tool_name)
+        return await self._run_validator(
+            rule.testcase_name, validator, tool_name, device_target, before_state, after_state,
+        )
+
+    async def _run_validator(
+        self,
+        testcase_name: str,
+        validator: Validator,
+        tool_name: str,
+        device_target: str,
+        before_state: dict | None,
+        after_state: dict | None,
+    ) -> ValidationResult:
+        """Run a single validator, converting exceptions into an ERROR result."""
+        try:
+            if self._semaphore is None:
+                return await validator.validate(tool_name, device_target, before_state, after_state)
+            async with self._semaphore:
+                return await validator.validate(tool_name, device_target, before_state, after_state)
+        except Exception as exc:
+            await logger.aerror(
+                "validation_error",
+                testcase=testcase_name,
+                tool=tool_name,
+                error=str(exc),
+            )
+            return ValidationResult(
+                status=ValidationStatus.ERROR,
+                testcase_name=testcase_name,
+                message=f"Validation error: {exc}",
+            )
+
+    async def _testcase_not_found(self, rule: ValidationRule, tool_name: str) -> ValidationResult:
+        await logger.awarning(
+            "validation_testcase_not_found",
+            testcase=rule.testcase_name,
+            tool=tool_name,
+        )
+        return ValidationResult(
+            status=ValidationStatus.ERROR,
+            testcase_name=rule.testcase_name,
+            message=f"Testcase '{rule.testcase_name}' not found in registry",
+        )
+
+    async def _run_native(
+        self,
+        tool_name: str,
+        device_target: str,
+        before_state: dict | None,
+        after_state: dict | None,
+        validators: list[tuple[str, Validator]],
+    ) -> list[ValidationResult]:
+        return list(await asyncio.gather(*(
+            self._run_validator(name, validator, tool_name, device_target, before_state, after_state)
+            for name, validator in validators
+        )))
+
+    async def _run_pyats(
+        self,
+        tool_name: str,
+        targets: Sequence[tuple[str, dict | None, dict | None]],
+        validators: list[tuple[str, Validator]],
+    ) -> list[list[ValidationResult]]:
+        """Run validators through the pyATS adapter, falling back to native."""
+        try:
+            jobs = [
+                (
+                    create_pyats_job(tool_name, device_target, [v for _, v in validators]),
+                    before_state,
+                    after_state,
+                )
+                for device_target, before_state, after_state in targets
+            ]
+            return await run_pyats_batch(jobs)
+        except PyATSNotAvailable:
+            await logger.awarning("pyats_not_available_fallback_native")
+        except Exception as exc:
+            await logger.aerror("pyats_validation_error", error=str(exc))
+
+        # Fallback to native validation
+        return list(await asyncio.gather(*(
+            self._run_native(tool_name, device_target, before_state, after_state, validators)
+            for device_target, before_state, after_state in targets
+        )))
 
     def has_failures(self, results: list[ValidationResult]) -> bool:
         """Check if any required validation failed."""
-        for result in results:
-            if result.status == ValidationStatus.FAIL:
-                # Check if the rule is required
-                for rule in self._rules:
-                    if rule.testcase_name == result.testcase_name and rule.required:
-                        return True
-        return False
+        return any(
+            r.status == ValidationStatus.FAIL and r.testcase_name in self._index.required_testcases
+            for r in results
+        )
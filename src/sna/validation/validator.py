@@ -9,8 +9,26 @@ from __future__ import annotations
 
 import abc
 import enum
+import sys
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from types import MappingProxyType
+from typing import Any, ClassVar
+
+# Timestamp shared by every result created inside a shared_timestamp() block
+_run_timestamp: ContextVar[datetime | None] = ContextVar("validation_run_timestamp", default=None)
+# SKIP results built during the current block, keyed by (testcase_name, message)
+_run_skips: ContextVar[dict[tuple[str, str], ValidationResult] | None] = ContextVar(
+    "validation_run_skips", default=None
+)
+# Derived data shared by the validators of the current block (e.g. parsed output)
+_run_memo: ContextVar[dict[Any, Any] | None] = ContextVar("validation_run_memo", default=None)
+
+# Read-only default for results without details — shared, never allocated per result
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
 
 
 class ValidationStatus(str, enum.Enum):
@@ -22,17 +40,83 @@ class ValidationStatus(str, enum.Enum):
     ERROR = "ERROR"
 
 
-@dataclass(frozen=True)
+def _result_timestamp() -> datetime:
+    return _run_timestamp.get() or datetime.now(UTC)
+
+
+@contextmanager
+def shared_timestamp() -> Iterator[datetime]:
+    """Stamp every ValidationResult created in this context with one timestamp.
+
+    Used by the engine so all results from one run share a batch timestamp
+    instead of reading the clock per result. Tasks started inside the block
+    inherit it.
+    """
+    now = datetime.now(UTC)
+    token = _run_timestamp.set(now)
+    skips_token = _run_skips.set({})
+    memo_token = _run_memo.set({})
+    try:
+        yield now
+    finally:
+        _run_memo.reset(memo_token)
+        _run_skips.reset(skips_token)
+        _run_timestamp.reset(token)
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result from a single validation check."""
 
     status: ValidationStatus
     testcase_name: str
     message: str = ""
-    details: dict = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    details: Mapping[str, Any] = _EMPTY_DETAILS
+    timestamp: datetime = field(default_factory=_result_timestamp)
     duration_seconds: float = 0.0
 
+    def __post_init__(self) -> None:
+        # Names built at runtime (e.g. from a class name) are not interned
+        # automatically; interning keeps rule/result name compares cheap.
+        object.__setattr__(self, "testcase_name", sys.intern(self.testcase_name))
+
+
+def skip_result(testcase_name: str, message: str) -> ValidationResult:
+    """Return a SKIP result for a constant message.
+
+    Inside a shared_timestamp() block the result is cached for that run, so
+    repeated skips (dry runs, missing state across many devices) return the
+    same immutable object instead of building a new one each time. The
+    cache is dropped when the block exits. Module-level constants would not
+    work: each run stamps its results with its own timestamp.
+    """
+    skips = _run_skips.get()
+    if skips is None:
+        return ValidationResult(
+            status=ValidationStatus.SKIP,
+            testcase_name=testcase_name,
+            message=message,
+        )
+    key = (testcase_name, message)
+    result = skips.get(key)
+    if result is None:
+        result = skips[key] = ValidationResult(
+            status=ValidationStatus.SKIP,
+            testcase_name=testcase_name,
+            message=message,
+        )
+    return result
+
+
+def run_memo() -> dict[Any, Any] | None:
+    """Return the memo dict of the current shared_timestamp() block, or None.
+
+    Validators in one run share it to compute derived data once, such as
+    show output that several validators parse. It is dropped when the
+    block exits.
+    """
+    return _run_memo.get()
+
 
 class Validator(abc.ABC):
     """Abstract base class for post-change validators.
@@ -40,8 +124,13 @@ class Validator(abc.ABC):
     Subclasses implement validate() to check that a change was successful.
     The framework calls validate() after device execution and triggers
     rollback if validation fails.
+
+    Set CACHEABLE = True on validators whose result depends only on their
+    arguments; the engine may then reuse results for identical calls.
     """
 
+    CACHEABLE: ClassVar[bool] = False
+
     @abc.abstractmethod
     async def validate(
         self,
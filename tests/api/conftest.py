@@ -1,91 +1,174 @@
 """Shared fixtures for API route tests.
 
 Provides:
-- A configured FastAPI test app with in-memory SQLite
+- A configured FastAPI test app with in-memory SQLite. The app, schema and
+  policy are built once per session; each test runs in a rolled-back
+  transaction with a fresh PolicyEngine.
 - An httpx AsyncClient pointed at the test app
+- app_client_fixtures() to build the same app/client pair for modules that
+  need their own Settings
 - Pre-configured auth headers
 """
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any
 
 import pytest
-from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from sna.api.app import create_app
 from sna.config import Settings
-from sna.db.models import Base
 from sna.policy.engine import PolicyEngine
-from sna.policy.loader import load_policy
+from sna.policy.models import PolicyConfig
+from tests.conftest import asgi_client, savepoint_session_factory
 
 TEST_API_KEY = "test-api-key-12345-abcdefghijklmnop"
 TEST_ADMIN_KEY = "test-admin-key-67890-abcdefghijklm"
+AUTH_HEADERS = {"Authorization": f"Bearer {TEST_API_KEY}"}
+ADMIN_HEADERS = {"Authorization": f"Bearer {TEST_ADMIN_KEY}"}
 SAMPLE_POLICY = "policies/default.yaml"
 
 
-@pytest.fixture
-async def test_settings(tmp_path) -> Settings:
-    """Create test Settings with in-memory SQLite and test API keys."""
-    return Settings(
-        database_url="sqlite+aiosqlite:///:memory:",
-        policy_file_path=SAMPLE_POLICY,
-        sna_api_key=TEST_API_KEY,
-        sna_admin_api_key=TEST_ADMIN_KEY,
-        default_eas=0.1,
-        log_level="WARNING",
-        log_format="console",
-        cors_allowed_origins="http://localhost:3000",
-        rate_limit_evaluate=1000,
-        rate_limit_escalation_decision=1000,
-        rate_limit_policy_reload=1000,
-    )
-
-
-@pytest.fixture
-async def test_app(test_settings: Settings) -> AsyncGenerator[object, None]:
-    """Create a test FastAPI app with all dependencies initialized."""
-    app = create_app(settings=test_settings)
-
-    # Manually run lifespan startup
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    session_factory = async_sessionmaker(engine, expire_on_commit=False)
-    policy = await load_policy(test_settings.policy_file_path)
-    policy_engine = PolicyEngine(
-        policy=policy,
-        session_factory=session_factory,
-        initial_eas=test_settings.default_eas,
-    )
-
-    app.state.db_engine = engine
-    app.state.session_factory = session_factory
-    app.state.engine = policy_engine
-    app.state.settings = test_settings
-
-    yield app
-
-    await engine.dispose()
-
-
-@pytest.fixture
-async def client(test_app) -> AsyncGenerator[AsyncClient, None]:
-    """Provide an httpx AsyncClient for the test app."""
-    transport = ASGITransport(app=test_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
-
-
-@pytest.fixture
+@asynccontextmanager
+async def rolled_back_app_state(
+    app: FastAPI,
+    policy: PolicyConfig,
+    settings: Settings,
+) -> AsyncIterator[FastAPI]:
+    """Attach a fresh PolicyEngine and a per-test DB transaction to a shared app.
+
+    Uses the engine already on app.state.db_engine — no second engine is
+    created. See savepoint_session_factory for the rollback mechanics.
+    """
+    async with savepoint_session_factory(app.state.db_engine) as session_factory:
+        app.state.session_factory = session_factory
+        app.state.engine = PolicyEngine(
+            policy=policy,
+            session_factory=session_factory,
+            initial_eas=settings.default_eas,
+        )
+
+        yield app
+
+
+TEST_SETTINGS = Settings(
+    database_url="sqlite+aiosqlite:///:memory:",
+    policy_file_path=SAMPLE_POLICY,
+    sna_api_key=TEST_API_KEY,
+    sna_admin_api_key=TEST_ADMIN_KEY,
+    default_eas=0.1,
+    log_level="WARNING",
+    log_format="console",
+    cors_allowed_origins="http://localhost:3000",
+    rate_limit_evaluate=1000,
+    rate_limit_escalation_decision=1000,
+    rate_limit_policy_reload=1000,
+)
+
+
+class _SessionApps:
+    """Apps and clients built once per session, one pair per Settings object.
+
+    ASGITransport does not run the lifespan, so the session engine is the
+    only one created and app.state.settings is already set by create_app.
+    """
+
+    def __init__(self, db_engine: AsyncEngine, stack: AsyncExitStack) -> None:
+        self._db_engine = db_engine
+        self._stack = stack
+        self._pairs: dict[int, tuple[FastAPI, AsyncClient]] = {}
+
+    def get(self, settings: Settings) -> tuple[FastAPI, AsyncClient]:
+        # Settings objects are module constants, so their ids stay unique
+        pair = self._pairs.get(id(settings))
+        if pair is None:
+            app = create_app(settings=settings)
+            app.state.db_engine = self._db_engine
+            client = asgi_client(app)
+            self._stack.push_async_callback(client.aclose)
+            pair = self._pairs[id(settings)] = (app, client)
+        return pair
+
+
+@pytest.fixture(scope="session")
+async def _session_apps(test_db_engine: AsyncEngine) -> AsyncGenerator[_SessionApps, None]:
+    """Shared app/client registry; clients close when the session ends."""
+    async with AsyncExitStack() as stack:
+        yield _SessionApps(test_db_engine, stack)
+
+
+def app_client_fixtures(
+    settings: Settings,
+    app_name: str,
+    client_name: str,
+    configure: Callable[[FastAPI], None] | None = None,
+) -> tuple[Any, Any]:
+    """Build the (app, client) fixture pair for one Settings object.
+
+    The app and client are created once per session; each test gets the
+    app with a fresh PolicyEngine and a per-test DB transaction, and the
+    client with its cookies cleared. Assign the pair to module names so
+    pytest collects them.
+
+    Args:
+        settings: Settings the app is created with.
+        app_name: Fixture name for the per-test app.
+        client_name: Fixture name for the per-test client.
+        configure: Optional hook applied to the app after per-test state is attached.
+    """
+
+    @pytest.fixture(name=app_name)
+    async def app_fixture(
+        _session_apps: _SessionApps,
+        test_policy: PolicyConfig,
+    ) -> AsyncGenerator[FastAPI, None]:
+        session_app, _ = _session_apps.get(settings)
+        async with rolled_back_app_state(session_app, test_policy, settings) as app:
+            if configure is not None:
+                configure(app)
+            yield app
+
+    @pytest.fixture(name=client_name)
+    def client_fixture(
+        request: pytest.FixtureRequest,
+        _session_apps: _SessionApps,
+    ) -> AsyncClient:
+        # The client is only useful once the per-test app state is attached
+        request.getfixturevalue(app_name)
+        _, session_client = _session_apps.get(settings)
+        session_client.cookies.clear()
+        return session_client
+
+    return app_fixture, client_fixture
+
+
+@pytest.fixture(scope="session")
+def test_settings() -> Settings:
+    """Test Settings with in-memory SQLite and test API keys."""
+    return TEST_SETTINGS
+
+
+@pytest.fixture(scope="session")
+def test_policy(default_policy: PolicyConfig) -> PolicyConfig:
+    """The sample policy, shared with the rest of the suite."""
+    return default_policy
+
+
+test_app, client = app_client_fixtures(TEST_SETTINGS, "test_app", "client")
+
+
+@pytest.fixture(scope="session")
 def auth_headers() -> dict[str, str]:
-    """Standard API key auth headers."""
-    return {"Authorization": f"Bearer {TEST_API_KEY}"}
+    """Standard API key auth headers. Shared — copy before modifying."""
+    return AUTH_HEADERS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def admin_headers() -> dict[str, str]:
-    """Admin API key auth headers."""
-    return {"Authorization": f"Bearer {TEST_ADMIN_KEY}"}
+    """Admin API key auth headers. Shared — copy before modifying."""
+    return ADMIN_HEADERS
@@ -2,9 +2,25 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 from httpx import AsyncClient
 
+# Read-only evaluate request used by the agent auth tests, encoded once
+EVALUATE_SHOW_INTERFACES = json.dumps({
+    "tool_name": "show_interfaces",
+    "parameters": {},
+    "device_targets": ["switch-01"],
+    "confidence_score": 0.99,
+    "context": {},
+}).encode()
+
+
+def _agent_headers(agent_key: str) -> dict[str, str]:
+    """Headers for posting a pre-encoded JSON body as an agent."""
+    return {"Authorization": f"Bearer {agent_key}", "Content-Type": "application/json"}
+
 
 class TestAgentRegistration:
     """POST /agents — register new agent."""
@@ -71,68 +87,72 @@ class TestAgentAuthentication:
         # Use agent key to call /evaluate
         response = await client.post(
             "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "parameters": {},
-                "device_targets": ["switch-01"],
-                "confidence_score": 0.99,
-                "context": {},
-            },
-            headers={"Authorization": f"Bearer {agent_key}"},
+            content=EVALUATE_SHOW_INTERFACES,
+            headers=_agent_headers(agent_key),
         )
         assert response.status_code == 200
         assert response.json()["verdict"] == "PERMIT"
 
 
+@pytest.fixture
+async def registered_agent(
+    client: AsyncClient, admin_headers: dict
+) -> tuple[str, str]:
+    """Register one agent and return its (external_id, api_key)."""
+    reg = await client.post(
+        "/agents",
+        json={"name": "lifecycle-agent"},
+        headers=admin_headers,
+    )
+    assert reg.status_code == 201
+    return reg.json()["external_id"], reg.json()["api_key"]
+
+
 class TestAgentLifecycle:
     """Agent suspend, activate, revoke lifecycle."""
 
-    async def test_suspend_blocks_requests(
-        self, client: AsyncClient, admin_headers: dict
+    @pytest.mark.parametrize(
+        ("action", "agent_status", "expected_status"),
+        [
+            ("suspend", "SUSPENDED", 403),
+            ("revoke", "REVOKED", 401),
+        ],
+    )
+    async def test_disabled_agent_blocked(
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        registered_agent: tuple[str, str],
+        action: str,
+        agent_status: str,
+        expected_status: int,
     ) -> None:
-        """Suspended agent should get 403."""
-        # Register
-        reg = await client.post(
-            "/agents",
-            json={"name": "suspend-agent"},
-            headers=admin_headers,
-        )
-        agent_key = reg.json()["api_key"]
-        agent_id = reg.json()["external_id"]
+        """Suspended agents get 403; revoked agents cannot authenticate (401)."""
+        agent_id, agent_key = registered_agent
 
-        # Suspend
         resp = await client.post(
-            f"/agents/{agent_id}/suspend",
+            f"/agents/{agent_id}/{action}",
             headers=admin_headers,
         )
         assert resp.status_code == 200
-        assert resp.json()["status"] == "SUSPENDED"
+        assert resp.json()["status"] == agent_status
 
         # Try to authenticate
         response = await client.post(
             "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "parameters": {},
-                "device_targets": [],
-                "confidence_score": 0.99,
-                "context": {},
-            },
-            headers={"Authorization": f"Bearer {agent_key}"},
+            content=EVALUATE_SHOW_INTERFACES,
+            headers=_agent_headers(agent_key),
         )
-        assert response.status_code == 403
+        assert response.status_code == expected_status
 
     async def test_reactivate_agent(
-        self, client: AsyncClient, admin_headers: dict
+        self,
+        client: AsyncClient,
+        admin_headers: dict,
+        registered_agent: tuple[str, str],
     ) -> None:
         """Reactivated agent should work again."""
-        reg = await client.post(
-            "/agents",
-            json={"name": "reactivate-agent"},
-            headers=admin_headers,
-        )
-        agent_id = reg.json()["external_id"]
-        agent_key = reg.json()["api_key"]
+        agent_id, agent_key = registered_agent
 
         # Suspend then activate
         await client.post(f"/agents/{agent_id}/suspend", headers=admin_headers)
@@ -141,46 +161,11 @@ class TestAgentLifecycle:
         # Should work again
         response = await client.post(
             "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "parameters": {},
-                "device_targets": ["sw1"],
-                "confidence_score": 0.99,
-                "context": {},
-            },
-            headers={"Authorization": f"Bearer {agent_key}"},
+            content=EVALUATE_SHOW_INTERFACES,
+            headers=_agent_headers(agent_key),
         )
         assert response.status_code == 200
 
-    async def test_revoke_permanently_disables(
-        self, client: AsyncClient, admin_headers: dict
-    ) -> None:
-        """Revoked agent cannot authenticate."""
-        reg = await client.post(
-            "/agents",
-            json={"name": "revoke-agent"},
-            headers=admin_headers,
-        )
-        agent_key = reg.json()["api_key"]
-        agent_id = reg.json()["external_id"]
-
-        # Revoke
-        await client.post(f"/agents/{agent_id}/revoke", headers=admin_headers)
-
-        # Try to authenticate — should fail
-        response = await client.post(
-            "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "parameters": {},
-                "device_targets": [],
-                "confidence_score": 0.99,
-                "context": {},
-            },
-            headers={"Authorization": f"Bearer {agent_key}"},
-        )
-        assert response.status_code == 401
-
 
 class TestAgentListing:
     """GET /agents and GET /agents/{id} tests."""
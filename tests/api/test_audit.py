@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import base64
+from datetime import UTC, datetime, timedelta, timezone
+
 import pytest
 from httpx import AsyncClient
 
 
+def _cursor(raw: str) -> str:
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
 class TestAuditEndpoint:
     """GET /audit — paginated audit log."""
 
@@ -78,6 +85,85 @@ class TestAuditEndpoint:
         assert data["page"] == 1
         assert data["page_size"] == 5
 
+    async def test_audit_keyset_cursor(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        """next_cursor pages through entries newest-first without overlap."""
+        for tool in ("show_interfaces", "show_version", "show_ip_route"):
+            await client.post(
+                "/evaluate",
+                json={
+                    "tool_name": tool,
+                    "parameters": {},
+                    "device_targets": ["switch-01"],
+                    "confidence_score": 0.99,
+                    "context": {},
+                },
+                headers=auth_headers,
+            )
+
+        first = (await client.get("/audit?page_size=2", headers=auth_headers)).json()
+        assert len(first["items"]) == 2
+        assert first["next_cursor"] is not None
+
+        response = await client.get(
+            "/audit",
+            params={"page_size": 2, "cursor": first["next_cursor"]},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        second = response.json()
+        assert len(second["items"]) == 1
+        assert second["next_cursor"] is None
+
+        ids = [e["external_id"] for e in first["items"] + second["items"]]
+        assert len(set(ids)) == 3
+        timestamps = [e["timestamp"] for e in first["items"] + second["items"]]
+        assert timestamps == sorted(timestamps, reverse=True)
+
+    async def test_audit_invalid_cursor(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        response = await client.get("/audit?cursor=not-a-cursor", headers=auth_headers)
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("record_id", ["9" * 30, str(2**63), "0", "-1"])
+    async def test_audit_cursor_id_out_of_range(
+        self, client: AsyncClient, auth_headers: dict, record_id: str
+    ) -> None:
+        cursor = _cursor(f"2026-01-01T00:00:00|{record_id}")
+        response = await client.get("/audit", params={"cursor": cursor}, headers=auth_headers)
+        assert response.status_code == 400
+
+    async def test_audit_cursor_offset_normalised_to_utc(
+        self, client: AsyncClient, auth_headers: dict
+    ) -> None:
+        """A cursor with a UTC offset seeks from the same instant as the UTC one."""
+        for tool in ("show_interfaces", "show_version", "show_ip_route"):
+            await client.post(
+                "/evaluate",
+                json={"tool_name": tool, "confidence_score": 0.99},
+                headers=auth_headers,
+            )
+        first = (await client.get("/audit?page_size=2", headers=auth_headers)).json()
+        raw = base64.urlsafe_b64decode(first["next_cursor"]).decode()
+        timestamp, _, record_id = raw.rpartition("|")
+        shifted = (
+            datetime.fromisoformat(timestamp)
+            .replace(tzinfo=UTC)
+            .astimezone(timezone(timedelta(hours=5)))
+        )
+
+        pages = []
+        for cursor in (first["next_cursor"], _cursor(f"{shifted.isoformat()}|{record_id}")):
+            response = await client.get(
+                "/audit", params={"page_size": 2, "cursor": cursor}, headers=auth_headers,
+            )
+            assert response.status_code == 200
+            pages.append([e["external_id"] for e in response.json()["items"]])
+        assert len(pages[0]) == 1
+        assert pages[0] == pages[1]
+
     async def test_audit_page_size_limit(
         self, client: AsyncClient, auth_headers: dict
     ) -> None:
@@ -4,62 +4,32 @@ from __future__ import annotations
 
 import bcrypt
 import pytest
-from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from httpx import AsyncClient
 
-from sna.api.app import create_app
 from sna.config import Settings
-from sna.db.models import Agent, Base
-from sna.policy.engine import PolicyEngine
-from sna.policy.loader import load_policy
+from sna.db.models import Agent
+from tests.api.conftest import app_client_fixtures
 
 TEST_API_KEY = "auth-test-api-key-abcdefghijklmnop"
 TEST_ADMIN_KEY = "auth-test-admin-key-abcdefghijklm"
+ADMIN_HEADERS = {"Authorization": f"Bearer {TEST_ADMIN_KEY}"}
 
 
-@pytest.fixture
-async def auth_app():
-    """Create an app with agents for auth testing."""
-    settings = Settings(
-        database_url="sqlite+aiosqlite:///:memory:",
-        policy_file_path="policies/default.yaml",
-        sna_api_key=TEST_API_KEY,
-        sna_admin_api_key=TEST_ADMIN_KEY,
-        default_eas=0.1,
-        log_level="WARNING",
-        log_format="console",
-        rate_limit_evaluate=1000,
-        rate_limit_escalation_decision=1000,
-        rate_limit_policy_reload=1000,
-    )
-    app = create_app(settings=settings)
-
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    session_factory = async_sessionmaker(engine, expire_on_commit=False)
-    policy = await load_policy(settings.policy_file_path)
-    policy_engine = PolicyEngine(
-        policy=policy,
-        session_factory=session_factory,
-        initial_eas=settings.default_eas,
-    )
-
-    app.state.db_engine = engine
-    app.state.session_factory = session_factory
-    app.state.engine = policy_engine
-    app.state.settings = settings
-
-    yield app
-    await engine.dispose()
-
-
-@pytest.fixture
-async def auth_client(auth_app) -> AsyncClient:
-    transport = ASGITransport(app=auth_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+AUTH_SETTINGS = Settings(
+    database_url="sqlite+aiosqlite:///:memory:",
+    policy_file_path="policies/default.yaml",
+    sna_api_key=TEST_API_KEY,
+    sna_admin_api_key=TEST_ADMIN_KEY,
+    default_eas=0.1,
+    log_level="WARNING",
+    log_format="console",
+    rate_limit_evaluate=1000,
+    rate_limit_escalation_decision=1000,
+    rate_limit_policy_reload=1000,
+)
+
+
+auth_app, auth_client = app_client_fixtures(AUTH_SETTINGS, "auth_app", "auth_client")
 
 
 class TestAgentAuthPrefixLookup:
@@ -73,14 +43,14 @@ class TestAgentAuthPrefixLookup:
         response = await auth_client.post(
             "/agents",
             json={"name": "prefix-test-agent"},
-            headers={"Authorization": f"Bearer {TEST_ADMIN_KEY}"},
+            headers=ADMIN_HEADERS,
         )
         assert response.status_code == 201
         agent_key = response.json()["api_key"]
 
         # Verify the agent was created with a prefix
         session_factory = auth_app.state.session_factory
-        from sqlalchemy import select
+        from sqlalchemy import select, text
 
         async with session_factory() as session:
             result = await session.execute(
@@ -90,6 +60,14 @@ class TestAgentAuthPrefixLookup:
             assert agent.api_key_prefix == agent_key[:8]
             assert len(agent.api_key_prefix) == 8
 
+            # The lookup must be an index search, not a scan of every agent
+            plan = await session.execute(
+                text("EXPLAIN QUERY PLAN SELECT * FROM agent WHERE api_key_prefix = :prefix"),
+                {"prefix": agent.api_key_prefix},
+            )
+            detail = " ".join(row[-1] for row in plan)
+            assert "USING INDEX ix_agent_api_key_prefix" in detail
+
         # Auth with the agent key should work
         response = await auth_client.get(
             "/health",
@@ -103,7 +81,7 @@ class TestAgentAuthPrefixLookup:
         """Agents with empty prefix (pre-migration) should still auth via full scan."""
         # Manually create an agent with empty prefix (simulating pre-migration)
         agent_key = "pre-migration-agent-key-for-testing-abc"
-        key_hash = bcrypt.hashpw(agent_key.encode(), bcrypt.gensalt()).decode()
+        key_hash = bcrypt.hashpw(agent_key.encode(), bcrypt.gensalt(rounds=4)).decode()
 
         session_factory = auth_app.state.session_factory
         async with session_factory() as session:
@@ -121,3 +99,40 @@ class TestAgentAuthPrefixLookup:
             headers={"Authorization": f"Bearer {agent_key}"},
         )
         assert response.status_code == 200
+
+
+class TestAgentKeyVerificationCache:
+    """Successful bcrypt verifications are memoized per (key, hash)."""
+
+    async def test_repeat_auth_skips_bcrypt(
+        self, auth_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        reg = await auth_client.post(
+            "/agents", json={"name": "cached-agent"}, headers=ADMIN_HEADERS
+        )
+        agent_id = reg.json()["external_id"]
+        agent_headers = {"Authorization": f"Bearer {reg.json()['api_key']}"}
+
+        calls = []
+        real_checkpw = bcrypt.checkpw
+
+        def counting_checkpw(password: bytes, hashed: bytes) -> bool:
+            calls.append(hashed)
+            return real_checkpw(password, hashed)
+
+        monkeypatch.setattr(bcrypt, "checkpw", counting_checkpw)
+
+        for _ in range(3):
+            response = await auth_client.get("/health", headers=agent_headers)
+            assert response.status_code == 200
+        assert len(calls) == 1
+
+        # Status is read fresh on every request, so a cached key is still refused
+        await auth_client.post(f"/agents/{agent_id}/suspend", headers=ADMIN_HEADERS)
+        response = await auth_client.get("/health", headers=agent_headers)
+        assert response.status_code == 403
+
+        # Revocation replaces the hash, so the cached pair no longer matches
+        await auth_client.post(f"/agents/{agent_id}/revoke", headers=ADMIN_HEADERS)
+        response = await auth_client.get("/health", headers=agent_headers)
+        assert response.status_code == 401
@@ -4,66 +4,40 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, patch
 
-import pytest
-from httpx import ASGITransport, AsyncClient
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from fastapi import FastAPI
+from httpx import AsyncClient
 
-from sna.api.app import create_app
 from sna.config import Settings
-from sna.db.models import Base
-from sna.policy.engine import PolicyEngine
-from sna.policy.loader import load_policy
 from sna.policy.models import EvaluationResult, RiskTier, Verdict
+from tests.api.conftest import app_client_fixtures
 
 TEST_API_KEY = "test-batch-api-key-abcdefghijklmnop"
 TEST_ADMIN_KEY = "test-batch-admin-key-abcdefghijklm"
+ADMIN_HEADERS = {"Authorization": f"Bearer {TEST_ADMIN_KEY}"}
 
 
-@pytest.fixture
-async def batch_app():
-    """Create a test app with a mock policy engine for batch tests."""
-    settings = Settings(
-        database_url="sqlite+aiosqlite:///:memory:",
-        policy_file_path="policies/default.yaml",
-        sna_api_key=TEST_API_KEY,
-        sna_admin_api_key=TEST_ADMIN_KEY,
-        default_eas=0.1,
-        log_level="WARNING",
-        log_format="console",
-        rate_limit_evaluate=1000,
-        rate_limit_escalation_decision=1000,
-        rate_limit_policy_reload=1000,
-        rate_limit_batch=1000,
-    )
-    app = create_app(settings=settings)
-
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    session_factory = async_sessionmaker(engine, expire_on_commit=False)
-    policy = await load_policy(settings.policy_file_path)
-    policy_engine = PolicyEngine(
-        policy=policy,
-        session_factory=session_factory,
-        initial_eas=settings.default_eas,
-    )
-
-    app.state.db_engine = engine
-    app.state.session_factory = session_factory
-    app.state.engine = policy_engine
-    app.state.settings = settings
-    app.state.batch_executor = AsyncMock()
+BATCH_SETTINGS = Settings(
+    database_url="sqlite+aiosqlite:///:memory:",
+    policy_file_path="policies/default.yaml",
+    sna_api_key=TEST_API_KEY,
+    sna_admin_api_key=TEST_ADMIN_KEY,
+    default_eas=0.1,
+    log_level="WARNING",
+    log_format="console",
+    rate_limit_evaluate=1000,
+    rate_limit_escalation_decision=1000,
+    rate_limit_policy_reload=1000,
+    rate_limit_batch=1000,
+)
+
 
-    yield app
-    await engine.dispose()
+def _mock_batch_executor(app: FastAPI) -> None:
+    app.state.batch_executor = AsyncMock()
 
 
-@pytest.fixture
-async def batch_client(batch_app) -> AsyncClient:
-    transport = ASGITransport(app=batch_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
+batch_app, batch_client = app_client_fixtures(
+    BATCH_SETTINGS, "batch_app", "batch_client", configure=_mock_batch_executor,
+)
 
 
 class TestBatchPolicyEvaluation:
@@ -119,17 +93,21 @@ class TestBatchPolicyEvaluation:
                 "confidence_score": 0.5,
                 "context": {},
             },
-            headers={"Authorization": f"Bearer {TEST_ADMIN_KEY}"},
+            headers=ADMIN_HEADERS,
         )
 
         assert response.status_code == 403
-        assert "BLOCK" in response.json()["detail"]
-        assert "configure_bgp_neighbor" in response.json()["detail"]
+        detail = response.json()["detail"]
+        assert "BLOCK" in detail
+        assert "configure_bgp_neighbor" in detail
 
     async def test_batch_evaluates_all_tools(
         self, batch_app, batch_client: AsyncClient
     ) -> None:
-        """Policy engine should be called once per unique tool in batch."""
+        """Policy engine should be called once per unique tool in batch.
+
+        Repeats of a tool on other devices reuse the same verdict.
+        """
         evaluated_tools = []
         original_evaluate = batch_app.state.engine.evaluate
 
@@ -150,8 +128,8 @@ class TestBatchPolicyEvaluation:
             return_value=AsyncMock(
                 batch_id="test-batch",
                 items=[],
-                total=2,
-                succeeded=2,
+                total=3,
+                succeeded=3,
                 failed=0,
                 rolled_back=0,
                 duration_seconds=0.1,
@@ -172,13 +150,18 @@ class TestBatchPolicyEvaluation:
                         "tool_name": "configure_vlan",
                         "params": {},
                     },
+                    {
+                        "device_target": "switch-03",
+                        "tool_name": "show_interfaces",
+                        "params": {"interface": "Gi0/1"},
+                    },
                 ],
                 "confidence_score": 0.99,
                 "context": {},
             },
-            headers={"Authorization": f"Bearer {TEST_ADMIN_KEY}"},
+            headers=ADMIN_HEADERS,
         )
 
         assert "configure_vlan" in evaluated_tools
         assert "show_interfaces" in evaluated_tools
-        assert len(evaluated_tools) == 2
+        assert len(evaluated_tools) == len(set(evaluated_tools)) == 2
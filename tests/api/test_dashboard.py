@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import AsyncGenerator
 from pathlib import Path
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from fastapi import FastAPI
+from httpx import AsyncClient
 
 from sna.api.app import create_app
 from sna.config import Settings
+from tests.conftest import asgi_client
 
 
-@pytest.fixture
-def dashboard_dir(tmp_path: Path) -> Path:
-    """Create a fake dashboard build directory."""
-    dist = tmp_path / "dashboard" / "dist"
+@pytest.fixture(scope="session")
+def dashboard_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a fake dashboard build directory. Read-only, so shared by the session."""
+    dist = tmp_path_factory.mktemp("dashboard") / "dist"
     dist.mkdir(parents=True)
     (dist / "index.html").write_text("<!DOCTYPE html><html><body>SNA Dashboard</body></html>")
     assets = dist / "assets"
@@ -25,96 +29,127 @@ def dashboard_dir(tmp_path: Path) -> Path:
 
 def _make_client(settings: Settings) -> AsyncClient:
     """Create an AsyncClient for a given Settings."""
-    app = create_app(settings)
-    transport = ASGITransport(app=app)
-    return AsyncClient(transport=transport, base_url="http://test")
+    return asgi_client(create_app(settings))
+
+
+@pytest.fixture(scope="session")
+def dashboard_settings(dashboard_dir: Path) -> Settings:
+    """Settings with the dashboard enabled. Variants use model_copy(update=...)."""
+    return Settings(
+        sna_api_key="a" * 32,
+        sna_admin_api_key="b" * 32,
+        dashboard_enabled=True,
+        dashboard_static_path=str(dashboard_dir),
+    )
+
+
+@pytest.fixture(scope="module")
+def dashboard_app(dashboard_settings: Settings) -> FastAPI:
+    """One app with the dashboard enabled, shared by the tests that serve it."""
+    return create_app(dashboard_settings)
+
+
+@pytest.fixture(scope="module")
+async def dashboard_client(dashboard_app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    """One client for the shared dashboard app."""
+    async with asgi_client(dashboard_app) as client:
+        yield client
 
 
 class TestDashboardServing:
     """Dashboard static file serving."""
 
-    async def test_dashboard_index(self, dashboard_dir: Path) -> None:
+    async def test_dashboard_index(self, dashboard_client: AsyncClient) -> None:
         """GET /dashboard/ serves index.html."""
-        settings = Settings(
-            sna_api_key="a" * 32,
-            sna_admin_api_key="b" * 32,
-            dashboard_enabled=True,
-            dashboard_static_path=str(dashboard_dir),
-        )
-        async with _make_client(settings) as client:
-            response = await client.get("/dashboard/")
-            assert response.status_code == 200
-            assert "SNA Dashboard" in response.text
+        response = await dashboard_client.get("/dashboard/")
+        assert response.status_code == 200
+        assert "SNA Dashboard" in response.text
 
-    async def test_dashboard_spa_fallback(self, dashboard_dir: Path) -> None:
+    async def test_dashboard_spa_fallback(self, dashboard_client: AsyncClient) -> None:
         """SPA routes (no extension) serve index.html."""
-        settings = Settings(
-            sna_api_key="a" * 32,
-            sna_admin_api_key="b" * 32,
-            dashboard_enabled=True,
-            dashboard_static_path=str(dashboard_dir),
-        )
-        async with _make_client(settings) as client:
-            response = await client.get("/dashboard/escalations")
-            assert response.status_code == 200
-            assert "SNA Dashboard" in response.text
+        response = await dashboard_client.get("/dashboard/escalations")
+        assert response.status_code == 200
+        assert "SNA Dashboard" in response.text
 
-    async def test_dashboard_path_traversal_blocked(self, dashboard_dir: Path) -> None:
+    async def test_dashboard_path_traversal_blocked(self, dashboard_client: AsyncClient) -> None:
         """Path traversal attempts are blocked."""
-        settings = Settings(
-            sna_api_key="a" * 32,
-            sna_admin_api_key="b" * 32,
-            dashboard_enabled=True,
-            dashboard_static_path=str(dashboard_dir),
-        )
-        async with _make_client(settings) as client:
-            response = await client.get("/dashboard/../../etc/passwd")
-            assert response.status_code in (400, 404)
+        response = await dashboard_client.get("/dashboard/../../etc/passwd")
+        assert response.status_code in (400, 404)
 
-    async def test_csp_headers_on_dashboard(self, dashboard_dir: Path) -> None:
+    async def test_csp_headers_on_dashboard(self, dashboard_client: AsyncClient) -> None:
         """Dashboard responses include CSP headers."""
-        settings = Settings(
-            sna_api_key="a" * 32,
-            sna_admin_api_key="b" * 32,
-            dashboard_enabled=True,
-            dashboard_static_path=str(dashboard_dir),
-        )
-        async with _make_client(settings) as client:
-            response = await client.get("/dashboard/")
-            csp = response.headers.get("content-security-policy", "")
-            assert "default-src 'self'" in csp
-            assert "script-src 'self'" in csp
+        response = await dashboard_client.get("/dashboard/")
+        csp = response.headers.get("content-security-policy", "")
+        assert "default-src 'self'" in csp
+        assert "script-src 'self'" in csp
 
-    async def test_dashboard_disabled(self) -> None:
+    async def test_dashboard_disabled(self, dashboard_settings: Settings) -> None:
         """When dashboard_enabled=False, /dashboard returns 404."""
-        settings = Settings(
-            sna_api_key="a" * 32,
-            sna_admin_api_key="b" * 32,
-            dashboard_enabled=False,
-        )
+        settings = dashboard_settings.model_copy(update={"dashboard_enabled": False})
         async with _make_client(settings) as client:
             response = await client.get("/dashboard/")
             assert response.status_code == 404
 
-    async def test_dashboard_missing_dir(self) -> None:
+    async def test_dashboard_missing_dir(self, dashboard_settings: Settings) -> None:
         """When dashboard dir doesn't exist, no crash at startup."""
-        settings = Settings(
-            sna_api_key="a" * 32,
-            sna_admin_api_key="b" * 32,
-            dashboard_enabled=True,
-            dashboard_static_path="/nonexistent/path",
+        settings = dashboard_settings.model_copy(
+            update={"dashboard_static_path": "/nonexistent/path"}
         )
         app = create_app(settings)
         assert app is not None
 
-    async def test_dashboard_nonexistent_file(self, dashboard_dir: Path) -> None:
+    async def test_dashboard_nonexistent_file(self, dashboard_client: AsyncClient) -> None:
         """Requesting a nonexistent file returns 404."""
-        settings = Settings(
-            sna_api_key="a" * 32,
-            sna_admin_api_key="b" * 32,
-            dashboard_enabled=True,
-            dashboard_static_path=str(dashboard_dir),
+        response = await dashboard_client.get("/dashboard/nonexistent.js")
+        assert response.status_code == 404
+
+    async def test_index_reloaded_after_rebuild(
+        self, dashboard_settings: Settings, tmp_path: Path
+    ) -> None:
+        """A rebuilt index.html is served without restarting the app."""
+        index = tmp_path / "index.html"
+        index.write_text("<html>v1</html>")
+        settings = dashboard_settings.model_copy(
+            update={"dashboard_static_path": str(tmp_path)}
         )
         async with _make_client(settings) as client:
-            response = await client.get("/dashboard/nonexistent.js")
+            assert "v1" in (await client.get("/dashboard/")).text
+            index.write_text("<html>v2</html>")
+            os.utime(index, ns=(index.stat().st_atime_ns, index.stat().st_mtime_ns + 1_000_000))
+            assert "v2" in (await client.get("/dashboard/")).text
+
+    async def test_index_has_last_modified(self, dashboard_client: AsyncClient) -> None:
+        """The cached index carries the file's mtime as Last-Modified."""
+        response = await dashboard_client.get("/dashboard/")
+        assert response.headers["last-modified"].endswith(" GMT")
+
+    async def test_index_not_a_file(
+        self, dashboard_settings: Settings, tmp_path: Path
+    ) -> None:
+        """An index.html that isn't a regular file is reported as not built."""
+        (tmp_path / "index.html").mkdir()
+        settings = dashboard_settings.model_copy(
+            update={"dashboard_static_path": str(tmp_path)}
+        )
+        async with _make_client(settings) as client:
+            response = await client.get("/dashboard/")
+            assert response.status_code == 404
+            assert response.json()["detail"] == "Dashboard not built"
+
+    async def test_index_removed_during_read(
+        self, dashboard_settings: Settings, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A file that vanishes between stat and read is reported as not built."""
+        (tmp_path / "index.html").write_text("<html>v1</html>")
+        settings = dashboard_settings.model_copy(
+            update={"dashboard_static_path": str(tmp_path)}
+        )
+
+        def vanished(self: Path) -> bytes:
+            raise FileNotFoundError(self)
+
+        monkeypatch.setattr(Path, "read_bytes", vanished)
+        async with _make_client(settings) as client:
+            response = await client.get("/dashboard/")
             assert response.status_code == 404
+            assert response.json()["detail"] == "Dashboard not built"
@@ -3,37 +3,56 @@
 from __future__ import annotations
 
 import pytest
+from fastapi import FastAPI
 from httpx import AsyncClient
 
+from sna.db.models import AuditLog, EscalationRecord
+from sna.policy.models import RiskTier, Verdict
+
+
+@pytest.fixture
+async def pending_escalation(test_app: FastAPI) -> str:
+    """Insert a PENDING escalation directly and return its external_id.
+
+    The decision tests exercise /escalation, not /evaluate, so skip the
+    policy round trip; test_list_with_pending covers that path end to end.
+    """
+    async with test_app.state.session_factory() as session:
+        async with session.begin():
+            audit_entry = AuditLog(
+                tool_name="show_interfaces",
+                device_targets=["switch-01"],
+                device_count=1,
+                verdict=Verdict.ESCALATE.value,
+                risk_tier=RiskTier.TIER_1_READ.value,
+                confidence_score=0.01,
+                confidence_threshold=0.1,
+                reason="Confidence below threshold",
+                eas_at_time=0.1,
+            )
+            session.add(audit_entry)
+            await session.flush()
+            escalation = EscalationRecord(
+                tool_name="show_interfaces",
+                risk_tier=RiskTier.TIER_1_READ.value,
+                confidence_score=0.01,
+                reason="Confidence below threshold",
+                device_targets=["switch-01"],
+                device_count=1,
+                audit_log_id=audit_entry.id,
+            )
+            session.add(escalation)
+    return escalation.external_id
+
 
 class TestEscalationDecision:
     """POST /escalation/{id}/decision — approve or reject."""
 
-    async def _create_escalation(
-        self, client: AsyncClient, auth_headers: dict
-    ) -> str:
-        """Helper: evaluate an action that triggers ESCALATE, return escalation_id."""
-        response = await client.post(
-            "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "parameters": {},
-                "device_targets": ["switch-01"],
-                "confidence_score": 0.01,
-                "context": {},
-            },
-            headers=auth_headers,
-        )
-        data = response.json()
-        assert data["verdict"] == "ESCALATE"
-        assert data["escalation_id"] is not None
-        return data["escalation_id"]
-
     async def test_approve_escalation(
-        self, client: AsyncClient, auth_headers: dict, admin_headers: dict
+        self, client: AsyncClient, admin_headers: dict, pending_escalation: str
     ) -> None:
         """Approving a pending escalation should succeed."""
-        esc_id = await self._create_escalation(client, auth_headers)
+        esc_id = pending_escalation
 
         response = await client.post(
             f"/escalation/{esc_id}/decision",
@@ -51,10 +70,10 @@ class TestEscalationDecision:
         assert data["external_id"] == esc_id
 
     async def test_reject_escalation(
-        self, client: AsyncClient, auth_headers: dict, admin_headers: dict
+        self, client: AsyncClient, admin_headers: dict, pending_escalation: str
     ) -> None:
         """Rejecting a pending escalation should succeed."""
-        esc_id = await self._create_escalation(client, auth_headers)
+        esc_id = pending_escalation
 
         response = await client.post(
             f"/escalation/{esc_id}/decision",
@@ -70,10 +89,10 @@ class TestEscalationDecision:
         assert data["status"] == "REJECTED"
 
     async def test_double_decision_conflict(
-        self, client: AsyncClient, auth_headers: dict, admin_headers: dict
+        self, client: AsyncClient, admin_headers: dict, pending_escalation: str
     ) -> None:
         """Deciding on an already-resolved escalation should return 409."""
-        esc_id = await self._create_escalation(client, auth_headers)
+        esc_id = pending_escalation
 
         # First decision
         await client.post(
@@ -114,10 +133,10 @@ class TestEscalationDecision:
         assert response.status_code == 404
 
     async def test_decision_invalid_status(
-        self, client: AsyncClient, auth_headers: dict, admin_headers: dict
+        self, client: AsyncClient, admin_headers: dict, pending_escalation: str
     ) -> None:
         """Invalid decision value should fail validation."""
-        esc_id = await self._create_escalation(client, auth_headers)
+        esc_id = pending_escalation
 
         response = await client.post(
             f"/escalation/{esc_id}/decision",
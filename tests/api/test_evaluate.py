@@ -2,9 +2,51 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 from httpx import AsyncClient
 
+# Common request bodies, JSON-encoded once at import
+PERMIT_BODY = json.dumps({
+    "tool_name": "show_interfaces",
+    "parameters": {},
+    "device_targets": ["switch-01"],
+    "confidence_score": 0.99,
+    "context": {},
+}).encode()
+ESCALATE_BODY = json.dumps({
+    "tool_name": "show_interfaces",
+    "parameters": {},
+    "device_targets": ["switch-01"],
+    "confidence_score": 0.01,
+    "context": {},
+}).encode()
+BLOCK_BODY = json.dumps({
+    "tool_name": "factory_reset",
+    "parameters": {},
+    "device_targets": ["switch-01"],
+    "confidence_score": 0.99,
+    "context": {},
+}).encode()
+# More devices than the default policy's max_devices_per_action (3)
+SCOPE_TARGETS = tuple(f"switch-{i:02d}" for i in range(5))
+SCOPE_BODY = json.dumps({
+    "tool_name": "show_interfaces",
+    "parameters": {},
+    "device_targets": SCOPE_TARGETS,
+    "confidence_score": 0.99,
+    "context": {},
+}).encode()
+JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+EVALUATE_RESPONSE_KEYS = frozenset({
+    "verdict", "risk_tier", "tool_name", "reason",
+    "confidence_score", "confidence_threshold", "device_count",
+    "requires_audit", "requires_senior_approval", "escalation_id",
+    "matched_rules",
+})
+
 
 class TestEvaluateEndpoint:
     """POST /evaluate — policy evaluation."""
@@ -13,14 +55,8 @@ class TestEvaluateEndpoint:
         """Tier 1 read action with high confidence should be PERMIT."""
         response = await client.post(
             "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "parameters": {},
-                "device_targets": ["switch-01"],
-                "confidence_score": 0.99,
-                "context": {},
-            },
-            headers=auth_headers,
+            content=PERMIT_BODY,
+            headers={**auth_headers, **JSON_CONTENT_TYPE},
         )
         assert response.status_code == 200
         data = response.json()
@@ -35,14 +71,8 @@ class TestEvaluateEndpoint:
         """Low confidence score should trigger ESCALATE."""
         response = await client.post(
             "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "parameters": {},
-                "device_targets": ["switch-01"],
-                "confidence_score": 0.01,
-                "context": {},
-            },
-            headers=auth_headers,
+            content=ESCALATE_BODY,
+            headers={**auth_headers, **JSON_CONTENT_TYPE},
         )
         assert response.status_code == 200
         data = response.json()
@@ -55,14 +85,8 @@ class TestEvaluateEndpoint:
         """Hard-blocked action should return BLOCK."""
         response = await client.post(
             "/evaluate",
-            json={
-                "tool_name": "factory_reset",
-                "parameters": {},
-                "device_targets": ["switch-01"],
-                "confidence_score": 0.99,
-                "context": {},
-            },
-            headers=auth_headers,
+            content=BLOCK_BODY,
+            headers={**auth_headers, **JSON_CONTENT_TYPE},
         )
         assert response.status_code == 200
         data = response.json()
@@ -72,90 +96,42 @@ class TestEvaluateEndpoint:
         self, client: AsyncClient, auth_headers: dict
     ) -> None:
         """Exceeding device scope limit should trigger ESCALATE."""
-        targets = [f"switch-{i:02d}" for i in range(5)]
         response = await client.post(
             "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "parameters": {},
-                "device_targets": targets,
-                "confidence_score": 0.99,
-                "context": {},
-            },
-            headers=auth_headers,
+            content=SCOPE_BODY,
+            headers={**auth_headers, **JSON_CONTENT_TYPE},
         )
         assert response.status_code == 200
         data = response.json()
         assert data["verdict"] == "ESCALATE"
         assert "scope limit" in data["reason"].lower() or "device count" in data["reason"].lower()
 
-    async def test_evaluate_requires_auth(self, client: AsyncClient) -> None:
-        """Request without auth should return 401."""
-        response = await client.post(
-            "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "parameters": {},
-                "device_targets": [],
-                "confidence_score": 0.99,
-                "context": {},
-            },
-        )
-        assert response.status_code == 401
-
-    async def test_evaluate_invalid_key(self, client: AsyncClient) -> None:
-        """Request with wrong API key should return 401."""
-        response = await client.post(
-            "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "parameters": {},
-                "device_targets": [],
-                "confidence_score": 0.99,
-                "context": {},
-            },
-            headers={"Authorization": "Bearer wrong-key"},
-        )
-        assert response.status_code == 401
-
-    async def test_evaluate_invalid_confidence(
-        self, client: AsyncClient, auth_headers: dict
-    ) -> None:
-        """Confidence score > 1.0 should fail validation."""
-        response = await client.post(
-            "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "parameters": {},
-                "device_targets": [],
-                "confidence_score": 1.5,
-                "context": {},
-            },
-            headers=auth_headers,
-        )
-        assert response.status_code == 422
-
-    async def test_evaluate_empty_tool_name(
-        self, client: AsyncClient, auth_headers: dict
-    ) -> None:
-        """Empty tool_name should fail validation."""
-        response = await client.post(
-            "/evaluate",
-            json={
-                "tool_name": "",
-                "parameters": {},
-                "device_targets": [],
-                "confidence_score": 0.9,
-                "context": {},
-            },
-            headers=auth_headers,
-        )
-        assert response.status_code == 422
-
-    async def test_evaluate_extra_fields_rejected(
-        self, client: AsyncClient, auth_headers: dict
+    @pytest.mark.parametrize(
+        ("overrides", "credentials", "expected_status"),
+        [
+            pytest.param({}, None, 401, id="missing-auth"),
+            pytest.param({}, "wrong-key", 401, id="invalid-key"),
+            pytest.param({"confidence_score": 1.5}, "api", 422, id="confidence-above-1"),
+            pytest.param({"tool_name": ""}, "api", 422, id="empty-tool-name"),
+            # extra=forbid on the request model
+            pytest.param({"unexpected_field": "should_fail"}, "api", 422, id="extra-field"),
+        ],
+    )
+    async def test_evaluate_rejects_bad_input(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        overrides: dict,
+        credentials: str | None,
+        expected_status: int,
     ) -> None:
-        """Extra fields in request body should be rejected (extra=forbid)."""
+        """Unauthenticated or invalid requests are rejected before evaluation."""
+        if credentials is None:
+            headers = {}
+        elif credentials == "api":
+            headers = auth_headers
+        else:
+            headers = {"Authorization": f"Bearer {credentials}"}
         response = await client.post(
             "/evaluate",
             json={
@@ -164,11 +140,11 @@ class TestEvaluateEndpoint:
                 "device_targets": [],
                 "confidence_score": 0.9,
                 "context": {},
-                "unexpected_field": "should_fail",
+                **overrides,
             },
-            headers=auth_headers,
+            headers=headers,
         )
-        assert response.status_code == 422
+        assert response.status_code == expected_status
 
     async def test_evaluate_response_shape(
         self, client: AsyncClient, auth_headers: dict
@@ -176,20 +152,8 @@ class TestEvaluateEndpoint:
         """Verify all expected fields are present in response."""
         response = await client.post(
             "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "parameters": {},
-                "device_targets": ["switch-01"],
-                "confidence_score": 0.99,
-                "context": {},
-            },
-            headers=auth_headers,
+            content=PERMIT_BODY,
+            headers={**auth_headers, **JSON_CONTENT_TYPE},
         )
         data = response.json()
-        expected_keys = {
-            "verdict", "risk_tier", "tool_name", "reason",
-            "confidence_score", "confidence_threshold", "device_count",
-            "requires_audit", "requires_senior_approval", "escalation_id",
-            "matched_rules",
-        }
-        assert expected_keys == set(data.keys())
+        assert data.keys() == EVALUATE_RESPONSE_KEYS, data.keys() ^ EVALUATE_RESPONSE_KEYS
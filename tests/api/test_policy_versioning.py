@@ -12,7 +12,34 @@ from __future__ import annotations
 from uuid import uuid4
 
 import pytest
+from fastapi import FastAPI
 from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from sna.db.models import PolicyVersion
+from sna.policy.loader import compute_policy_hash
+from sna.policy.models import PolicyConfig
+from tests.conftest import SAMPLE_POLICY_PATH
+
+
+async def _version_count(app: FastAPI) -> int:
+    async with app.state.session_factory() as session:
+        return (await session.execute(select(func.count(PolicyVersion.id)))).scalar_one()
+
+
+@pytest.fixture
+async def seeded_version(test_app: FastAPI, default_policy: PolicyConfig) -> tuple[str, int]:
+    """Insert one version of the default policy; return (external_id, version count)."""
+    raw_yaml = SAMPLE_POLICY_PATH.read_text()
+    async with test_app.state.session_factory() as session:
+        async with session.begin():
+            version = PolicyVersion(
+                version_string=default_policy.version,
+                policy_yaml=raw_yaml,
+                policy_hash=compute_policy_hash(raw_yaml),
+            )
+            session.add(version)
+    return version.external_id, await _version_count(test_app)
 
 
 class TestPolicyVersions:
@@ -45,19 +72,15 @@ class TestPolicyCurrent:
 
 
 class TestPolicyRollback:
-    async def test_rollback_creates_new_version(self, client: AsyncClient, admin_headers: dict) -> None:
-        # Reload to create a version
-        await client.post("/policy/reload", headers=admin_headers)
-
-        # Get versions
-        versions_resp = await client.get("/policy/versions", headers=admin_headers)
-        versions = versions_resp.json()["items"]
-        target_id = versions[0]["external_id"]
-
-        # Count before rollback
-        before_count = versions_resp.json()["total"]
+    async def test_rollback_creates_new_version(
+        self,
+        test_app: FastAPI,
+        client: AsyncClient,
+        admin_headers: dict,
+        seeded_version: tuple[str, int],
+    ) -> None:
+        target_id, before_count = seeded_version
 
-        # Rollback
         response = await client.post(
             f"/policy/rollback/{target_id}", headers=admin_headers,
         )
@@ -66,10 +89,8 @@ class TestPolicyRollback:
         assert data["status"] == "rolled_back"
         assert data["rolled_back_to"] == target_id
 
-        # Verify new version created
-        after_resp = await client.get("/policy/versions", headers=admin_headers)
-        after_count = after_resp.json()["total"]
-        assert after_count == before_count + 1
+        # Rollback is versioned
+        assert await _version_count(test_app) == before_count + 1
 
     async def test_rollback_404_bad_id(self, client: AsyncClient, admin_headers: dict) -> None:
         fake_id = str(uuid4())
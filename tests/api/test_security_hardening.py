@@ -7,10 +7,25 @@ agent endpoint auth, and audit log agent_id.
 
 from __future__ import annotations
 
+import json
+import uuid
+
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
+from pydantic import ValidationError
+
+from sna.api.schemas import EvaluateRequest
+
+# Any well-formed id that no test registers
+_MISSING_AGENT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 
-from tests.api.conftest import TEST_ADMIN_KEY, TEST_API_KEY
+# Request bodies serialized once rather than by httpx on every call
+_BASE_EVAL = {"tool_name": "show_interfaces", "confidence_score": 0.9}
+_SHOW_INTERFACES_BODY = json.dumps(_BASE_EVAL).encode()
+_VALID_TARGETS_BODY = json.dumps(
+    _BASE_EVAL | {"device_targets": ["R1", "Switch-R1", "router.core.01"]}
+).encode()
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
 
 
 # --- Security headers (A2) ---
@@ -19,31 +34,34 @@ from tests.api.conftest import TEST_ADMIN_KEY, TEST_API_KEY
 class TestSecurityHeaders:
     """Security headers must appear on all responses."""
 
-    @pytest.mark.asyncio
     async def test_security_headers_on_health(self, client: AsyncClient):
         resp = await client.get("/health")
-        assert resp.headers["X-Content-Type-Options"] == "nosniff"
-        assert resp.headers["X-Frame-Options"] == "DENY"
-        assert resp.headers["Referrer-Policy"] == "no-referrer"
-        assert "max-age=63072000" in resp.headers["Strict-Transport-Security"]
+        # httpx yields lowercased names; fold them once, not per lookup
+        headers = dict(resp.headers)
+        assert headers["x-content-type-options"] == "nosniff"
+        assert headers["x-frame-options"] == "DENY"
+        assert headers["referrer-policy"] == "no-referrer"
+        assert "max-age=63072000" in headers["strict-transport-security"]
 
-    @pytest.mark.asyncio
     async def test_csp_on_api_route(self, client: AsyncClient):
         resp = await client.get("/health")
-        assert resp.headers["Content-Security-Policy"] == "default-src 'none'"
+        assert resp.headers["content-security-policy"] == "default-src 'none'"
+
+    async def test_security_headers_not_duplicated(self, client: AsyncClient):
+        resp = await client.get("/nonexistent")
+        assert resp.status_code == 404
+        assert resp.headers.get_list("X-Frame-Options") == ["DENY"]
+        assert resp.headers.get_list("Content-Security-Policy") == ["default-src 'none'"]
 
-    @pytest.mark.asyncio
     async def test_security_headers_on_evaluate(self, client: AsyncClient, auth_headers):
         resp = await client.post(
             "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "confidence_score": 0.9,
-            },
-            headers=auth_headers,
+            content=_SHOW_INTERFACES_BODY,
+            headers={**auth_headers, **_JSON_CONTENT_TYPE},
         )
-        assert resp.headers["X-Content-Type-Options"] == "nosniff"
-        assert resp.headers["X-Frame-Options"] == "DENY"
+        headers = dict(resp.headers)
+        assert headers["x-content-type-options"] == "nosniff"
+        assert headers["x-frame-options"] == "DENY"
 
 
 # --- Content-Length guard (A3) ---
@@ -52,14 +70,18 @@ class TestSecurityHeaders:
 class TestContentLengthGuard:
     """Malformed Content-Length must return 400."""
 
-    @pytest.mark.asyncio
-    async def test_malformed_content_length(self, client: AsyncClient):
+    @pytest.mark.parametrize("value", ["not-a-number", "+10", "1_0", "-1"])
+    async def test_malformed_content_length(self, client: AsyncClient, value: str):
         resp = await client.get(
             "/health",
-            headers={"Content-Length": "not-a-number"},
+            headers={"Content-Length": value},
         )
         assert resp.status_code == 400
-        assert "Invalid Content-Length" in resp.json()["detail"]
+        assert b"Invalid Content-Length" in resp.content
+
+    async def test_huge_content_length_too_large(self, client: AsyncClient):
+        resp = await client.get("/health", headers={"Content-Length": "9" * 5000})
+        assert resp.status_code == 413
 
 
 # --- device_targets validation (A4) ---
@@ -68,44 +90,27 @@ class TestContentLengthGuard:
 class TestDeviceTargetsValidation:
     """device_targets elements must match safe characters."""
 
-    @pytest.mark.asyncio
     async def test_valid_device_targets(self, client: AsyncClient, auth_headers):
         resp = await client.post(
             "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "device_targets": ["R1", "Switch-R1", "router.core.01"],
-                "confidence_score": 0.9,
-            },
-            headers=auth_headers,
+            content=_VALID_TARGETS_BODY,
+            headers={**auth_headers, **_JSON_CONTENT_TYPE},
         )
         assert resp.status_code == 200
 
-    @pytest.mark.asyncio
-    async def test_invalid_device_target_semicolon(self, client: AsyncClient, auth_headers):
-        resp = await client.post(
-            "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "device_targets": ["R1; rm -rf /"],
-                "confidence_score": 0.9,
-            },
-            headers=auth_headers,
-        )
-        assert resp.status_code == 422
-
-    @pytest.mark.asyncio
-    async def test_invalid_device_target_spaces(self, client: AsyncClient, auth_headers):
-        resp = await client.post(
-            "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "device_targets": ["R1 R2"],
-                "confidence_score": 0.9,
-            },
-            headers=auth_headers,
-        )
-        assert resp.status_code == 422
+    @pytest.mark.parametrize(
+        "device_target",
+        [
+            pytest.param("R1; rm -rf /", id="semicolon"),
+            pytest.param("R1 R2", id="spaces"),
+            pytest.param("R1\n", id="trailing-newline"),
+        ],
+    )
+    def test_invalid_device_target_rejected(self, device_target: str):
+        # Validated on the request model; the HTTP 422 mapping is covered
+        # by TestBatchParamsValidation
+        with pytest.raises(ValidationError, match="device_targets"):
+            EvaluateRequest(**_BASE_EVAL, device_targets=[device_target])
 
 
 # --- tool_name validation (A7) ---
@@ -114,53 +119,25 @@ class TestDeviceTargetsValidation:
 class TestToolNameValidation:
     """tool_name must match [a-zA-Z0-9_-]+."""
 
-    @pytest.mark.asyncio
     async def test_valid_tool_name(self, client: AsyncClient, auth_headers):
         resp = await client.post(
             "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "confidence_score": 0.9,
-            },
-            headers=auth_headers,
+            content=_SHOW_INTERFACES_BODY,
+            headers={**auth_headers, **_JSON_CONTENT_TYPE},
         )
         assert resp.status_code == 200
 
-    @pytest.mark.asyncio
-    async def test_tool_name_with_dots_rejected(self, client: AsyncClient, auth_headers):
-        resp = await client.post(
-            "/evaluate",
-            json={
-                "tool_name": "show.interfaces",
-                "confidence_score": 0.9,
-            },
-            headers=auth_headers,
-        )
-        assert resp.status_code == 422
-
-    @pytest.mark.asyncio
-    async def test_tool_name_with_spaces_rejected(self, client: AsyncClient, auth_headers):
-        resp = await client.post(
-            "/evaluate",
-            json={
-                "tool_name": "show interfaces",
-                "confidence_score": 0.9,
-            },
-            headers=auth_headers,
-        )
-        assert resp.status_code == 422
-
-    @pytest.mark.asyncio
-    async def test_tool_name_with_slashes_rejected(self, client: AsyncClient, auth_headers):
-        resp = await client.post(
-            "/evaluate",
-            json={
-                "tool_name": "../etc/passwd",
-                "confidence_score": 0.9,
-            },
-            headers=auth_headers,
-        )
-        assert resp.status_code == 422
+    @pytest.mark.parametrize(
+        "tool_name",
+        [
+            pytest.param("show.interfaces", id="dots"),
+            pytest.param("show interfaces", id="spaces"),
+            pytest.param("../etc/passwd", id="slashes"),
+        ],
+    )
+    def test_invalid_tool_name_rejected(self, tool_name: str):
+        with pytest.raises(ValidationError, match="tool_name"):
+            EvaluateRequest(**_BASE_EVAL | {"tool_name": tool_name})
 
 
 # --- Batch params validation (A5) ---
@@ -169,7 +146,6 @@ class TestToolNameValidation:
 class TestBatchParamsValidation:
     """Batch item params values must not exceed 255 chars."""
 
-    @pytest.mark.asyncio
     async def test_batch_params_oversized_value(self, client: AsyncClient, admin_headers):
         resp = await client.post(
             "/batch/execute",
@@ -187,7 +163,6 @@ class TestBatchParamsValidation:
         )
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_batch_params_valid_value(self, client: AsyncClient, admin_headers):
         resp = await client.post(
             "/batch/execute",
@@ -213,57 +188,21 @@ class TestBatchParamsValidation:
 class TestAgentEndpointAuth:
     """Agent read endpoints require admin key, not just api key."""
 
-    @pytest.mark.asyncio
-    async def test_get_agent_requires_admin(self, client: AsyncClient, auth_headers):
-        """GET /agents/{id} with regular API key should return 403."""
-        import uuid
-
-        resp = await client.get(
-            f"/agents/{uuid.uuid4()}",
-            headers=auth_headers,
-        )
-        assert resp.status_code == 403
-
-    @pytest.mark.asyncio
-    async def test_get_agent_activity_requires_admin(self, client: AsyncClient, auth_headers):
-        """GET /agents/{id}/activity with regular API key should return 403."""
-        import uuid
-
-        resp = await client.get(
-            f"/agents/{uuid.uuid4()}/activity",
-            headers=auth_headers,
-        )
-        assert resp.status_code == 403
-
-    @pytest.mark.asyncio
-    async def test_get_agent_overrides_requires_admin(self, client: AsyncClient, auth_headers):
-        """GET /agents/{id}/overrides with regular API key should return 403."""
-        import uuid
-
-        resp = await client.get(
-            f"/agents/{uuid.uuid4()}/overrides",
-            headers=auth_headers,
-        )
-        assert resp.status_code == 403
-
-    @pytest.mark.asyncio
-    async def test_get_agent_reputation_requires_admin(self, client: AsyncClient, auth_headers):
-        """GET /agents/{id}/reputation with regular API key should return 403."""
-        import uuid
-
+    @pytest.mark.parametrize("suffix", ["", "/activity", "/overrides", "/reputation"])
+    async def test_get_agent_endpoints_require_admin(
+        self, client: AsyncClient, auth_headers, suffix: str
+    ):
+        """GET /agents/{id}[/...] with regular API key should return 403."""
         resp = await client.get(
-            f"/agents/{uuid.uuid4()}/reputation",
+            f"/agents/{_MISSING_AGENT_ID}{suffix}",
             headers=auth_headers,
         )
         assert resp.status_code == 403
 
-    @pytest.mark.asyncio
     async def test_get_agent_with_admin_key(self, client: AsyncClient, admin_headers):
         """GET /agents/{id} with admin key should work (404 = auth passed)."""
-        import uuid
-
         resp = await client.get(
-            f"/agents/{uuid.uuid4()}",
+            f"/agents/{_MISSING_AGENT_ID}",
             headers=admin_headers,
         )
         # 404 means auth succeeded, agent just doesn't exist
@@ -276,18 +215,14 @@ class TestAgentEndpointAuth:
 class TestAuditLogAgentId:
     """AuditLog should record agent_id when available."""
 
-    @pytest.mark.asyncio
     async def test_audit_log_created_with_evaluate(
         self, client: AsyncClient, auth_headers, test_app
     ):
         """Evaluate should create an audit log entry."""
         resp = await client.post(
             "/evaluate",
-            json={
-                "tool_name": "show_interfaces",
-                "confidence_score": 0.9,
-            },
-            headers=auth_headers,
+            content=_SHOW_INTERFACES_BODY,
+            headers={**auth_headers, **_JSON_CONTENT_TYPE},
         )
         assert resp.status_code == 200
 
@@ -298,9 +233,11 @@ class TestAuditLogAgentId:
         session_factory = test_app.state.session_factory
         async with session_factory() as session:
             result = await session.execute(
-                select(AuditLog).order_by(AuditLog.id.desc()).limit(1)
+                select(AuditLog.tool_name, AuditLog.agent_id)
+                .order_by(AuditLog.id.desc())
+                .limit(1)
             )
-            audit = result.scalar_one_or_none()
+            audit = result.first()
 
         assert audit is not None
         assert audit.tool_name == "show_interfaces"
@@ -1,28 +1,103 @@
 """Shared test fixtures for the SNA test suite.
 
-Provides async test database (in-memory SQLite), sample policy, and mock EAS values.
+Provides async test databases (in-memory SQLite, with per-test rollback), an
+in-process ASGI client helper, the sample policy, and mock EAS values.
 """
 
-import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+import bcrypt
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from sna.db.models import Base
+from sna.policy.loader import load_policy
+from sna.policy.models import PolicyConfig
 
 TESTS_DIR = Path(__file__).parent
 PROJECT_ROOT = TESTS_DIR.parent
 SAMPLE_POLICY_PATH = PROJECT_ROOT / "policies" / "default.yaml"
 
+# bcrypt's minimum cost — the default (12) costs ~250ms per agent key hash
+TEST_BCRYPT_ROUNDS = 4
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create a session-scoped event loop for async tests."""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+
+def asgi_client(app: FastAPI) -> AsyncClient:
+    """AsyncClient wired straight to an in-process ASGI app.
+
+    There is no network, so skip proxy/netrc environment lookups and
+    client-side timeouts. ASGITransport never sends lifespan events, so
+    opening a client does not run the app's startup/shutdown hooks;
+    fixtures that need app.state set it up themselves.
+    """
+    return AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        trust_env=False,
+        timeout=None,
+    )
+
+
+def _enable_sqlite_savepoints(engine: AsyncEngine) -> None:
+    """Let the SQLite driver honour SAVEPOINT so per-test rollback works.
+
+    The sqlite3 module begins transactions implicitly, which breaks nested
+    transactions. Disable that and emit BEGIN ourselves.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, connection_record) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+
+@asynccontextmanager
+async def savepoint_session_factory(
+    engine: AsyncEngine,
+) -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """A session factory bound to one connection inside an outer transaction.
+
+    Sessions join the transaction via SAVEPOINTs, so their commits are
+    visible to later sessions in the same test and rolled back on exit.
+    Sessions must be used one at a time — they share the connection.
+    """
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        yield async_sessionmaker(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        await transaction.rollback()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_bcrypt():
+    """Hash agent API keys at minimum bcrypt cost for the test session.
+
+    Hashes stay valid bcrypt, so checkpw() verifies them unchanged.
+    """
+    real_gensalt = bcrypt.gensalt
+
+    def gensalt(rounds: int = TEST_BCRYPT_ROUNDS, prefix: bytes = b"2b") -> bytes:
+        return real_gensalt(rounds=TEST_BCRYPT_ROUNDS, prefix=prefix)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(bcrypt, "gensalt", gensalt)
+        yield
 
 
 @pytest.fixture(scope="session")
@@ -40,6 +115,26 @@ async def async_engine():
     await engine.dispose()
 
 
+@pytest.fixture(scope="session")
+async def test_db_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """Session-wide in-memory database with the schema created once."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    _enable_sqlite_savepoints(engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def rolled_back_session_factory(
+    test_db_engine: AsyncEngine,
+) -> AsyncGenerator[async_sessionmaker[AsyncSession], None]:
+    """Session factory on the shared schema; everything is rolled back after the test."""
+    async with savepoint_session_factory(test_db_engine) as session_factory:
+        yield session_factory
+
+
 @pytest.fixture
 async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
     """Provide a transactional database session that rolls back after each test."""
@@ -50,6 +145,16 @@ async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
             await session.rollback()
 
 
+@pytest.fixture(scope="session")
+async def default_policy() -> PolicyConfig:
+    """policies/default.yaml, parsed once for the session.
+
+    PolicyEngine never mutates its policy (reload swaps in a new one), so
+    one instance is safely shared by every engine built in tests.
+    """
+    return await load_policy(str(SAMPLE_POLICY_PATH))
+
+
 @pytest.fixture
 def sample_policy_path() -> Path:
     """Path to the default policy YAML for testing."""
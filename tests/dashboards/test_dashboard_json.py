@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 from pathlib import Path
@@ -10,44 +11,48 @@ import pytest
 
 DASHBOARDS_DIR = Path(__file__).parent.parent.parent / "dashboards"
 
+# Counter/Gauge/Histogram name arguments in metrics.py
+_METRIC_DEF_RE = re.compile(r'(?:Counter|Gauge|Histogram)\(\s*"([^"]+)"')
+# Metric names in PromQL expressions
+_METRIC_REF_RE = re.compile(r"\b(sna_\w+)")
+# Series suffixes Prometheus adds to histograms
+_HIST_SUFFIX_RE = re.compile(r"_(bucket|count|sum)$")
+
 
 def _load_dashboard_files() -> list[tuple[str, dict]]:
     """Load all JSON files from the dashboards directory."""
     results = []
     for json_file in sorted(DASHBOARDS_DIR.glob("*.json")):
-        with open(json_file) as f:
-            data = json.load(f)
-        results.append((json_file.name, data))
+        results.append((json_file.name, json.loads(json_file.read_bytes())))
     return results
 
 
-def _get_known_metrics() -> set[str]:
-    """Extract metric names from metrics.py."""
+@functools.lru_cache(maxsize=1)
+def _get_known_metrics() -> frozenset[str]:
+    """Extract metric names from metrics.py (read once per session)."""
     metrics_file = (
         Path(__file__).parent.parent.parent / "src" / "sna" / "observability" / "metrics.py"
     )
-    content = metrics_file.read_text()
-    # Match Counter/Gauge/Histogram name arguments
-    pattern = re.compile(r'(?:Counter|Gauge|Histogram)\(\s*"([^"]+)"')
-    return set(pattern.findall(content))
+    return frozenset(_METRIC_DEF_RE.findall(metrics_file.read_text()))
+
+
+@pytest.fixture(scope="session")
+def dashboard_files() -> list[tuple[str, dict]]:
+    """Parsed dashboards, loaded once. Tests only read them."""
+    return _load_dashboard_files()
 
 
 class TestDashboardFiles:
     """Dashboard JSON validation tests."""
 
-    @pytest.fixture
-    def dashboard_files(self) -> list[tuple[str, dict]]:
-        return _load_dashboard_files()
-
-    def test_dashboard_files_valid_json(self) -> None:
+    def test_dashboard_files_valid_json(
+        self, dashboard_files: list[tuple[str, dict]]
+    ) -> None:
         """All JSON files in dashboards/ should parse without error."""
-        json_files = list(DASHBOARDS_DIR.glob("*.json"))
-        assert len(json_files) >= 2, "Expected at least 2 dashboard files"
+        assert len(dashboard_files) >= 2, "Expected at least 2 dashboard files"
 
-        for json_file in json_files:
-            with open(json_file) as f:
-                data = json.load(f)
-            assert isinstance(data, dict), f"{json_file.name} is not a JSON object"
+        for name, data in dashboard_files:
+            assert isinstance(data, dict), f"{name} is not a JSON object"
 
     def test_dashboard_has_required_fields(
         self, dashboard_files: list[tuple[str, dict]]
@@ -67,28 +72,28 @@ class TestDashboardFiles:
         known_metrics = _get_known_metrics()
         assert len(known_metrics) > 0, "No metrics found in metrics.py"
 
+        def _base(metric_ref: str) -> str:
+            # Try the exact name first; only strip Prometheus histogram
+            # suffixes (_bucket, _count, _sum) if it isn't a known metric.
+            if metric_ref in known_metrics:
+                return metric_ref
+            return _HIST_SUFFIX_RE.sub("", metric_ref)
+
         for name, data in dashboard_files:
-            for panel in data.get("panels", []):
-                for target in panel.get("targets", []):
-                    expr = target.get("expr", "")
-                    # Extract metric names from PromQL expressions
-                    # Match metric_name at start of expression or after functions
-                    metric_refs = re.findall(r"\b(sna_\w+)", expr)
-                    for metric_ref in metric_refs:
-                        # Try the exact name first; only strip Prometheus
-                        # histogram suffixes (_bucket, _count, _sum) if the
-                        # exact name isn't a known metric.
-                        if metric_ref in known_metrics:
-                            base_metric = metric_ref
-                        else:
-                            base_metric = re.sub(
-                                r"_(bucket|count|sum)$", "", metric_ref
-                            )
-                        assert base_metric in known_metrics, (
-                            f"{name}: panel '{panel.get('title')}' references "
-                            f"unknown metric '{base_metric}' in expr '{expr}'. "
-                            f"Known metrics: {sorted(known_metrics)}"
-                        )
+            panel_targets = (
+                (panel, target)
+                for panel in data.get("panels", ())
+                for target in panel.get("targets") or ()
+            )
+            for panel, target in panel_targets:
+                expr = target.get("expr", "")
+                for metric_ref in _METRIC_REF_RE.findall(expr):
+                    base_metric = _base(metric_ref)
+                    assert base_metric in known_metrics, (
+                        f"{name}: panel '{panel.get('title')}' references "
+                        f"unknown metric '{base_metric}' in expr '{expr}'. "
+                        f"Known metrics: {sorted(known_metrics)}"
+                    )
 
     def test_panels_have_titles(
         self, dashboard_files: list[tuple[str, dict]]
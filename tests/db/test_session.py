@@ -0,0 +1,43 @@
+"""Tests for the async engine factory."""
+
+from __future__ import annotations
+
+from sqlalchemy import select
+
+from sna.db.models import AuditLog, Base
+from sna.db.session import create_async_engine_from_url, create_session_factory
+
+
+class TestCreateAsyncEngine:
+    async def test_json_columns_stored_compact(self) -> None:
+        engine = create_async_engine_from_url("sqlite+aiosqlite:///:memory:")
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+
+            session_factory = create_session_factory(engine)
+            async with session_factory() as session, session.begin():
+                session.add(AuditLog(
+                    tool_name="configure_vlan",
+                    parameters={"vlan_id": 100, "name": "USERS"},
+                    device_targets=["sw1", "sw2"],
+                    verdict="PERMIT",
+                    risk_tier="tier_2_low_risk_write",
+                    confidence_score=0.9,
+                    confidence_threshold=0.3,
+                    reason="Permitted",
+                    eas_at_time=0.5,
+                ))
+
+            async with engine.connect() as conn:
+                raw = await conn.exec_driver_sql(
+                    "SELECT parameters, device_targets FROM audit_log"
+                )
+                assert raw.one() == ('{"vlan_id":100,"name":"USERS"}', '["sw1","sw2"]')
+
+            async with session_factory() as session:
+                log = await session.scalar(select(AuditLog))
+                assert log.parameters == {"vlan_id": 100, "name": "USERS"}
+                assert log.device_targets == ["sw1", "sw2"]
+        finally:
+            await engine.dispose()
@@ -0,0 +1,18 @@
+"""Shared fixtures for device execution tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from sna.devices.command_builder import CommandBuilder, create_default_command_builder
+
+
+@pytest.fixture(scope="session")
+def command_builder() -> CommandBuilder:
+    """The default tool templates, registered once.
+
+    Tests only build commands from it, never register templates, so one
+    instance is shared. ValidationEngine and ConnectionManager hold per-test
+    state (result cache, mock pools) and are still created per test.
+    """
+    return create_default_command_builder()
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 from sna.db.models import Base
 from sna.devices.batch import (
@@ -15,35 +16,44 @@ from sna.devices.batch import (
     CircularDependencyError,
     DeviceBatchResult,
 )
-from sna.devices.command_builder import create_default_command_builder
+from sna.devices.command_builder import CommandBuilder
 from sna.devices.driver import CommandResult, ConnectionManager
 from sna.devices.executor import DeviceExecutor
 from sna.devices.registry import Platform
 from sna.policy.models import EvaluationResult, RiskTier, Verdict
 from sna.validation.rules import ValidationEngine
 
+# EvaluationResult is frozen, so every test can pass the same instance
+_PERMIT_RESULT = EvaluationResult(
+    verdict=Verdict.PERMIT,
+    risk_tier=RiskTier.TIER_2_LOW_RISK_WRITE,
+    tool_name="configure_vlan",
+    reason="Permitted",
+    confidence_score=0.99,
+    confidence_threshold=0.3,
+    device_count=3,
+)
 
-def _permit_result() -> EvaluationResult:
-    return EvaluationResult(
-        verdict=Verdict.PERMIT,
-        risk_tier=RiskTier.TIER_2_LOW_RISK_WRITE,
-        tool_name="configure_vlan",
-        reason="Permitted",
-        confidence_score=0.99,
-        confidence_threshold=0.3,
-        device_count=3,
-    )
 
+@pytest.fixture(scope="module")
+async def batch_db_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """In-memory database for this module, with the schema created once.
 
-@pytest.fixture
-async def batch_setup():
-    """Create a BatchExecutor with mocked device connections."""
+    Batches write their execution logs from concurrent sessions, so tests
+    can't share one connection through SAVEPOINTs. No test reads those
+    rows back, so they are simply left in place until the module ends.
+    """
     engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
 
-    session_factory = async_sessionmaker(engine, expire_on_commit=False)
-    command_builder = create_default_command_builder()
+
+@pytest.fixture
+def batch_setup(batch_db_engine: AsyncEngine, command_builder: CommandBuilder):
+    """Create a BatchExecutor with mocked device connections."""
+    session_factory = async_sessionmaker(batch_db_engine, expire_on_commit=False)
     connection_manager = ConnectionManager()
     validation_engine = ValidationEngine()
 
@@ -59,9 +69,7 @@ async def batch_setup():
         max_parallel=3,
     )
 
-    yield batch_executor, connection_manager
-
-    await engine.dispose()
+    return batch_executor, connection_manager
 
 
 def _mock_pool(success: bool = True, output: str = "OK") -> MagicMock:
@@ -89,7 +97,7 @@ class TestBatchExecutor:
             params={"vlan_id": "100", "name": "TEST"},
         )]
 
-        result = await batch_executor.execute_batch(items, _permit_result())
+        result = await batch_executor.execute_batch(items, _PERMIT_RESULT)
         assert isinstance(result, BatchResult)
         assert result.total == 1
 
@@ -104,7 +112,7 @@ class TestBatchExecutor:
             BatchItem(device_target="sw3", tool_name="configure_vlan", params={"vlan_id": "100", "name": "V1"}),
         ]
 
-        result = await batch_executor.execute_batch(items, _permit_result())
+        result = await batch_executor.execute_batch(items, _PERMIT_RESULT)
         assert result.total == 3
 
     async def test_dependency_ordering(self, batch_setup) -> None:
@@ -154,9 +162,32 @@ class TestBatchExecutor:
             params={"vlan_id": "100", "name": "TEST"},
         )]
 
-        result = await batch_executor.execute_batch(items, _permit_result())
+        result = await batch_executor.execute_batch(items, _PERMIT_RESULT)
         assert result.total == 1
 
+    async def test_stage_validated_in_one_engine_batch(self, batch_setup) -> None:
+        batch_executor, conn_mgr = batch_setup
+        for name in ["sw1", "sw2", "sw3"]:
+            conn_mgr._pools[name] = _mock_pool()
+
+        params = {"vlan_id": "100", "name": "V1"}
+        items = [
+            BatchItem(device_target=name, tool_name="configure_vlan", params=params)
+            for name in ["sw1", "sw2", "sw3"]
+        ]
+
+        engine = batch_executor._validation_engine
+        with patch.object(
+            engine, "run_validations_batch", wraps=engine.run_validations_batch,
+        ) as batch_spy:
+            result = await batch_executor.execute_batch(items, _PERMIT_RESULT)
+
+        batch_spy.assert_awaited_once()
+        tool_name, targets = batch_spy.await_args.args
+        assert tool_name == "configure_vlan"
+        assert [device for device, _, _ in targets] == ["sw1", "sw2", "sw3"]
+        assert all(item.validation_results for item in result.items)
+
     async def test_build_order_no_dependencies(self, batch_setup) -> None:
         batch_executor, _ = batch_setup
 
@@ -181,6 +212,6 @@ class TestBatchExecutor:
             params={"vlan_id": "100", "name": "TEST"},
         )]
 
-        result = await batch_executor.execute_batch(items, _permit_result())
+        result = await batch_executor.execute_batch(items, _PERMIT_RESULT)
         assert result.batch_id  # UUID should be set
         assert result.duration_seconds >= 0
@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock
 
-import pytest
-
 from sna.devices.enrichment import (
     CRITICALITY_MAP,
     DeviceContext,
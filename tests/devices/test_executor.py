@@ -5,10 +5,8 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-from sna.db.models import Base, ExecutionLog
-from sna.devices.command_builder import create_default_command_builder
+from sna.db.models import ExecutionLog
 from sna.devices.driver import CommandResult, ConnectionManager, DeviceConnectionError
 from sna.devices.executor import DeviceExecutor
 from sna.devices.registry import Platform
@@ -16,14 +14,9 @@ from sna.policy.models import EvaluationResult, RiskTier, Verdict
 
 
 @pytest.fixture
-async def executor_setup():
+async def executor_setup(rolled_back_session_factory, command_builder):
     """Create a DeviceExecutor with in-memory DB and mock connection manager."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    session_factory = async_sessionmaker(engine, expire_on_commit=False)
-    command_builder = create_default_command_builder()
+    session_factory = rolled_back_session_factory
     connection_manager = ConnectionManager()
 
     executor = DeviceExecutor(
@@ -34,8 +27,6 @@ async def executor_setup():
 
     yield executor, session_factory, connection_manager
 
-    await engine.dispose()
-
 
 def _permit_result(tool_name: str = "show_interfaces") -> EvaluationResult:
     return EvaluationResult(
@@ -5,22 +5,17 @@ from __future__ import annotations
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-from sna.db.models import Base, ExecutionLog
+from sna.db.models import ExecutionLog
 from sna.devices.driver import CommandResult, ConnectionManager, DeviceConnectionError
 from sna.devices.registry import Platform
 from sna.devices.rollback import RollbackError, RollbackExecutor
 
 
 @pytest.fixture
-async def rollback_setup():
+async def rollback_setup(rolled_back_session_factory):
     """Create a RollbackExecutor with in-memory DB."""
-    engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    session_factory = rolled_back_session_factory
     connection_manager = ConnectionManager()
 
     rollback_executor = RollbackExecutor(
@@ -30,8 +25,6 @@ async def rollback_setup():
 
     yield rollback_executor, session_factory, connection_manager
 
-    await engine.dispose()
-
 
 class TestRollbackExecutor:
     """Rollback executor tests."""
@@ -6,7 +6,6 @@ from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import httpx
-import pytest
 
 from sna.integrations.discord import COLOR_BLOCK, COLOR_ESCALATE, DiscordNotifier
 from sna.policy.models import EvaluationResult, RiskTier, Verdict
@@ -11,11 +11,8 @@ from sna.db.models import Base
 from sna.integrations.mcp import MCPGateway, MCPInterceptResult, MCPToolCall
 from sna.integrations.notifier import CompositeNotifier, Notifier
 from sna.policy.engine import PolicyEngine
-from sna.policy.loader import load_policy
 from sna.policy.models import EvaluationResult, Verdict
 
-SAMPLE_POLICY = "policies/default.yaml"
-
 
 class _StubNotifier(Notifier):
     """Records calls and returns configurable success."""
@@ -45,15 +42,14 @@ class _FailingNotifier(Notifier):
 
 
 @pytest.fixture
-async def engine():
+async def engine(default_policy):
     """Create a real PolicyEngine with in-memory SQLite."""
     db_engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
     async with db_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     session_factory = async_sessionmaker(db_engine, expire_on_commit=False)
-    policy = await load_policy(SAMPLE_POLICY)
     pe = PolicyEngine(
-        policy=policy,
+        policy=default_policy,
         session_factory=session_factory,
         initial_eas=0.1,
     )
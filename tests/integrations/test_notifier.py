@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from uuid import uuid4
 
-import pytest
-
 from sna.integrations.notifier import CompositeNotifier, Notifier, create_notifier
 from sna.policy.models import EvaluationResult, RiskTier, Verdict
 
@@ -6,7 +6,6 @@ from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import httpx
-import pytest
 
 from sna.integrations.teams import COLOR_BLOCK, COLOR_ESCALATE, TeamsNotifier
 from sna.policy.models import EvaluationResult, RiskTier, Verdict
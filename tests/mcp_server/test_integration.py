@@ -18,21 +18,19 @@ from sna.devices.executor import DeviceExecutor
 from sna.integrations.mcp import MCPGateway, MCPToolCall
 from sna.integrations.notifier import CompositeNotifier
 from sna.policy.engine import PolicyEngine
-from sna.policy.loader import load_policy
 from sna.policy.models import Verdict
 
 
 @pytest.fixture
-async def integration_setup():
+async def integration_setup(default_policy):
     """Full integration setup with mock device connections."""
     engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
     session_factory = async_sessionmaker(engine, expire_on_commit=False)
-    policy = await load_policy("policies/default.yaml")
     policy_engine = PolicyEngine(
-        policy=policy, session_factory=session_factory, initial_eas=0.5,
+        policy=default_policy, session_factory=session_factory, initial_eas=0.5,
     )
 
     notifier = CompositeNotifier([])
@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-import pytest
-
 from sna.observability.tracing import (
     _NoOpSpan,
     _NoOpTracer,
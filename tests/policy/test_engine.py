@@ -19,8 +19,9 @@ Covers:
 from __future__ import annotations
 
 import pytest
-from sqlalchemy import func, select
+from sqlalchemy import event, func, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 
 from sna.db.models import AuditLog, EscalationRecord
 from sna.policy.engine import PolicyEngine
@@ -265,6 +266,9 @@ class TestEscalateVerdict:
             assert record.tool_name == "configure_vlan"
             assert record.status == "PENDING"
 
+        audit = await _get_latest_audit(session_factory, "configure_vlan")
+        assert record.audit_log_id == audit.id
+
 
 # --- BLOCK tests ---
 
@@ -414,6 +418,35 @@ class TestFailClosed:
 
         await bad_engine.dispose()
 
+    @pytest.mark.asyncio
+    async def test_commit_failure_blocks(self, policy, async_engine):
+        """A write that fails at commit time must also BLOCK, with no escalation."""
+
+        class FailingFlushSession(Session):
+            pass
+
+        @event.listens_for(FailingFlushSession, "before_flush")
+        def _fail(session, flush_context, instances) -> None:
+            raise RuntimeError("disk full")
+
+        engine = PolicyEngine(
+            policy=policy,
+            session_factory=async_sessionmaker(
+                async_engine, sync_session_class=FailingFlushSession
+            ),
+            initial_eas=0.5,
+        )
+
+        request = EvaluationRequest(
+            tool_name="configure_vlan",
+            confidence_score=0.3,
+            device_targets=["switch1"],
+        )
+        result = await engine.evaluate(request)
+
+        assert result.verdict == Verdict.BLOCK
+        assert result.escalation_id is None
+
 
 # --- Unknown tool tests ---
 
@@ -442,3 +442,16 @@ class TestEvaluationResult:
             device_count=1,
         )
         assert result.verdict == Verdict.BLOCK
+
+    def test_result_is_frozen(self):
+        result = EvaluationResult(
+            verdict=Verdict.PERMIT,
+            risk_tier=RiskTier.TIER_1_READ,
+            tool_name="ping",
+            reason="Tier 1 read action",
+            confidence_score=0.9,
+            confidence_threshold=0.1,
+            device_count=0,
+        )
+        with pytest.raises(ValidationError, match="frozen"):
+            result.verdict = Verdict.BLOCK  # type: ignore[misc]
@@ -8,7 +8,7 @@ from __future__ import annotations
 from collections.abc import AsyncGenerator
 
 import pytest
-from httpx import ASGITransport, AsyncClient
+from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from sna.api.app import create_app, lifespan
@@ -20,9 +20,12 @@ from sna.db.session import (
     get_db_session,
 )
 from sna.policy.engine import PolicyEngine
+from tests.conftest import asgi_client
 
 TEST_API_KEY = "lifecycle-test-key-123-abcdefghijklmn"
 TEST_ADMIN_KEY = "lifecycle-admin-key-456-abcdefghijkl"
+AUTH_HEADERS = {"Authorization": f"Bearer {TEST_API_KEY}"}
+ADMIN_HEADERS = {"Authorization": f"Bearer {TEST_ADMIN_KEY}"}
 
 
 @pytest.fixture
@@ -54,8 +57,7 @@ async def app_with_lifespan(settings: Settings) -> AsyncGenerator[object, None]:
 @pytest.fixture
 async def lifecycle_client(app_with_lifespan) -> AsyncGenerator[AsyncClient, None]:
     """Client connected to an app with lifespan running."""
-    transport = ASGITransport(app=app_with_lifespan)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
+    async with asgi_client(app_with_lifespan) as client:
         yield client
 
 
@@ -76,7 +78,7 @@ class TestAppLifespan:
         """After startup, full health check should work."""
         response = await lifecycle_client.get(
             "/health",
-            headers={"Authorization": f"Bearer {TEST_API_KEY}"},
+            headers=AUTH_HEADERS,
         )
         assert response.status_code == 200
         data = response.json()
@@ -97,7 +99,7 @@ class TestAppLifespan:
                 "confidence_score": 0.99,
                 "context": {},
             },
-            headers={"Authorization": f"Bearer {TEST_API_KEY}"},
+            headers=AUTH_HEADERS,
         )
         assert response.status_code == 200
         assert response.json()["verdict"] == "PERMIT"
@@ -116,14 +118,13 @@ class TestAppLifespan:
         settings.max_request_body_bytes = 100
         app = create_app(settings=settings)
         async with lifespan(app):
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
+            async with asgi_client(app) as client:
                 large_body = '{"tool_name": "test", "parameters": {}, "device_targets": [], "confidence_score": 0.5, "context": {"data": "' + "x" * 200 + '"}}'
                 response = await client.post(
                     "/evaluate",
                     content=large_body,
                     headers={
-                        "Authorization": f"Bearer {TEST_API_KEY}",
+                        **AUTH_HEADERS,
                         "Content-Type": "application/json",
                         "Content-Length": str(len(large_body)),
                     },
@@ -149,7 +150,7 @@ class TestAppLifespan:
         """Admin can reload policy through the full lifespan."""
         response = await lifecycle_client.post(
             "/policy/reload",
-            headers={"Authorization": f"Bearer {TEST_ADMIN_KEY}"},
+            headers=ADMIN_HEADERS,
         )
         assert response.status_code == 200
         assert response.json()["status"] == "reloaded"
@@ -168,12 +169,12 @@ class TestAppLifespan:
                 "confidence_score": 0.99,
                 "context": {},
             },
-            headers={"Authorization": f"Bearer {TEST_API_KEY}"},
+            headers=AUTH_HEADERS,
         )
 
         response = await lifecycle_client.get(
             "/audit",
-            headers={"Authorization": f"Bearer {TEST_API_KEY}"},
+            headers=AUTH_HEADERS,
         )
         assert response.status_code == 200
         data = response.json()
@@ -194,7 +195,7 @@ class TestAppLifespan:
                 "confidence_score": 0.01,
                 "context": {},
             },
-            headers={"Authorization": f"Bearer {TEST_API_KEY}"},
+            headers=AUTH_HEADERS,
         )
         assert eval_resp.json()["verdict"] == "ESCALATE"
         esc_id = eval_resp.json()["escalation_id"]
@@ -202,7 +203,7 @@ class TestAppLifespan:
         # List pending
         pending_resp = await lifecycle_client.get(
             "/escalation/pending",
-            headers={"Authorization": f"Bearer {TEST_API_KEY}"},
+            headers=AUTH_HEADERS,
         )
         assert pending_resp.status_code == 200
         assert pending_resp.json()["total"] >= 1
@@ -215,7 +216,7 @@ class TestAppLifespan:
                 "decided_by": "lifecycle-admin",
                 "reason": "Lifecycle test",
             },
-            headers={"Authorization": f"Bearer {TEST_ADMIN_KEY}"},
+            headers=ADMIN_HEADERS,
         )
         assert decision_resp.status_code == 200
         assert decision_resp.json()["status"] == "APPROVED"
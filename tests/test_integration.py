@@ -20,11 +20,8 @@ from sna.db.models import AuditLog, Base, EscalationRecord, EscalationStatus
 from sna.integrations.mcp import MCPGateway, MCPToolCall
 from sna.integrations.notifier import CompositeNotifier, Notifier
 from sna.policy.engine import PolicyEngine
-from sna.policy.loader import load_policy
 from sna.policy.models import EvaluationResult, RiskTier, Verdict
 
-SAMPLE_POLICY = "policies/default.yaml"
-
 
 class _RecordingNotifier(Notifier):
     """Records all notification calls with timestamps."""
@@ -59,11 +56,10 @@ async def session_factory(db_engine):
 
 
 @pytest.fixture
-async def policy_engine(session_factory):
+async def policy_engine(session_factory, default_policy):
     """Real PolicyEngine with default policy and low EAS."""
-    policy = await load_policy(SAMPLE_POLICY)
     return PolicyEngine(
-        policy=policy,
+        policy=default_policy,
         session_factory=session_factory,
         initial_eas=0.1,
     )
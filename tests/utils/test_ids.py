@@ -0,0 +1,68 @@
+"""Tests for time-ordered external ID generation."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+from uuid import UUID
+
+from sna.utils import ids
+from sna.utils.ids import new_external_id, uuid7
+
+
+class TestUUID7:
+    """UUIDv7 layout and ordering."""
+
+    def test_version_and_variant(self) -> None:
+        """IDs carry version 7 and the RFC 9562 variant."""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_timestamp_prefix(self) -> None:
+        """The top 48 bits are the Unix time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= value.int >> 80 <= after
+
+    def test_later_ids_sort_later(self) -> None:
+        """IDs from a later millisecond sort after earlier ones, as strings too."""
+        with patch("sna.utils.ids.time.time_ns", return_value=1_700_000_000_000_000_000):
+            earlier = new_external_id()
+        with patch("sna.utils.ids.time.time_ns", return_value=1_700_000_000_001_000_000):
+            later = new_external_id()
+        assert earlier < later
+
+    def test_external_id_format(self) -> None:
+        """External IDs are canonical 36-character UUID strings."""
+        external_id = new_external_id()
+        assert len(external_id) == 36
+        assert str(UUID(external_id)) == external_id
+
+    def test_ids_unique(self) -> None:
+        """IDs generated in the same millisecond still differ."""
+        with patch("sna.utils.ids.time.time_ns", return_value=1_700_000_000_000_000_000):
+            ids = {new_external_id() for _ in range(1000)}
+        assert len(ids) == 1000
+
+
+class TestRandomPool:
+    """Random bytes are drawn from os.urandom in blocks."""
+
+    def test_one_urandom_call_per_block(self) -> None:
+        ids._reset_pool()
+        with patch("sna.utils.ids.os.urandom", wraps=ids.os.urandom) as urandom:
+            values = {new_external_id() for _ in range(ids._POOL_IDS)}
+            assert urandom.call_count == 1
+            new_external_id()
+            assert urandom.call_count == 2
+        assert len(values) == ids._POOL_IDS
+
+    def test_reset_discards_buffered_bytes(self) -> None:
+        """The after-fork hook drops the parent's buffer."""
+        new_external_id()
+        ids._reset_pool()
+        with patch("sna.utils.ids.os.urandom", wraps=ids.os.urandom) as urandom:
+            new_external_id()
+        assert urandom.call_count == 1
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import pytest
-
 from sna.validation.config_diff import (
     ChangeType,
     ConfigSection,
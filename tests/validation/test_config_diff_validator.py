@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import pytest
-
 from sna.validation.config_diff_validator import SemanticDiffValidator
 from sna.validation.validator import ValidationStatus
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from sna.validation.parsers import (
@@ -9,6 +11,7 @@ from sna.validation.parsers import (
     OSPFNeighborEntry,
     RouteEntry,
     parse_bgp_summary,
+    parse_combined,
     parse_ospf_neighbors,
     parse_routing_table,
 )
@@ -55,10 +58,18 @@ Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State
         assert entries[0].state == "Active"
 
     def test_empty_output(self) -> None:
-        assert parse_bgp_summary("") == []
+        assert parse_bgp_summary("") == ()
+
+    def test_result_is_hashable_tuple(self) -> None:
+        output = """\
+10.0.0.2        4        65001     100     200       10    0    0 00:05:30        5
+"""
+        entries = parse_bgp_summary(output)
+        assert isinstance(entries, tuple)
+        assert hash(entries) == hash(parse_bgp_summary(output))
 
     def test_malformed_output(self) -> None:
-        assert parse_bgp_summary("this is not bgp output") == []
+        assert parse_bgp_summary("this is not bgp output") == ()
 
 
 class TestParseOSPFNeighbors:
@@ -87,10 +98,10 @@ Neighbor ID     Pri   State           Dead Time   Address         Interface
         assert entries[0].state == "2WAY"
 
     def test_empty_output(self) -> None:
-        assert parse_ospf_neighbors("") == []
+        assert parse_ospf_neighbors("") == ()
 
     def test_malformed_output(self) -> None:
-        assert parse_ospf_neighbors("no neighbors found") == []
+        assert parse_ospf_neighbors("no neighbors found") == ()
 
 
 class TestParseRoutingTable:
@@ -111,7 +122,7 @@ B    10.1.0.0/16 [20/0] via 10.0.0.3, 00:10:00
         assert len(entries) >= 2  # At least some routes should parse
 
     def test_empty_output(self) -> None:
-        assert parse_routing_table("") == []
+        assert parse_routing_table("") == ()
 
     def test_directly_connected(self) -> None:
         output = "C    10.0.0.0/24 is directly connected, GigabitEthernet0/1\n"
@@ -125,3 +136,136 @@ B    10.1.0.0/16 [20/0] via 10.0.0.3, 00:10:00
         entries = parse_routing_table(output)
         if entries:
             assert entries[0].next_hop == "10.0.0.1"
+
+
+class TestParseCombined:
+    """Parse concatenated BGP/OSPF/route output in a single pass."""
+
+    COMBINED = """\
+Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
+10.0.0.2        4        65001     100     200       10    0    0 00:05:30        5
+10.0.0.3        4        65002       0       0        0    0    0 never    Idle
+
+Neighbor ID     Pri   State           Dead Time   Address         Interface
+10.0.0.4          1   FULL/DR         00:00:32    10.0.0.4        GigabitEthernet0/1
+
+C    10.0.0.0/24 is directly connected, GigabitEthernet0/1
+S    192.168.1.0/24 [1/0] via 10.0.0.1
+"""
+
+    def test_splits_all_three_outputs(self) -> None:
+        bgp, ospf, routes = parse_combined(self.COMBINED)
+        assert [n.neighbor for n in bgp] == ["10.0.0.2", "10.0.0.3"]
+        assert bgp[1].state == "Idle"
+        assert len(ospf) == 1
+        assert ospf[0].neighbor_id == "10.0.0.4"
+        assert ospf[0].state == "FULL"
+        assert {r.prefix for r in routes} == {"10.0.0.0/24", "192.168.1.0/24"}
+
+    def test_matches_individual_parsers(self) -> None:
+        bgp, ospf, routes = parse_combined(self.COMBINED)
+        assert bgp == parse_bgp_summary(self.COMBINED)
+        assert ospf == parse_ospf_neighbors(self.COMBINED)
+        assert routes == parse_routing_table(self.COMBINED)
+
+    def test_empty_output(self) -> None:
+        assert parse_combined("") == ((), (), ())
+
+
+class TestRouteScanner:
+    """Numba byte scanner for large routing tables."""
+
+    ROUTES = """\
+Codes: C - connected, S - static, O - OSPF, B - BGP
+
+Gateway of last resort is 10.0.0.1 to network 0.0.0.0
+
+C    10.0.0.0/24 is directly connected, GigabitEthernet0/1
+S    192.168.1.0/24 [1/0] via 10.0.0.1
+O    172.16.0.0/16 [110/20] via 10.0.0.2, 00:05:30, GigabitEthernet0/2
+B    10.1.0.0/16 [20/0] via 10.0.0.3, 00:10:00
+S*   0.0.0.0/0 [1/0] via 10.0.0.1
+L    10.0.0.1/32 is directly connected, GigabitEthernet0/1
+"""
+    # Long prefixes push the next hop onto a continuation line
+    WRAPPED = """\
+O        172.16.6.0/24
+           [110/20] via 10.0.0.2, 00:05:30, GigabitEthernet0/2
+C        10.0.5.0/24 is directly connected,
+           GigabitEthernet0/3
+S        192.168.9.0/24 [1/0] via 10.0.0.1,
+           00:01:00, GigabitEthernet0/4
+"""
+
+    def test_matches_regex_parser(self) -> None:
+        pytest.importorskip("numba")
+        from sna.validation import _route_scanner
+
+        output = (self.ROUTES + self.WRAPPED) * 50
+        assert _route_scanner.scanner_enabled(output)
+        scanned = parse_routing_table(output)
+        with patch("sna.validation._route_scanner._numba_available", False):
+            assert scanned == parse_routing_table(output)
+        assert len(scanned) == 9 * 50
+        assert scanned[1] == RouteEntry(
+            prefix="192.168.1.0/24", next_hop="10.0.0.1", protocol="S", interface="",
+        )
+        assert (scanned[6].prefix, scanned[6].next_hop) == ("172.16.6.0/24", "10.0.0.2")
+        assert scanned[7] == RouteEntry(
+            prefix="10.0.5.0/24", next_hop="directly connected", protocol="C",
+            interface="GigabitEthernet0/3",
+        )
+
+    def test_small_input_uses_regex(self) -> None:
+        from sna.validation import _route_scanner
+
+        assert not _route_scanner.scanner_enabled(self.ROUTES)
+
+    def test_disabled_without_numba(self) -> None:
+        from sna.validation import _route_scanner
+
+        with patch("sna.validation._route_scanner._numba_available", False):
+            assert not _route_scanner.scanner_enabled(self.ROUTES * 200)
+
+
+class TestBytesInput:
+    """Parsers accept raw bytes from the device channel."""
+
+    BGP = b"""\
+Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
+10.0.0.2        4        65001     100     200       10    0    0 00:05:30        5
+10.0.0.3        4        65002       0       0        0    0    0 never    Idle
+"""
+    OSPF = b"""\
+Neighbor ID     Pri   State           Dead Time   Address         Interface
+10.0.0.2          1   FULL/DR         00:00:32    10.0.0.2        GigabitEthernet0/1
+"""
+    ROUTES = b"""\
+C    10.0.0.0/24 is directly connected, GigabitEthernet0/1
+S    192.168.1.0/24 [1/0] via 10.0.0.1
+"""
+
+    def test_bgp_bytes_match_str(self) -> None:
+        entries = parse_bgp_summary(self.BGP)
+        assert entries == parse_bgp_summary(self.BGP.decode())
+        assert entries[0].neighbor == "10.0.0.2"
+        assert entries[1].state == "Idle"
+
+    def test_ospf_bytes_match_str(self) -> None:
+        entries = parse_ospf_neighbors(self.OSPF)
+        assert entries == parse_ospf_neighbors(self.OSPF.decode())
+        assert isinstance(entries[0].interface, str)
+
+    def test_routes_bytes_match_str(self) -> None:
+        assert parse_routing_table(self.ROUTES) == parse_routing_table(self.ROUTES.decode())
+
+    def test_combined_bytes_match_str(self) -> None:
+        blob = self.BGP + self.OSPF + self.ROUTES
+        assert parse_combined(blob) == parse_combined(blob.decode())
+
+    def test_large_routes_bytes_match_str(self) -> None:
+        output = self.ROUTES * 400
+        assert parse_routing_table(output) == parse_routing_table(output.decode())
+
+    def test_empty_bytes(self) -> None:
+        assert parse_bgp_summary(b"") == ()
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-import pytest
+from unittest.mock import patch
 
+from sna.validation import protocol_validators
 from sna.validation.protocol_validators import (
     BGPNeighborUpValidator,
     OSPFNeighborValidator,
     PrefixCountValidator,
     RouteConvergenceValidator,
 )
-from sna.validation.validator import ValidationStatus
+from sna.validation.validator import ValidationStatus, shared_timestamp
 
 
 BGP_ESTABLISHED = """\
@@ -77,6 +78,24 @@ class TestBGPNeighborUpValidator:
         result = await v.validate("configure_bgp_neighbor", "r1", None, None)
         assert result.status == ValidationStatus.SKIP
 
+    async def test_bytes_output(self) -> None:
+        v = BGPNeighborUpValidator()
+        result = await v.validate(
+            "configure_bgp_neighbor", "r1",
+            before_state=None,
+            after_state={"bgp_summary": BGP_ESTABLISHED.encode()},
+        )
+        assert result.status == ValidationStatus.PASS
+
+    async def test_combined_show_output(self) -> None:
+        v = BGPNeighborUpValidator()
+        result = await v.validate(
+            "configure_bgp_neighbor", "r1",
+            before_state=None,
+            after_state={"show_output": BGP_ONE_IDLE + OSPF_FULL},
+        )
+        assert result.status == ValidationStatus.FAIL
+
 
 class TestOSPFNeighborValidator:
     """OSPF neighbor state validation."""
@@ -108,6 +127,15 @@ class TestOSPFNeighborValidator:
         )
         assert result.status == ValidationStatus.SKIP
 
+    async def test_combined_show_output(self) -> None:
+        v = OSPFNeighborValidator()
+        result = await v.validate(
+            "configure_ospf_area", "r1",
+            before_state=None,
+            after_state={"show_output": BGP_ESTABLISHED + OSPF_FULL},
+        )
+        assert result.status == ValidationStatus.PASS
+
 
 class TestPrefixCountValidator:
     """BGP prefix count validation."""
@@ -203,3 +231,24 @@ C    10.0.0.0/24 is directly connected, GigabitEthernet0/1
             after_state={},
         )
         assert result.status == ValidationStatus.SKIP
+
+
+class TestSharedParse:
+    """Show output is parsed once per validation run."""
+
+    async def test_combined_output_parsed_once_per_run(self) -> None:
+        state = {"show_output": BGP_ESTABLISHED + OSPF_FULL}
+        with patch.object(
+            protocol_validators, "parse_combined", wraps=protocol_validators.parse_combined,
+        ) as parse_spy:
+            with shared_timestamp():
+                bgp = await BGPNeighborUpValidator().validate("t", "r1", None, state)
+                ospf = await OSPFNeighborValidator().validate("t", "r1", None, state)
+            assert parse_spy.call_count == 1
+
+            # Outside a run every call parses
+            await BGPNeighborUpValidator().validate("t", "r1", None, state)
+            assert parse_spy.call_count == 2
+
+        assert bgp.status == ValidationStatus.PASS
+        assert ospf.status == ValidationStatus.PASS
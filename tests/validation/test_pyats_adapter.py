@@ -10,6 +10,7 @@ from sna.validation.pyats_adapter import (
     PyATSNotAvailable,
     SNATestcase,
     create_pyats_job,
+    run_pyats_batch,
     run_pyats_validation,
 )
 from sna.validation.rules import ConfigChangedValidator
@@ -93,6 +94,20 @@ class TestRunPyatsValidation:
         assert len(results) == 1
         assert results[0].status == ValidationStatus.PASS
 
+    async def test_batch_returns_results_per_job(self) -> None:
+        v = ConfigChangedValidator()
+        jobs = [
+            (create_pyats_job("configure_vlan", "sw1", [v]), {"running_config": "a"},
+             {"running_config": "b"}),
+            (create_pyats_job("configure_vlan", "sw2", [v]), {"running_config": "a"},
+             {"running_config": "a"}),
+        ]
+
+        with patch("sna.validation.pyats_adapter._check_pyats_available", return_value=True):
+            results = await run_pyats_batch(jobs)
+
+        assert [r[0].status for r in results] == [ValidationStatus.PASS, ValidationStatus.FAIL]
+
 
 class TestValidationEnginePyatsIntegration:
     """ValidationEngine with pyats_enabled falls back correctly."""
@@ -114,3 +129,24 @@ class TestValidationEnginePyatsIntegration:
         )
         assert len(results) == 1
         assert results[0].status == ValidationStatus.PASS
+
+    async def test_batch_single_pyats_run(self) -> None:
+        from sna.validation.rules import ValidationEngine, ValidationRule
+
+        rules = [ValidationRule(tool_pattern="configure_vlan", testcase_name="config_changed")]
+        engine = ValidationEngine(rules=rules, pyats_enabled=True)
+
+        with patch(
+            "sna.validation.rules.run_pyats_batch",
+            AsyncMock(wraps=run_pyats_batch),
+        ) as batch, patch(
+            "sna.validation.pyats_adapter._check_pyats_available", return_value=True,
+        ):
+            results = await engine.run_validations_batch("configure_vlan", [
+                ("sw1", {"running_config": "old"}, {"running_config": "new"}),
+                ("sw2", {"running_config": "old"}, {"running_config": "old"}),
+            ])
+
+        assert batch.await_count == 1
+        assert results["sw1"][0].status == ValidationStatus.PASS
+        assert results["sw2"][0].status == ValidationStatus.FAIL
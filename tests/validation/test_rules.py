@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
+from unittest.mock import patch
+
 import pytest
 
 from sna.validation.rules import (
+    DEFAULT_RULES,
     ConfigChangedValidator,
     InterfaceUpValidator,
     ReachabilityValidator,
@@ -12,7 +16,7 @@ from sna.validation.rules import (
     ValidationRule,
     TESTCASE_REGISTRY,
 )
-from sna.validation.validator import ValidationStatus
+from sna.validation.validator import ValidationResult, ValidationStatus, Validator
 
 
 class TestConfigChangedValidator:
@@ -36,6 +40,32 @@ class TestConfigChangedValidator:
         )
         assert result.status == ValidationStatus.FAIL
 
+    async def test_timestamp_only_change_is_unchanged(self) -> None:
+        v = ConfigChangedValidator()
+        result = await v.validate(
+            "configure_vlan", "sw1",
+            before_state={"running_config": (
+                "Building configuration...\n\nCurrent configuration : 1024 bytes\n"
+                "! Last configuration change at 10:00:00 UTC Mon Jan 1 2026\n"
+                "hostname sw1\n"
+            )},
+            after_state={"running_config": (
+                "Building configuration...\n\nCurrent configuration : 1024 bytes\n"
+                "! Last configuration change at 10:05:00 UTC Mon Jan 1 2026\n"
+                "hostname sw1\n"
+            )},
+        )
+        assert result.status == ValidationStatus.FAIL
+
+    async def test_precomputed_hashes_compared(self) -> None:
+        v = ConfigChangedValidator()
+        result = await v.validate(
+            "configure_vlan", "sw1",
+            before_state={"running_config_hash": "abc"},
+            after_state={"running_config_hash": "def"},
+        )
+        assert result.status == ValidationStatus.PASS
+
     async def test_no_state_skips(self) -> None:
         v = ConfigChangedValidator()
         result = await v.validate("configure_vlan", "sw1", None, None)
@@ -72,6 +102,59 @@ class TestInterfaceUpValidator:
         )
         assert result.status == ValidationStatus.FAIL
 
+    async def test_up_must_be_whole_word(self) -> None:
+        v = InterfaceUpValidator()
+        result = await v.validate(
+            "set_interface_description", "sw1",
+            before_state=None,
+            after_state={"interface_status": "dot1x supplicant setup pending"},
+        )
+        assert result.status == ValidationStatus.FAIL
+
+    async def test_structured_oper_status(self) -> None:
+        v = InterfaceUpValidator()
+        up = await v.validate(
+            "set_interface_description", "sw1",
+            before_state=None,
+            after_state={"interface_status": {"oper_status": "up"}},
+        )
+        down = await v.validate(
+            "set_interface_description", "sw1",
+            before_state=None,
+            after_state={"interface_status": {"oper_status": "down"}},
+        )
+        assert up.status == ValidationStatus.PASS
+        assert down.status == ValidationStatus.FAIL
+
+    @pytest.mark.parametrize(
+        "interface_status",
+        [
+            pytest.param({"oper_status": "UP"}, id="upper-case"),
+            pytest.param({"oper_status": "up (connected)"}, id="annotated"),
+            pytest.param({"status": "up"}, id="other-key"),
+            pytest.param({"admin": "up", "oper": "up"}, id="split-keys"),
+        ],
+    )
+    async def test_structured_status_falls_back_to_search(
+        self, interface_status: dict
+    ) -> None:
+        v = InterfaceUpValidator()
+        result = await v.validate(
+            "set_interface_description", "sw1",
+            before_state=None,
+            after_state={"interface_status": interface_status},
+        )
+        assert result.status == ValidationStatus.PASS
+
+    async def test_structured_oper_status_down_with_admin_up(self) -> None:
+        v = InterfaceUpValidator()
+        result = await v.validate(
+            "set_interface_description", "sw1",
+            before_state=None,
+            after_state={"interface_status": {"oper_status": "DOWN", "admin_status": "up"}},
+        )
+        assert result.status == ValidationStatus.FAIL
+
     async def test_no_after_state(self) -> None:
         v = InterfaceUpValidator()
         result = await v.validate("set_interface_description", "sw1", None, None)
@@ -117,10 +200,24 @@ class TestTestcaseRegistry:
         assert "interface_up" in TESTCASE_REGISTRY
         assert "reachability" in TESTCASE_REGISTRY
 
+    def test_rule_and_result_names_interned(self) -> None:
+        name = "".join(["config_", "changed"])
+        rule = ValidationRule(tool_pattern="t", testcase_name=name)
+        result = ValidationResult(status=ValidationStatus.PASS, testcase_name=name)
+        assert rule.testcase_name is result.testcase_name
+        assert rule.testcase_name is next(k for k in TESTCASE_REGISTRY if k == name)
+
 
 class TestValidationEngine:
     """Validation engine orchestration."""
 
+    def test_default_rules_indexed_once(self) -> None:
+        assert isinstance(DEFAULT_RULES, tuple)
+        a, b = ValidationEngine(), ValidationEngine()
+        assert a.get_rules_for_tool("configure_bgp_neighbor") is b.get_rules_for_tool(
+            "configure_bgp_neighbor",
+        )
+
     async def test_no_rules_for_tool(self) -> None:
         engine = ValidationEngine(rules=[])
         results = await engine.run_validations("unknown_tool", "sw1", None, None)
@@ -196,3 +293,275 @@ class TestValidationEngine:
         assert len(engine.get_rules_for_tool("a")) == 2
         assert len(engine.get_rules_for_tool("b")) == 1
         assert len(engine.get_rules_for_tool("c")) == 0
+
+    def test_wildcard_tool_patterns(self) -> None:
+        rules = [
+            ValidationRule(tool_pattern="configure_*", testcase_name="config_changed"),
+            ValidationRule(tool_pattern="configure_bgp_neighbor", testcase_name="bgp_neighbor_up"),
+            ValidationRule(tool_pattern="configure_ospf_?rea", testcase_name="ospf_neighbor_full"),
+        ]
+        engine = ValidationEngine(rules=rules)
+        assert [r.testcase_name for r in engine.get_rules_for_tool("configure_bgp_neighbor")] == [
+            "config_changed", "bgp_neighbor_up",
+        ]
+        assert [r.testcase_name for r in engine.get_rules_for_tool("configure_ospf_area")] == [
+            "config_changed", "ospf_neighbor_full",
+        ]
+        assert [r.testcase_name for r in engine.get_rules_for_tool("configure_vlan")] == [
+            "config_changed",
+        ]
+        # No exact rule; both wildcards match
+        assert [r.testcase_name for r in engine.get_rules_for_tool("configure_ospf_xrea")] == [
+            "config_changed", "ospf_neighbor_full",
+        ]
+        assert engine.get_rules_for_tool("show_version") == ()
+
+    def test_duplicate_rules_collapsed(self) -> None:
+        rules = [
+            ValidationRule(tool_pattern="a", testcase_name="config_changed", required=False),
+            ValidationRule(tool_pattern="a", testcase_name="config_changed", required=True),
+            ValidationRule(tool_pattern="a", testcase_name="interface_up"),
+        ]
+        engine = ValidationEngine(rules=rules)
+        tool_rules = engine.get_rules_for_tool("a")
+        assert [r.testcase_name for r in tool_rules] == ["config_changed", "interface_up"]
+        assert tool_rules[0].required
+
+    def test_has_failures_ignores_optional_rules(self) -> None:
+        rules = [
+            ValidationRule(tool_pattern="a", testcase_name="config_changed", required=False),
+            ValidationRule(tool_pattern="a", testcase_name="interface_up"),
+        ]
+        engine = ValidationEngine(rules=rules)
+        optional_fail = ValidationResult(
+            status=ValidationStatus.FAIL, testcase_name="config_changed",
+        )
+        required_fail = ValidationResult(
+            status=ValidationStatus.FAIL, testcase_name="interface_up",
+        )
+        assert not engine.has_failures([optional_fail])
+        assert engine.has_failures([optional_fail, required_fail])
+
+
+class _SlowValidator(Validator):
+    """Records peak concurrency while sleeping briefly."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def validate(
+        self,
+        tool_name: str,
+        device_target: str,
+        before_state: dict | None,
+        after_state: dict | None,
+    ) -> ValidationResult:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return ValidationResult(status=ValidationStatus.PASS, testcase_name="slow")
+
+
+class _BrokenValidator(Validator):
+    async def validate(
+        self,
+        tool_name: str,
+        device_target: str,
+        before_state: dict | None,
+        after_state: dict | None,
+    ) -> ValidationResult:
+        raise RuntimeError("boom")
+
+
+class TestConcurrentValidation:
+    """Validators for a tool run concurrently."""
+
+    async def test_validators_run_concurrently(self) -> None:
+        slow = _SlowValidator()
+        rules = [
+            ValidationRule(tool_pattern="t", testcase_name=f"slow_{i}") for i in range(3)
+        ]
+        registry = {f"slow_{i}": slow for i in range(3)}
+        with patch.dict(TESTCASE_REGISTRY, registry):
+            results = await ValidationEngine(rules=rules).run_validations("t", "sw1", None, None)
+        assert len(results) == 3
+        assert slow.peak == 3
+
+    async def test_max_concurrency_bounds_validators(self) -> None:
+        slow = _SlowValidator()
+        rules = [
+            ValidationRule(tool_pattern="t", testcase_name=f"slow_{i}") for i in range(3)
+        ]
+        registry = {f"slow_{i}": slow for i in range(3)}
+        with patch.dict(TESTCASE_REGISTRY, registry):
+            engine = ValidationEngine(rules=rules, max_concurrency=1)
+            await engine.run_validations("t", "sw1", None, None)
+        assert slow.peak == 1
+
+    async def test_exception_becomes_error_in_rule_order(self) -> None:
+        rules = [
+            ValidationRule(tool_pattern="t", testcase_name="broken"),
+            ValidationRule(tool_pattern="t", testcase_name="nonexistent"),
+            ValidationRule(tool_pattern="t", testcase_name="reachability"),
+        ]
+        with patch.dict(TESTCASE_REGISTRY, {"broken": _BrokenValidator()}):
+            results = await ValidationEngine(rules=rules).run_validations(
+                "t", "sw1", None, {"reachable": True},
+            )
+        assert [r.testcase_name for r in results] == ["broken", "nonexistent", "reachability"]
+        assert results[0].status == ValidationStatus.ERROR
+        assert "boom" in results[0].message
+        assert results[2].status == ValidationStatus.PASS
+
+    async def test_per_engine_registry(self) -> None:
+        rules = [ValidationRule(tool_pattern="t", testcase_name="broken")]
+        engine = ValidationEngine(rules=rules, registry={"broken": _BrokenValidator()})
+        results = await engine.run_validations("t", "sw1", None, None)
+        assert results[0].status == ValidationStatus.ERROR
+        assert "broken" not in TESTCASE_REGISTRY
+
+    async def test_results_share_run_timestamp(self) -> None:
+        rules = [
+            ValidationRule(tool_pattern="t", testcase_name="reachability"),
+            ValidationRule(tool_pattern="t", testcase_name="interface_up"),
+            ValidationRule(tool_pattern="t", testcase_name="nonexistent"),
+        ]
+        results = await ValidationEngine(rules=rules).run_validations(
+            "t", "sw1", None, {"reachable": True, "interface_status": "up"},
+        )
+        assert len({r.timestamp for r in results}) == 1
+
+
+class TestBatchValidation:
+    """run_validations_batch across device targets."""
+
+    async def test_results_keyed_by_device(self) -> None:
+        rules = [ValidationRule(tool_pattern="t", testcase_name="reachability")]
+        results = await ValidationEngine(rules=rules).run_validations_batch("t", [
+            ("sw1", None, {"reachable": True}),
+            ("sw2", None, {"reachable": False}),
+        ])
+        assert results["sw1"][0].status == ValidationStatus.PASS
+        assert results["sw2"][0].status == ValidationStatus.FAIL
+        assert results["sw1"][0].timestamp == results["sw2"][0].timestamp
+
+    async def test_no_rules_returns_empty_lists(self) -> None:
+        results = await ValidationEngine(rules=[]).run_validations_batch("t", [("sw1", None, None)])
+        assert results == {"sw1": []}
+
+    async def test_shared_concurrency_limit(self) -> None:
+        slow = _SlowValidator()
+        rules = [ValidationRule(tool_pattern="t", testcase_name="slow")]
+        engine = ValidationEngine(rules=rules, max_concurrency=2, registry={"slow": slow})
+        await engine.run_validations_batch("t", [(f"sw{i}", None, None) for i in range(4)])
+        assert slow.peak == 2
+
+    async def test_duplicate_targets_rejected(self) -> None:
+        engine = ValidationEngine(rules=[])
+        with pytest.raises(ValueError, match="Duplicate"):
+            await engine.run_validations_batch("t", [("sw1", None, None), ("sw1", None, None)])
+
+
+class TestResultCache:
+    """TTL cache for identical validation calls."""
+
+    async def test_disabled_by_default(self) -> None:
+        rules = [ValidationRule(tool_pattern="t", testcase_name="reachability")]
+        engine = ValidationEngine(rules=rules)
+        first = await engine.run_validations("t", "sw1", None, {"reachable": True})
+        second = await engine.run_validations("t", "sw1", None, {"reachable": True})
+        assert second[0] is not first[0]
+        assert not engine._cache
+
+    async def test_identical_call_reuses_results(self) -> None:
+        rules = [ValidationRule(tool_pattern="t", testcase_name="reachability")]
+        engine = ValidationEngine(rules=rules, cache_ttl=2.0)
+        first = await engine.run_validations("t", "sw1", None, {"reachable": True})
+        second = await engine.run_validations("t", "sw1", None, {"reachable": True})
+        assert second == first
+        assert second[0] is first[0]
+
+    async def test_different_state_not_reused(self) -> None:
+        rules = [ValidationRule(tool_pattern="t", testcase_name="reachability")]
+        engine = ValidationEngine(rules=rules, cache_ttl=2.0)
+        await engine.run_validations("t", "sw1", None, {"reachable": True})
+        results = await engine.run_validations("t", "sw1", None, {"reachable": False})
+        assert results[0].status == ValidationStatus.FAIL
+
+    async def test_expired_entry_reruns(self) -> None:
+        rules = [ValidationRule(tool_pattern="t", testcase_name="reachability")]
+        engine = ValidationEngine(rules=rules, cache_ttl=1.0)
+        first = await engine.run_validations("t", "sw1", None, {"reachable": True})
+        # Age the entry past its TTL
+        key, (stored_at, results) = next(iter(engine._cache.items()))
+        engine._cache[key] = (stored_at - 5.0, results)
+        second = await engine.run_validations("t", "sw1", None, {"reachable": True})
+        assert second[0] is not first[0]
+
+    async def test_non_cacheable_validator_always_runs(self) -> None:
+        slow = _SlowValidator()
+        rules = [ValidationRule(tool_pattern="t", testcase_name="slow")]
+        engine = ValidationEngine(rules=rules, registry={"slow": slow}, cache_ttl=2.0)
+        first = await engine.run_validations("t", "sw1", None, None)
+        second = await engine.run_validations("t", "sw1", None, None)
+        assert second[0] is not first[0]
+
+    async def test_errors_not_cached(self) -> None:
+        rules = [ValidationRule(tool_pattern="t", testcase_name="nonexistent")]
+        engine = ValidationEngine(rules=rules, cache_ttl=2.0)
+        first = await engine.run_validations("t", "sw1", None, None)
+        second = await engine.run_validations("t", "sw1", None, None)
+        assert second[0] is not first[0]
+
+
+class _HangingValidator(Validator):
+    """Never finishes unless cancelled."""
+
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    async def validate(
+        self,
+        tool_name: str,
+        device_target: str,
+        before_state: dict | None,
+        after_state: dict | None,
+    ) -> ValidationResult:
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return ValidationResult(status=ValidationStatus.PASS, testcase_name="hang")
+
+
+class TestFailFast:
+    """Required failures cancel validators still running."""
+
+    async def test_required_failure_cancels_remaining(self) -> None:
+        hang = _HangingValidator()
+        rules = [
+            ValidationRule(tool_pattern="t", testcase_name="hang"),
+            ValidationRule(tool_pattern="t", testcase_name="reachability"),
+        ]
+        engine = ValidationEngine(
+            rules=rules, registry={"hang": hang, **TESTCASE_REGISTRY},
+        )
+        results = await asyncio.wait_for(
+            engine.run_validations("t", "sw1", None, {"reachable": False}), timeout=5,
+        )
+        assert hang.cancelled
+        assert [r.status for r in results] == [ValidationStatus.SKIP, ValidationStatus.FAIL]
+        assert engine.has_failures(results)
+
+    async def test_optional_failure_keeps_running(self) -> None:
+        rules = [
+            ValidationRule(tool_pattern="t", testcase_name="reachability", required=False),
+            ValidationRule(tool_pattern="t", testcase_name="interface_up"),
+        ]
+        results = await ValidationEngine(rules=rules).run_validations(
+            "t", "sw1", None, {"reachable": False, "interface_status": "up"},
+        )
+        assert [r.status for r in results] == [ValidationStatus.FAIL, ValidationStatus.PASS]
@@ -4,7 +4,13 @@ from __future__ import annotations
 
 import pytest
 
-from sna.validation.validator import ValidationResult, ValidationStatus, Validator
+from sna.validation.validator import (
+    ValidationResult,
+    ValidationStatus,
+    Validator,
+    shared_timestamp,
+    skip_result,
+)
 
 
 class DummyPassValidator(Validator):
@@ -53,6 +59,50 @@ class TestValidationResult:
         assert ValidationStatus.SKIP.value == "SKIP"
         assert ValidationStatus.ERROR.value == "ERROR"
 
+    def test_slotted_no_instance_dict(self) -> None:
+        r = ValidationResult(status=ValidationStatus.PASS, testcase_name="test", message="ok")
+        assert not hasattr(r, "__dict__")
+
+    def test_default_details_shared_and_read_only(self) -> None:
+        a = ValidationResult(status=ValidationStatus.PASS, testcase_name="a")
+        b = ValidationResult(status=ValidationStatus.PASS, testcase_name="b")
+        assert a.details == {}
+        assert a.details is b.details
+        with pytest.raises(TypeError):
+            a.details["x"] = 1  # type: ignore[index]
+
+
+class TestSkipResult:
+    """Cached SKIP results."""
+
+    def test_cached_within_shared_timestamp(self) -> None:
+        with shared_timestamp() as now:
+            a = skip_result("interface_up", "After state not available")
+            b = skip_result("interface_up", "After state not available")
+        assert a is b
+        assert a.status == ValidationStatus.SKIP
+        assert a.timestamp == now
+
+    def test_cache_scoped_to_run(self) -> None:
+        with shared_timestamp() as first_run:
+            a = skip_result("interface_up", "After state not available")
+        with shared_timestamp() as second_run:
+            b = skip_result("interface_up", "After state not available")
+        assert a is not b
+        assert a.timestamp == first_run
+        assert b.timestamp == second_run
+
+    def test_uncached_outside_run(self) -> None:
+        a = skip_result("interface_up", "After state not available")
+        b = skip_result("interface_up", "After state not available")
+        assert a is not b
+        assert a == ValidationResult(
+            status=ValidationStatus.SKIP,
+            testcase_name="interface_up",
+            message="After state not available",
+            timestamp=a.timestamp,
+        )
+
 
 class TestValidatorABC:
     """Validator abstract base class."""